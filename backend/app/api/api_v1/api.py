@@ -2,7 +2,7 @@
 Main API router configuration.
 """
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import transactions, accounts, future, notifications
+from app.api.api_v1.endpoints import transactions, accounts, future, notifications, export, summary, rollups, projections, calendar, cache, imports, statements, reconciliation
 
 api_router = APIRouter()
 
@@ -30,3 +30,58 @@ api_router.include_router(
     prefix="/notifications",
     tags=["notifications"]
 )
+
+api_router.include_router(
+    export.router,
+    prefix="/export",
+    tags=["export"]
+)
+
+api_router.include_router(
+    summary.router,
+    prefix="/summary",
+    tags=["summary"]
+)
+
+api_router.include_router(
+    rollups.router,
+    prefix="/rollups",
+    tags=["rollups"]
+)
+
+api_router.include_router(
+    projections.router,
+    prefix="/projections",
+    tags=["projections"]
+)
+
+
+api_router.include_router(
+    calendar.router,
+    prefix="/calendar",
+    tags=["calendar"]
+)
+
+api_router.include_router(
+    cache.router,
+    prefix="/cache",
+    tags=["cache"]
+)
+
+api_router.include_router(
+    imports.router,
+    prefix="/import",
+    tags=["import"]
+)
+
+api_router.include_router(
+    statements.router,
+    prefix="/statements",
+    tags=["statements"]
+)
+
+api_router.include_router(
+    reconciliation.router,
+    prefix="/reconciliation",
+    tags=["reconciliation"]
+)
@@ -2,50 +2,86 @@
 
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
 from decimal import Decimal
 
-from app.db.database import get_db
+from app.api.deps import get_db, get_query_filter
+from app.api.response_cache import CachedRoute, cache_response
 from app.crud import crud
+from app.crud.filters import InvalidFilterError, QueryFilter
+from app.crud.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from app.models.models import AccountsPresent, FreedomFuture
+from app.models.transaction import Transaction
 from app.schemas import schemas
 from app.core.config import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
+
+INCLUDE_DESCRIPTION = "Comma separated relationships to load: past_transactions, future_transactions"
+
+
+def _include_list(include: Optional[str]) -> List[str]:
+    """Split the include= parameter into relationship names."""
+    return [name.strip() for name in (include or "").split(",") if name.strip()]
 
 @router.get("/", response_model=List[schemas.Account])
+@cache_response(AccountsPresent.__tablename__, Transaction.__tablename__, FreedomFuture.__tablename__)
 async def get_accounts(
-    db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor instead"),
     limit: int = Query(100, ge=1, le=1000),
-    account_type: Optional[str] = None
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    account_type: Optional[str] = None,
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    query_filter: QueryFilter = Depends(
+        get_query_filter("skip", "limit", "cursor", "account_type", "include")
+    )
 ):
-    """Get list of accounts with optional type filtering.
+    """Get list of accounts with optional filtering and sorting.
+
+    Every request is paged by the requested sort, then SLNo; the cursor of
+    the following page is returned in the X-Next-Cursor header. Related
+    transactions are loaded only when named in include, with one extra
+    query per relationship for the whole page.
     
     Args:
+        response: Response used to carry the next cursor
         db: Database session
-        skip: Number of records to skip
+        skip: Legacy offset
         limit: Maximum number of records to return
+        cursor: Cursor returned with the previous page
         account_type: Optional account type filter
+        include: Relationships to load with each account
+        query_filter: Field filters such as Bank=..., Balance__lt=0, sort=-Balance
     
     Returns:
         List[schemas.Account]: List of accounts
     """
     try:
         if account_type:
-            accounts = crud.account.get_by_type(db, account_type, skip, limit)
-        else:
-            accounts = crud.account.get_all(db)
-        return accounts
+            query_filter.add_equals("Type", account_type)
+        options = crud.async_account.loader_options(_include_list(include))
+
+        page = await crud.async_account.get_page(
+            db, cursor=cursor, limit=limit, query_filter=query_filter, skip=skip, options=options
+        )
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return page.items
+    except (InvalidCursorError, InvalidFilterError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching accounts: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching accounts")
 
 @router.get("/due/{due_date}", response_model=List[schemas.Account])
-async def get_accounts_by_due_date(due_date: str, db: Session = Depends(get_db)):
+async def get_accounts_by_due_date(due_date: str, db: AsyncSession = Depends(get_db)):
     """Get accounts with specified due date.
     
     Args:
@@ -56,7 +92,7 @@ async def get_accounts_by_due_date(due_date: str, db: Session = Depends(get_db))
         List[schemas.Account]: List of accounts with specified due date
     """
     try:
-        accounts = crud.account.get_accounts_due(db, due_date)
+        accounts = await crud.async_account.get_accounts_due(db, due_date)
         return accounts
     except Exception as e:
         logger.error(f"Error fetching accounts by due date: {str(e)}")
@@ -65,12 +101,46 @@ async def get_accounts_by_due_date(due_date: str, db: Session = Depends(get_db))
             detail="Error fetching accounts by due date"
         )
 
+@router.get("/balances", response_model=List[schemas.AccountBalance])
+async def get_balances_as_of(
+    as_of: date = Query(..., description="Day to report closing balances for"),
+    acc_id: Optional[List[str]] = Query(None, description="Accounts to include; all if omitted"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get closing balances of many accounts on a given day.
+
+    Uses the daily balance checkpoints: two indexed reads per account
+    instead of replaying the transaction history.
+    
+    Args:
+        as_of: Day to report balances for
+        acc_id: Optional list of account IDs
+        db: Database session
+    
+    Returns:
+        List[schemas.AccountBalance]: Balance per account
+    """
+    try:
+        balances = await crud.async_balance_checkpoint.balances_as_of(db, as_of, acc_id)
+        return [
+            schemas.AccountBalance(AccID=cc_id, as_of=as_of, Balance=balance)
+            for cc_id, balance in balances.items()
+        ]
+    except Exception as e:
+        logger.error(f"Error fetching balances as of {as_of}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching balances")
+
 @router.get("/{sl_no}", response_model=schemas.Account)
-async def get_account(sl_no: int, db: Session = Depends(get_db)):
+async def get_account(
+    sl_no: int,
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    db: AsyncSession = Depends(get_db)
+):
     """Get account by serial number.
     
     Args:
         sl_no: Account serial number
+        include: Relationships to load with the account
         db: Database session
     
     Returns:
@@ -79,17 +149,25 @@ async def get_account(sl_no: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If account not found
     """
-    account = crud.account.get_by_sl_no(db, sl_no)
+    try:
+        account = await crud.async_account.get_by_sl_no(db, sl_no, include=_include_list(include))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
 
 @router.get("/by-ccid/{cc_id}", response_model=schemas.Account)
-async def get_account_by_cc_id(cc_id: str, db: Session = Depends(get_db)):
+async def get_account_by_cc_id(
+    cc_id: str,
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    db: AsyncSession = Depends(get_db)
+):
     """Get account by CC ID.
     
     Args:
         cc_id: Account CC ID
+        include: Relationships to load with the account
         db: Database session
     
     Returns:
@@ -98,7 +176,10 @@ async def get_account_by_cc_id(cc_id: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If account not found
     """
-    account = crud.account.get_by_cc_id(db, cc_id)
+    try:
+        account = await crud.async_account.get_by_cc_id(db, cc_id, include=_include_list(include))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
@@ -106,7 +187,7 @@ async def get_account_by_cc_id(cc_id: str, db: Session = Depends(get_db)):
 @router.post("/", response_model=schemas.Account)
 async def create_account(
     account_in: schemas.AccountCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new account.
     
@@ -119,14 +200,14 @@ async def create_account(
     """
     try:
         # Check if account with same CC ID already exists
-        existing_account = crud.account.get_by_cc_id(db, account_in.cc_id)
+        existing_account = await crud.async_account.get_by_cc_id(db, account_in.AccID)
         if existing_account:
             raise HTTPException(
                 status_code=400,
-                detail=f"Account with CC ID {account_in.cc_id} already exists"
+                detail=f"Account with CC ID {account_in.AccID} already exists"
             )
 
-        account = crud.account.create(db, obj_in=account_in)
+        account = await crud.async_account.create(db, obj_in=account_in)
         return account
     except HTTPException:
         raise
@@ -138,7 +219,7 @@ async def create_account(
 async def update_account(
     sl_no: int,
     account_in: schemas.AccountUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update an account.
     
@@ -154,11 +235,11 @@ async def update_account(
         HTTPException: If account not found
     """
     try:
-        account = crud.account.get_by_sl_no(db, sl_no)
+        account = await crud.async_account.get_by_sl_no(db, sl_no)
         if not account:
             raise HTTPException(status_code=404, detail="Account not found")
 
-        updated_account = crud.account.update(db, db_obj=account, obj_in=account_in)
+        updated_account = await crud.async_account.update(db, db_obj=account, obj_in=account_in)
         return updated_account
     except HTTPException:
         raise
@@ -166,11 +247,40 @@ async def update_account(
         logger.error(f"Error updating account: {str(e)}")
         raise HTTPException(status_code=500, detail="Error updating account")
 
+@router.get("/{cc_id}/balance", response_model=schemas.AccountBalance)
+async def get_balance_as_of(
+    cc_id: str,
+    as_of: Optional[date] = Query(None, description="Day to report the closing balance for; today if omitted"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get an account's closing balance on a given day.
+    
+    Args:
+        cc_id: Account CC ID
+        as_of: Day to report the balance for
+        db: Database session
+    
+    Returns:
+        schemas.AccountBalance: Balance on that day
+    
+    Raises:
+        HTTPException: If account not found
+    """
+    as_of = as_of or date.today()
+    try:
+        balances = await crud.async_balance_checkpoint.balances_as_of(db, as_of, [cc_id])
+    except Exception as e:
+        logger.error(f"Error fetching balance of {cc_id} as of {as_of}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching balance")
+    if cc_id not in balances:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return schemas.AccountBalance(AccID=cc_id, as_of=as_of, Balance=balances[cc_id])
+
 @router.patch("/{cc_id}/balance", response_model=schemas.Account)
 async def adjust_balance(
     cc_id: str,
     amount: Decimal,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Adjust account balance.
     
@@ -186,11 +296,11 @@ async def adjust_balance(
         HTTPException: If account not found
     """
     try:
-        account = crud.account.get_by_cc_id(db, cc_id)
+        account = await crud.async_account.get_by_cc_id(db, cc_id)
         if not account:
             raise HTTPException(status_code=404, detail="Account not found")
 
-        updated_account = crud.account.update_balance(db, cc_id=cc_id, amount=amount)
+        updated_account = await crud.async_account.update_balance(db, cc_id=cc_id, amount=amount)
         return updated_account
     except HTTPException:
         raise
@@ -199,7 +309,7 @@ async def adjust_balance(
         raise HTTPException(status_code=500, detail="Error adjusting account balance")
 
 @router.delete("/{sl_no}", response_model=schemas.Account)
-async def delete_account(sl_no: int, db: Session = Depends(get_db)):
+async def delete_account(sl_no: int, db: AsyncSession = Depends(get_db)):
     """Delete an account.
     
     Args:
@@ -213,18 +323,18 @@ async def delete_account(sl_no: int, db: Session = Depends(get_db)):
         HTTPException: If account not found or has associated transactions
     """
     try:
-        account = crud.account.get_by_sl_no(db, sl_no)
+        account = await crud.async_account.get_by_sl_no(db, sl_no)
         if not account:
             raise HTTPException(status_code=404, detail="Account not found")
 
         # Check for associated transactions
-        if account.past_transactions or account.future_transactions:
+        if await crud.async_account.has_transactions(db, account.AccID):
             raise HTTPException(
                 status_code=400,
                 detail="Cannot delete account with associated transactions"
             )
 
-        deleted_account = crud.account.remove(db, id=sl_no)
+        deleted_account = await crud.async_account.remove(db, id=sl_no)
         return deleted_account
     except HTTPException:
         raise
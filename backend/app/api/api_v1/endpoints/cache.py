@@ -0,0 +1,26 @@
+"""API endpoints for the in-process caches."""
+
+import logging
+from typing import Dict
+from fastapi import APIRouter
+
+from app.api.response_cache import CachedRoute, response_cache
+from app.core.cache import CacheStats
+from app.crud import crud
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.get("/stats", response_model=Dict[str, CacheStats])
+async def get_cache_stats():
+    """Get hit, miss and eviction counts of the in-process caches.
+
+    Returns:
+        Dict[str, CacheStats]: Counters of the response and calendar caches
+    """
+    return {
+        "responses": response_cache.stats(),
+        "calendar": crud.async_calendar.cache.stats(),
+    }
@@ -0,0 +1,47 @@
+"""API endpoints for the month calendar."""
+
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.crud import crud
+from app.schemas.calendar import CalendarMonth
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.get("/", response_model=CalendarMonth)
+async def get_calendar_month(
+    month: Optional[str] = Query(
+        None,
+        pattern=r"^[1-9]\d{3}-(0[1-9]|1[0-2])$",
+        description="Month to show as YYYY-MM; the current month if omitted"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get per-day buckets of past transactions and future predictions.
+
+    Each day carries the count and total of its transactions and the due
+    and paid future predictions with their amounts. Only days with
+    activity are returned.
+
+    Args:
+        month: Month as YYYY-MM
+        db: Database session
+
+    Returns:
+        CalendarMonth: Days of the month in date order
+    """
+    today = date.today()
+    year, month_number = (int(part) for part in month.split("-")) if month else (today.year, today.month)
+    try:
+        return await crud.async_calendar.get_month(db, year, month_number)
+    except Exception as e:
+        logger.error(f"Error building calendar for {year:04d}-{month_number:02d}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error building calendar")
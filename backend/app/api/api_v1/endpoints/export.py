@@ -0,0 +1,69 @@
+"""API endpoints for streaming table exports."""
+
+import logging
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.services.export import EXPORT_ENCODERS, MEDIA_TYPES, ExportFormat, ExportTable
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+
+def _export_response(db: AsyncSession, table: ExportTable, format: ExportFormat) -> StreamingResponse:
+    logger.info(f"Exporting {table.value} as {format.value}")
+    return StreamingResponse(
+        EXPORT_ENCODERS[format](db, table),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{table.value}.{format.value}"'
+        },
+    )
+
+@router.get("/{table}.{format}", response_class=StreamingResponse)
+async def export_table_file(
+    table: ExportTable,
+    format: ExportFormat,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """Stream a full table in the format named by its extension.
+
+    ``/export/transactions.parquet`` is the same download as
+    ``/export/transactions?format=parquet``.
+
+    Args:
+        table: Table to export
+        format: Output format, taken from the file extension
+        db: Database session
+
+    Returns:
+        StreamingResponse: Incrementally encoded table
+    """
+    return _export_response(db, table, format)
+
+@router.get("/{table}", response_class=StreamingResponse)
+async def export_table(
+    table: ExportTable,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="ndjson, csv, arrow or parquet"),
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """Stream a full table as NDJSON, CSV, Arrow IPC stream or Parquet.
+
+    Rows are read with a server-side cursor and written batch by batch, so
+    memory use does not grow with the table. Arrow and Parquet keep the
+    column types: decimals, dates and dictionary-encoded enums.
+
+    Args:
+        table: Table to export
+        format: Output format
+        db: Database session
+
+    Returns:
+        StreamingResponse: Incrementally encoded table
+    """
+    return _export_response(db, table, format)
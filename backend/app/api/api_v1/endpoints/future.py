@@ -5,19 +5,25 @@ Following Single Responsibility and Dependency Injection principles.
 import logging
 from typing import List, Optional
 from datetime import date, datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
+from app.api.response_cache import CachedRoute, cache_response
 from app.services.payment.future_payment_service import FuturePaymentService
 from app.services.notification.telegram import TelegramNotificationProvider
 from app.schemas.schemas import FuturePrediction, FutureCreate, FutureUpdate
-from app.crud.crud_future import CRUDFuture
+from app.crud.crud import async_future
+from app.crud.filters import InvalidFilterError, QueryFilter
+from app.crud.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from app.models.models import FreedomFuture
+from app.schemas.projection import ScheduleGenerationResult
+from app.services.projection import generate_schedules
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 logger = logging.getLogger(__name__)
 
 async def get_payment_service(
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     notification_provider: Optional[TelegramNotificationProvider] = Depends(
         deps.get_notification_provider,
         use_cache=True
@@ -30,25 +36,48 @@ async def get_payment_service(
     )
 
 @router.get("/predictions", response_model=List[FuturePrediction])
+@cache_response(FreedomFuture.__tablename__)
 async def get_future_predictions(
+    response: Response,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     paid_status: Optional[bool] = Query(None, description="Filter by paid status"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    query_filter: QueryFilter = Depends(deps.get_query_filter(
+        "start_date", "end_date", "paid_status", "limit", "cursor", "use_cache"
+    )),
     payment_service: FuturePaymentService = Depends(get_payment_service)
 ) -> List[FuturePrediction]:
     """
     Get future payment predictions with optional date range and paid status filters.
+
+    When limit, cursor, field filters (AccID=..., Amount__lt=...) or sort are
+    given, results are paged by the requested sort, then (Date, TrNo), and the
+    cursor of the following page is returned in the X-Next-Cursor header.
     """
     try:
-        if paid_status is False:
+        if limit or cursor or query_filter:
+            page = await async_future.get_page_by_date_range(
+                db=payment_service.db,
+                start_date=start_date,
+                end_date=end_date,
+                paid_status=paid_status,
+                cursor=cursor,
+                limit=limit or 100,
+                query_filter=query_filter
+            )
+            if page.next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+            payments = page.items
+        elif paid_status is False:
             payments = await payment_service.get_unpaid_payments(
                 start_date=start_date,
                 end_date=end_date
             )
         else:
             # Use the CRUD directly for other queries as the service focuses on unpaid payments
-            crud = CRUDFuture()
-            payments = crud.get_by_date_range(
+            payments = await async_future.get_by_date_range(
                 db=payment_service.db,
                 start_date=start_date,
                 end_date=end_date,
@@ -58,6 +87,8 @@ async def get_future_predictions(
         logger.info(f"Retrieved {len(payments)} future predictions")
         return payments
         
+    except (InvalidCursorError, InvalidFilterError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving future predictions: {str(e)}")
         raise HTTPException(
@@ -86,12 +117,11 @@ async def get_upcoming_predictions(
 @router.get("/predictions/{tr_no}", response_model=FuturePrediction)
 async def get_future_prediction(
     tr_no: int,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_db)
 ) -> FuturePrediction:
     """Get a specific future payment prediction by transaction number."""
     try:
-        crud = CRUDFuture()
-        payment = crud.get(db=db, id=tr_no)
+        payment = await async_future.get(db=db, id=tr_no)
         if not payment:
             raise HTTPException(
                 status_code=404,
@@ -111,12 +141,11 @@ async def get_future_prediction(
 @router.post("/predictions", response_model=FuturePrediction)
 async def create_future_prediction(
     prediction: FutureCreate,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_db)
 ) -> FuturePrediction:
     """Create a new future payment prediction."""
     try:
-        crud = CRUDFuture()
-        payment = crud.create(db=db, obj_in=prediction)
+        payment = await async_future.create(db=db, obj_in=prediction)
         logger.info(f"Created future prediction {payment.TrNo}")
         return payment
         
@@ -131,19 +160,18 @@ async def create_future_prediction(
 async def update_future_prediction(
     tr_no: int,
     prediction: FutureUpdate,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_db)
 ) -> FuturePrediction:
     """Update an existing future payment prediction."""
     try:
-        crud = CRUDFuture()
-        existing_payment = crud.get(db=db, id=tr_no)
+        existing_payment = await async_future.get(db=db, id=tr_no)
         if not existing_payment:
             raise HTTPException(
                 status_code=404,
                 detail=f"Future prediction {tr_no} not found"
             )
             
-        payment = crud.update(db=db, db_obj=existing_payment, obj_in=prediction)
+        payment = await async_future.update(db=db, db_obj=existing_payment, obj_in=prediction)
         logger.info(f"Updated future prediction {tr_no}")
         return payment
         
@@ -185,12 +213,11 @@ async def mark_prediction_as_paid(
 @router.delete("/predictions/{tr_no}")
 async def delete_future_prediction(
     tr_no: int,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_db)
 ) -> dict:
     """Delete a future payment prediction."""
     try:
-        crud = CRUDFuture()
-        payment = crud.remove(db=db, id=tr_no)
+        payment = await async_future.remove(db=db, id=tr_no)
         if not payment:
             raise HTTPException(
                 status_code=404,
@@ -208,3 +235,39 @@ async def delete_future_prediction(
             status_code=500,
             detail=f"Failed to delete future prediction: {str(e)}"
         )
+
+@router.post("/schedules", response_model=ScheduleGenerationResult)
+async def generate_amortization_schedules(
+    start: Optional[date] = Query(None, description="Day the schedules start from; today if omitted"),
+    acc_id: Optional[List[str]] = Query(None, description="Accounts to schedule; all EMI/HL/HLG accounts if omitted"),
+    interest_only_months: int = Query(12, ge=1, le=60, description="Months generated for accounts without a Tenure"),
+    dry_run: bool = Query(False, description="Compute the schedules without writing them"),
+    db: AsyncSession = Depends(deps.get_db)
+) -> ScheduleGenerationResult:
+    """Regenerate amortization schedules of EMI and hand-loan accounts.
+
+    Schedules are derived from Balance, IntRate, Tenure and NextDueDate and
+    replace the previously generated unpaid predictions in one transaction.
+    """
+    start = start or date.today()
+    try:
+        result = await db.run_sync(lambda session: generate_schedules(
+            session,
+            start=start,
+            acc_ids=acc_id,
+            interest_only_months=interest_only_months,
+            dry_run=dry_run,
+        ))
+    except Exception as e:
+        logger.error(f"Error generating amortization schedules: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to generate amortization schedules: {str(e)}"
+        )
+    return ScheduleGenerationResult(
+        generated=len(result.rows),
+        replaced=result.replaced,
+        skipped=result.skipped,
+        dry_run=dry_run,
+        accounts=result.accounts,
+    )
@@ -0,0 +1,58 @@
+"""API endpoints for importing the Excel workbook."""
+
+import logging
+from dataclasses import asdict
+from typing import List, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.schemas.imports import WorkbookImportSummary
+from app.services.importer import IMPORT_SHEETS, WorkbookImportError, import_workbook
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.post("/", response_model=WorkbookImportSummary)
+async def import_excel_workbook(
+    file: UploadFile = File(..., description="Kaas-sql.xlsx style workbook"),
+    sheet: Optional[List[str]] = Query(
+        None, description=f"Sheets to import (repeat for several); default: {', '.join(IMPORT_SHEETS)}"
+    ),
+    delete_missing: bool = Query(False, description="Delete table rows whose key is not in the sheet"),
+    dry_run: bool = Query(False, description="Report the changes without writing them"),
+    db: AsyncSession = Depends(get_db)
+) -> WorkbookImportSummary:
+    """Import ledger sheets of an uploaded workbook incrementally.
+
+    Rows are streamed from the workbook, coerced to the table types and
+    diffed by key, so only new and changed rows are written.
+
+    Args:
+        file: Uploaded .xlsx workbook
+        sheet: Sheets to import
+        delete_missing: Remove rows that are no longer in the sheet
+        dry_run: Count the changes only
+        db: Database session
+
+    Returns:
+        WorkbookImportSummary: Per-sheet counts and rejected rows
+    """
+    logger.info(f"Importing workbook {file.filename}")
+    try:
+        results = await db.run_sync(lambda session: import_workbook(
+            session,
+            file.file,
+            sheets=sheet,
+            delete_missing=delete_missing,
+            dry_run=dry_run,
+        ))
+    except WorkbookImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error importing workbook: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error importing workbook")
+    return WorkbookImportSummary(dry_run=dry_run, sheets=[asdict(result) for result in results])
@@ -5,13 +5,14 @@ Following Single Responsibility and Dependency Injection principles.
 import logging
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
+from app.api.response_cache import CachedRoute
 from app.services.notification.telegram import TelegramNotificationProvider
 from app.services.payment.future_payment_service import FuturePaymentService
 from app.schemas.schemas import FuturePrediction
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 logger = logging.getLogger(__name__)
 
 async def get_notification_provider() -> TelegramNotificationProvider:
@@ -35,7 +36,7 @@ async def get_notification_provider() -> TelegramNotificationProvider:
 @router.post("/send-payment-notifications", response_model=List[FuturePrediction])
 async def send_payment_notifications(
     days_ahead: int = 7,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     notification_provider: TelegramNotificationProvider = Depends(get_notification_provider)
 ) -> List[FuturePrediction]:
     """
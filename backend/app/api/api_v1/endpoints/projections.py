@@ -0,0 +1,71 @@
+"""API endpoints for cash-flow projections."""
+
+import logging
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.schemas.projection import AccountProjection, CashflowProjection
+from app.services.projection import MAX_HORIZON_MONTHS, Granularity, load_inputs, project
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+def _rounded(values) -> List[float]:
+    return [round(float(value), 2) for value in values]
+
+@router.get("/cashflow", response_model=CashflowProjection, response_model_exclude_none=True)
+async def get_cashflow_projection(
+    horizon: int = Query(12, ge=1, le=MAX_HORIZON_MONTHS, description="Months to project"),
+    granularity: Granularity = Query(Granularity.month, description="month, quarter or year"),
+    as_of: Optional[date] = Query(None, description="Day the projection starts from; today if omitted"),
+    acc_id: Optional[List[str]] = Query(None, description="Accounts to project; all if omitted"),
+    include_accounts: bool = Query(True, description="Include the per-account series"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Project account balances from unpaid futures and account schedules.
+    
+    Args:
+        horizon: Months to project (1-60)
+        granularity: Period length of the returned series
+        as_of: Day the projection starts from
+        acc_id: Optional list of account IDs
+        include_accounts: Whether to return per-account series or totals only
+        db: Database session
+    
+    Returns:
+        CashflowProjection: Totals and per-account series per period
+    """
+    as_of = as_of or date.today()
+    try:
+        inputs = await load_inputs(db, as_of, horizon, acc_id)
+        projection = project(inputs, horizon, granularity)
+    except Exception as e:
+        logger.error(f"Error projecting cash flow: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error projecting cash flow")
+
+    accounts = None
+    if include_accounts:
+        accounts = [
+            AccountProjection(
+                AccID=acc_id, Type=type_, opening_balance=round(float(opening), 2),
+                balances=_rounded(balances), flows=_rounded(flows),
+            )
+            for acc_id, type_, opening, balances, flows in zip(
+                projection.acc_ids, projection.types, projection.opening,
+                projection.balances, projection.flows
+            )
+        ]
+    return CashflowProjection(
+        as_of=as_of,
+        granularity=granularity,
+        periods=projection.periods,
+        total_balances=_rounded(projection.balances.sum(axis=0)),
+        net_flows=_rounded(projection.flows.sum(axis=0)),
+        accounts=accounts,
+    )
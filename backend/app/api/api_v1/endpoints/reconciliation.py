@@ -0,0 +1,134 @@
+"""API endpoints for reconciling bank statements with the ledger."""
+
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.models.models import PaymentMode
+from app.schemas.reconciliation import (
+    AmbiguousLine,
+    DescriptionSyncRequest,
+    DescriptionSyncSummary,
+    MatchCandidate,
+    MatchedLine,
+    ReconciliationSummary,
+)
+from app.services.reconciliation import SyncPair, SyncTarget, matched_pairs, reconcile, sync_descriptions
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.post("/", response_model=ReconciliationSummary)
+async def run_reconciliation(
+    start: date = Query(..., description="First statement date to reconcile"),
+    end: date = Query(..., description="Last statement date to reconcile"),
+    bank: Optional[PaymentMode] = Query(None, description="Only reconcile this bank account"),
+    window_days: Optional[int] = Query(None, ge=0, description="Days a transaction may be dated from its statement line"),
+    dry_run: bool = Query(False, description="Report the matches without storing them"),
+    db: AsyncSession = Depends(get_db)
+) -> ReconciliationSummary:
+    """Match staged statement lines of a date range to Transactions(Past).
+
+    Lines are only compared with transactions of the same bank and exact
+    amount inside the date window, ranked by description similarity.
+    Accepted matches are stored and left out of later runs.
+
+    Args:
+        start: First statement date
+        end: Last statement date
+        bank: Bank account to reconcile, all if omitted
+        window_days: Date window half-width
+        dry_run: Do not store the matches
+        db: Database session
+
+    Returns:
+        ReconciliationSummary: Matched, ambiguous and unmatched lines
+    """
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    logger.info(f"Reconciling statement lines from {start} to {end}")
+    try:
+        result = await db.run_sync(lambda session: reconcile(
+            session, start, end, bank=bank, window_days=window_days, persist=not dry_run
+        ))
+    except Exception as e:
+        logger.error(f"Error reconciling statements: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error reconciling statements")
+    return ReconciliationSummary(
+        start=start,
+        end=end,
+        persisted=not dry_run,
+        matched=[
+            MatchedLine(LineID=line_id, TrNo=candidate.tr_no, score=candidate.score)
+            for line_id, candidate in result.matched.items()
+        ],
+        ambiguous=[
+            AmbiguousLine(
+                LineID=line_id,
+                candidates=[MatchCandidate(TrNo=c.tr_no, score=c.score) for c in candidates],
+            )
+            for line_id, candidates in result.ambiguous.items()
+        ],
+        unmatched=result.unmatched,
+    )
+
+@router.post("/descriptions", response_model=DescriptionSyncSummary)
+async def sync_statement_descriptions(
+    request: DescriptionSyncRequest = Body(DescriptionSyncRequest()),
+    target: SyncTarget = Query(SyncTarget.transactions, description="transactions or future"),
+    start: Optional[date] = Query(None, description="With stored matches: first statement date"),
+    end: Optional[date] = Query(None, description="With stored matches: last statement date"),
+    dry_run: bool = Query(False, description="Report the diff without writing it"),
+    db: AsyncSession = Depends(get_db)
+) -> DescriptionSyncSummary:
+    """Copy statement narrations into reconciled rows in one transaction.
+
+    Without pairs in the body the stored reconciliation matches are synced
+    into Transactions(Past). All changed rows are written by one bulk
+    UPDATE per column set and committed together.
+
+    Args:
+        request: (LineID, TrNo) pairs, with optional new Comments
+        target: Table the TrNos belong to
+        start: First statement date of the stored matches
+        end: Last statement date of the stored matches
+        dry_run: Do not write the changes
+        db: Database session
+
+    Returns:
+        DescriptionSyncSummary: Counts and the column-level diff
+    """
+    if request.pairs is None and target is not SyncTarget.transactions:
+        raise HTTPException(status_code=400, detail="Stored matches only pair lines with transactions; pass pairs")
+    pairs = None if request.pairs is None else [
+        SyncPair(line_id=pair.LineID, tr_no=pair.TrNo, comments=pair.Comments) for pair in request.pairs
+    ]
+    logger.info(f"Syncing statement descriptions into {target.value}")
+    try:
+        result = await db.run_sync(lambda session: sync_descriptions(
+            session,
+            pairs if pairs is not None else matched_pairs(session, start, end),
+            target=target,
+            dry_run=dry_run,
+        ))
+    except Exception as e:
+        logger.error(f"Error syncing descriptions: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error syncing descriptions")
+    return DescriptionSyncSummary(
+        target=target.value,
+        dry_run=dry_run,
+        pairs=result.pairs,
+        updated=result.updated,
+        unchanged=result.unchanged,
+        changes=[
+            {"TrNo": c.tr_no, "LineID": c.line_id, "column": c.column, "old": c.old, "new": c.new}
+            for c in result.changes
+        ],
+        errors=result.errors,
+    )
@@ -0,0 +1,61 @@
+"""API endpoints for monthly transaction rollups."""
+
+import logging
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db, get_query_filter
+from app.api.response_cache import CachedRoute, cache_response
+from app.crud import crud
+from app.crud.crud_rollup import DIMENSIONS
+from app.crud.filters import InvalidFilterError, QueryFilter
+from app.models.models import MonthlyRollup
+from app.schemas.rollup import MonthlyRollupRow
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.get("/", response_model=List[MonthlyRollupRow], response_model_exclude_none=True)
+@cache_response(MonthlyRollup.__tablename__)
+async def get_rollups(
+    group_by: Optional[str] = Query(
+        None,
+        description="Comma separated dimensions to keep (AccID, Category, Department, PaymentMode); all if omitted"
+    ),
+    query_filter: QueryFilter = Depends(get_query_filter("group_by")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get monthly transaction totals from the rollup tables.
+
+    Supports ``YearMonth__gte=2024-07`` style month ranges and equality
+    filters on the dimensions, e.g. ``Department=Serendipity``. Reads the
+    pre-aggregated rollups instead of scanning Transactions(Past).
+    
+    Args:
+        group_by: Dimensions to group by besides YearMonth
+        query_filter: Parsed filter and sort query parameters
+        db: Database session
+    
+    Returns:
+        List[MonthlyRollupRow]: Sum, count, min and max per group
+    """
+    dimensions = DIMENSIONS if group_by is None else tuple(
+        name.strip() for name in group_by.split(",") if name.strip()
+    )
+    unknown = [name for name in dimensions if name not in DIMENSIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot group by {', '.join(unknown)}; allowed: {', '.join(DIMENSIONS)}"
+        )
+
+    try:
+        return await crud.async_monthly_rollup.query(db, query_filter=query_filter, group_by=dimensions)
+    except InvalidFilterError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching monthly rollups: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching monthly rollups")
@@ -0,0 +1,54 @@
+"""API endpoints for ingesting bank statements."""
+
+import logging
+from dataclasses import asdict
+from typing import List, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.models.models import PaymentMode
+from app.schemas.statements import StatementIngestSummary
+from app.services.statements import STATEMENT_BANKS, ingest_statements_async
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.post("/", response_model=StatementIngestSummary)
+async def upload_statements(
+    files: List[UploadFile] = File(..., description="CSV, XLSX or XLS statement exports"),
+    bank: Optional[PaymentMode] = Query(
+        None, description="Bank account of every file; inferred from each file name if omitted"
+    ),
+    db: AsyncSession = Depends(get_db)
+) -> StatementIngestSummary:
+    """Stage the lines of uploaded bank statements for reconciliation.
+
+    Files are parsed in parallel on a worker pool, without blocking other
+    requests, and each is committed as soon as it is parsed; lines already
+    staged by an earlier upload are skipped.
+
+    Args:
+        files: Statement files
+        bank: Bank account the statements belong to
+        db: Database session
+
+    Returns:
+        StatementIngestSummary: Per-file counts and errors
+    """
+    if bank is not None and bank not in STATEMENT_BANKS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{bank.name} has no statement format; allowed: {', '.join(mode.name for mode in STATEMENT_BANKS)}"
+        )
+    logger.info(f"Ingesting {len(files)} statement files")
+    uploads = [(file.filename, await file.read()) for file in files]
+    try:
+        results = await ingest_statements_async(db, uploads, bank=bank)
+    except Exception as e:
+        logger.error(f"Error ingesting statements: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error ingesting statements")
+    return StatementIngestSummary(files=[asdict(result) for result in results])
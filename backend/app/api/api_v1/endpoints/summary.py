@@ -0,0 +1,44 @@
+"""API endpoints for role dashboard summaries."""
+
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.api.response_cache import CachedRoute
+from app.crud import crud
+from app.schemas.summary import DashboardSummary, SummaryRole
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.get("/{role}", response_model=DashboardSummary, response_model_exclude_none=True)
+async def get_dashboard_summary(
+    role: SummaryRole,
+    as_of: Optional[date] = Query(None, description="Day the dashboard is viewed on; today if omitted"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the aggregates for a role dashboard.
+
+    Totals by account Type, expenses by Category/Department and outstanding
+    unpaid futures are computed with GROUP BY queries, so the dashboard no
+    longer downloads every row to reduce them in the browser.
+    
+    Args:
+        role: ca, budget-analyst or owner
+        as_of: Day the dashboard is viewed on
+        db: Database session
+    
+    Returns:
+        DashboardSummary: Aggregates shown by the role's dashboard
+    """
+    as_of = as_of or date.today()
+    try:
+        return await crud.async_summary.dashboard(db, role, as_of)
+    except Exception as e:
+        logger.error(f"Error building {role.value} summary: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error building dashboard summary")
@@ -1,42 +1,81 @@
 """API endpoints for transactions."""
 
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
-from app.db.database import get_db
+from app.api.deps import get_db, get_query_filter
+from app.api.fast_json import rows_response
+from app.api.response_cache import CachedRoute, cache_response
 from app.crud import crud
-from app.schemas.transaction import Transaction, TransactionCreate, TransactionUpdate
+from app.crud.filters import InvalidFilterError, QueryFilter
+from app.crud.fingerprint import is_fingerprint_conflict, transaction_fingerprint
+from app.crud.ledger import BalanceLedger
+from app.crud.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from app.models.models import TransactionsPast
+from app.schemas.transaction import Transaction, TransactionBulkResult, TransactionCreate, TransactionUpdate
 from app.core.config import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
+
+
+async def _duplicate_error(db: AsyncSession, fingerprint: str) -> HTTPException:
+    """409 naming the transaction whose insert won a race for a fingerprint."""
+    duplicate = await crud.async_transaction.get_by_fingerprint(db, fingerprint)
+    detail = f"Duplicate of transaction {duplicate.TrNo}" if duplicate else "Duplicate transaction"
+    return HTTPException(status_code=409, detail=detail)
+
 
 @router.get("/", response_model=List[Transaction])
+@cache_response(TransactionsPast.__tablename__)
 async def get_transactions(
-    db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor instead"),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     category: Optional[str] = None,
-    department: Optional[str] = None
+    department: Optional[str] = None,
+    query_filter: QueryFilter = Depends(
+        get_query_filter("skip", "limit", "cursor", "category", "department")
+    )
 ):
-    """Get list of transactions with optional filtering."""
+    """Get a page of transactions with optional filtering and sorting.
+
+    Pages are ordered by the requested sort, then (Date, TrNo); the cursor of
+    the following page is returned in the X-Next-Cursor header. Rows are read
+    through Core and encoded by the orjson fast path.
+
+    Args:
+        db: Database session
+        skip: Legacy offset
+        limit: Maximum number of records to return
+        cursor: Cursor returned with the previous page
+        category: Optional category filter
+        department: Optional department filter
+        query_filter: Field filters such as AccID=..., Date__gte=..., sort=-Amount
+
+    Returns:
+        List[Transaction]: Transactions on this page
+    """
     try:
-        transactions = crud.transaction.get_all(db, skip=skip, limit=limit)
-        
-        # Filter by category if provided
         if category:
-            transactions = [t for t in transactions if t.Category == category]
-            
-        # Filter by department if provided    
+            query_filter.add_equals("Category", category)
         if department:
-            transactions = [t for t in transactions if t.Department == department]
-            
-        return transactions
+            query_filter.add_equals("Department", department)
+
+        page = await crud.async_transaction.get_row_page(
+            db, cursor=cursor, limit=limit, query_filter=query_filter, skip=skip
+        )
+        headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+        return rows_response(page.items, Transaction, headers=headers)
+    except (InvalidCursorError, InvalidFilterError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching transactions: {str(e)}")
         raise HTTPException(
@@ -48,7 +87,7 @@ async def get_transactions(
 async def get_transactions_by_date_range(
     start_date: date,
     end_date: date,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get transactions within a date range.
     
@@ -61,7 +100,7 @@ async def get_transactions_by_date_range(
         List[Transaction]: List of transactions
     """
     try:
-        transactions = crud.transaction.get_by_date_range(db, start_date, end_date)
+        transactions = await crud.async_transaction.get_by_date_range(db, start_date, end_date)
         return transactions
     except Exception as e:
         logger.error(f"Error fetching transactions by date range: {str(e)}")
@@ -71,7 +110,7 @@ async def get_transactions_by_date_range(
         )
 
 @router.get("/{sl_no}", response_model=Transaction)
-async def get_transaction(sl_no: int, db: Session = Depends(get_db)):
+async def get_transaction(sl_no: int, db: AsyncSession = Depends(get_db)):
     """Get transaction by serial number.
     
     Args:
@@ -84,7 +123,7 @@ async def get_transaction(sl_no: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If transaction not found
     """
-    transaction = crud.transaction.get_by_sl_no(db, sl_no)
+    transaction = await crud.async_transaction.get_by_sl_no(db, sl_no)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
@@ -92,7 +131,7 @@ async def get_transaction(sl_no: int, db: Session = Depends(get_db)):
 @router.post("/", response_model=Transaction)
 async def create_transaction(
     transaction_in: TransactionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new transaction.
     
@@ -105,33 +144,74 @@ async def create_transaction(
     """
     try:
         # Verify account exists
-        account = crud.account.get_by_cc_id(db, transaction_in.acc_id)
+        account = await crud.async_account.get_by_cc_id(db, transaction_in.AccID)
         if not account:
             raise HTTPException(
                 status_code=404,
-                detail=f"Account with ID {transaction_in.acc_id} not found"
+                detail=f"Account with ID {transaction_in.AccID} not found"
             )
 
-        # Create transaction
-        transaction = crud.transaction.create(db, obj_in=transaction_in)
+        fingerprint = transaction_fingerprint(
+            transaction_in.Date, transaction_in.Amount, transaction_in.AccID,
+            transaction_in.PaymentMode, transaction_in.Description
+        )
+        duplicate = await crud.async_transaction.get_by_fingerprint(db, fingerprint)
+        if duplicate:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Duplicate of transaction {duplicate.TrNo}"
+            )
 
-        # Update account balance
-        crud.account.update_balance(
-            db, cc_id=transaction_in.acc_id, amount=transaction_in.amount
+        # Create transaction and update account balance in one commit
+        ledger = BalanceLedger()
+        ledger.add(transaction_in.AccID, transaction_in.Amount, on=transaction_in.Date)
+        transaction = await crud.async_transaction.create(
+            db, obj_in=transaction_in, ledger=ledger
         )
 
         return transaction
     except HTTPException:
         raise
+    except IntegrityError as e:
+        # A concurrent request inserted the same content after the check above
+        await db.rollback()
+        if is_fingerprint_conflict(e):
+            raise await _duplicate_error(db, fingerprint)
+        logger.error(f"Error creating transaction: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error creating transaction")
     except Exception as e:
         logger.error(f"Error creating transaction: {str(e)}")
         raise HTTPException(status_code=500, detail="Error creating transaction")
 
+@router.post("/bulk", response_model=TransactionBulkResult)
+async def create_transactions_bulk(
+    rows: List[Dict[str, Any]] = Body(..., min_length=1),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many transactions in a single database transaction.
+
+    Each row is validated on its own; rows that fail validation or reference
+    an unknown account are reported and skipped, the rest are inserted
+    together and every account balance is adjusted once by its net amount.
+    
+    Args:
+        rows: Transaction objects, same fields as POST /transactions/
+        db: Database session
+    
+    Returns:
+        TransactionBulkResult: Counts, net balance changes and per-row results
+    """
+    try:
+        return await crud.async_transaction.create_many(db, rows=rows)
+    except Exception as e:
+        logger.error(f"Error creating transactions in bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error creating transactions in bulk")
+
 @router.put("/{sl_no}", response_model=Transaction)
 async def update_transaction(
     sl_no: int,
     transaction_in: TransactionUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a transaction.
     
@@ -147,43 +227,58 @@ async def update_transaction(
         HTTPException: If transaction not found
     """
     try:
-        transaction = crud.transaction.get_by_sl_no(db, sl_no)
+        transaction = await crud.async_transaction.get_by_sl_no(db, sl_no)
         if not transaction:
             raise HTTPException(status_code=404, detail="Transaction not found")
 
         # If account ID is being updated, verify new account exists
-        if transaction_in.acc_id and transaction_in.acc_id != transaction.acc_id:
-            account = crud.account.get_by_cc_id(db, transaction_in.acc_id)
+        if transaction_in.AccID and transaction_in.AccID != transaction.AccID:
+            account = await crud.async_account.get_by_cc_id(db, transaction_in.AccID)
             if not account:
                 raise HTTPException(
                     status_code=404,
-                    detail=f"Account with ID {transaction_in.acc_id} not found"
+                    detail=f"Account with ID {transaction_in.AccID} not found"
                 )
 
-        # If amount is being updated, adjust account balances
-        if transaction_in.amount and transaction_in.amount != transaction.amount:
-            # Reverse old transaction
-            crud.account.update_balance(
-                db, cc_id=transaction.acc_id, amount=-transaction.amount
-            )
-            # Apply new transaction
-            crud.account.update_balance(
-                db, cc_id=transaction_in.acc_id or transaction.acc_id,
-                amount=transaction_in.amount
+        # If amount, account or date is being updated, reverse the old
+        # transaction and apply the new one (coalesced per account and day)
+        new_amount = transaction_in.Amount if transaction_in.Amount is not None else transaction.Amount
+        new_acc_id = transaction_in.AccID or transaction.AccID
+        new_date = transaction_in.Date or transaction.Date
+        fingerprint = transaction_fingerprint(
+            new_date, new_amount, new_acc_id,
+            transaction_in.PaymentMode or transaction.PaymentMode,
+            transaction_in.Description if transaction_in.Description is not None else transaction.Description
+        )
+        duplicate = await crud.async_transaction.get_by_fingerprint(db, fingerprint)
+        if duplicate and duplicate.TrNo != transaction.TrNo:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Duplicate of transaction {duplicate.TrNo}"
             )
+        ledger = BalanceLedger()
+        if (new_amount, new_acc_id, new_date) != (transaction.Amount, transaction.AccID, transaction.Date):
+            ledger.add(transaction.AccID, -transaction.Amount, on=transaction.Date)
+            ledger.add(new_acc_id, new_amount, on=new_date)
 
-        updated_transaction = crud.transaction.update(
-            db, db_obj=transaction, obj_in=transaction_in
+        updated_transaction = await crud.async_transaction.update(
+            db, db_obj=transaction, obj_in=transaction_in, ledger=ledger
         )
         return updated_transaction
     except HTTPException:
         raise
+    except IntegrityError as e:
+        await db.rollback()
+        if is_fingerprint_conflict(e):
+            raise await _duplicate_error(db, fingerprint)
+        logger.error(f"Error updating transaction: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error updating transaction")
     except Exception as e:
         logger.error(f"Error updating transaction: {str(e)}")
         raise HTTPException(status_code=500, detail="Error updating transaction")
 
 @router.delete("/{sl_no}", response_model=Transaction)
-async def delete_transaction(sl_no: int, db: Session = Depends(get_db)):
+async def delete_transaction(sl_no: int, db: AsyncSession = Depends(get_db)):
     """Delete a transaction.
     
     Args:
@@ -197,16 +292,14 @@ async def delete_transaction(sl_no: int, db: Session = Depends(get_db)):
         HTTPException: If transaction not found
     """
     try:
-        transaction = crud.transaction.get_by_sl_no(db, sl_no)
+        transaction = await crud.async_transaction.get_by_sl_no(db, sl_no)
         if not transaction:
             raise HTTPException(status_code=404, detail="Transaction not found")
 
-        # Reverse the transaction amount from account balance
-        crud.account.update_balance(
-            db, cc_id=transaction.acc_id, amount=-transaction.amount
-        )
-
-        deleted_transaction = crud.transaction.remove(db, id=sl_no)
+        # Reverse the transaction amount from account balance in the same commit
+        ledger = BalanceLedger()
+        ledger.add(transaction.AccID, -transaction.Amount, on=transaction.Date)
+        deleted_transaction = await crud.async_transaction.remove(db, id=sl_no, ledger=ledger)
         return deleted_transaction
     except HTTPException:
         raise
@@ -3,24 +3,49 @@ Dependencies module for FastAPI application.
 Following Dependency Injection and Single Responsibility principles.
 """
 import logging
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from typing import AsyncGenerator, Callable, Optional
+from fastapi import Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud.filters import InvalidFilterError, QueryFilter, parse_query_params
+from app.db.session import AsyncSessionLocal
 from app.services.notification.telegram import TelegramNotificationProvider
 
 logger = logging.getLogger(__name__)
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Database session dependency.
-    Creates a new database session for each request and ensures proper cleanup.
+    Creates a new async database session for each request and ensures proper cleanup,
+    so queries await aiosqlite instead of blocking the event loop.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+def get_query_filter(*reserved: str) -> Callable[..., QueryFilter]:
+    """
+    List filter dependency factory.
+    Parses ``Field=value``, ``Field__in=a,b``, ``Field__gte=value`` style query
+    parameters and a ``sort=-Date,TrNo`` order; the CRUD whitelists the fields.
+
+    Args:
+        reserved: Query parameter names the endpoint handles itself
+    """
+    def dependency(
+        request: Request,
+        sort: Optional[str] = Query(
+            None, description="Comma separated sort fields, prefix with - for descending"
+        )
+    ) -> QueryFilter:
+        try:
+            return parse_query_params(request.query_params.multi_items(), sort, reserved)
+        except InvalidFilterError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return dependency
 
 async def get_notification_provider(
     use_cache: bool = False
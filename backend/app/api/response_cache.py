@@ -0,0 +1,191 @@
+"""
+Write-invalidated cache and conditional GET support for API routes.
+Rendered GET responses are kept per path and normalized query string until
+one of the tables they were read from is bumped by a CRUD write, and every
+successful GET carries a strong ETag that If-None-Match can revalidate.
+"""
+import hashlib
+import logging
+import secrets
+import time
+from typing import Callable, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.cache import VersionedCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_TABLES_ATTR = "__cache_tables__"
+CACHE_STATUS_HEADER = "X-Cache"
+
+# Table versions restart at zero with the process, so version ETags are
+# salted per process to never match a tag issued before a restart
+_ETAG_SALT = secrets.token_hex(8)
+
+response_cache = VersionedCache(
+    maxsize=settings.RESPONSE_CACHE_SIZE,
+    ttl=settings.RESPONSE_CACHE_TTL,
+)
+
+
+def cache_response(*tables: str) -> Callable:
+    """
+    Mark a GET endpoint of a CachedRoute router as cacheable.
+
+    Args:
+        tables: Tables the endpoint reads; a write to any of them invalidates it
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        setattr(endpoint, CACHE_TABLES_ATTR, tables)
+        return endpoint
+
+    return decorator
+
+
+def cache_key(request: Request) -> Hashable:
+    """
+    Build the cache key of a request.
+
+    Query parameters are sorted and blank values dropped, so ``?b=1&a=2``
+    and ``?a=2&b=1&c=`` share an entry.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Tuple of the path and the normalized query parameters
+    """
+    query = tuple(sorted(
+        (key, value) for key, value in request.query_params.multi_items() if value != ""
+    ))
+    return request.url.path, query
+
+
+def version_etag(key: Hashable, versions: Tuple[int, ...]) -> str:
+    """
+    Build the ETag of a versioned route from its cache key and table versions.
+
+    Tags also roll over every RESPONSE_CACHE_TTL seconds, bounding how long
+    a write made outside this process can be answered with 304.
+
+    Args:
+        key: Result of cache_key for the request
+        versions: Versions of the tables the route reads
+
+    Returns:
+        str: Quoted strong ETag
+    """
+    ttl = settings.RESPONSE_CACHE_TTL
+    window = int(time.time() // ttl) if ttl else 0
+    digest = hashlib.blake2b(repr((_ETAG_SALT, window, key, versions)).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Build the ETag of a rendered response from its bytes.
+
+    Args:
+        body: Response body
+
+    Returns:
+        str: Quoted strong ETag
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Args:
+        if_none_match: Header value, a comma separated list of tags or *
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+class CachedRoute(APIRoute):
+    """
+    Route class adding response caching and conditional GETs.
+
+    Endpoints marked with cache_response get an ETag derived from the
+    versions of their tables, so a matching If-None-Match is answered with
+    304 before dependencies run or the database is queried; otherwise the
+    rendered response is served from memory while the versions hold. The
+    X-Cache header reports HIT or MISS.
+
+    Other GET endpoints get an ETag hashed from the rendered body, which
+    for detail routes is a hash of the affected row; a match still runs the
+    handler but sends 304 instead of the body.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        tables: Tuple[str, ...] = getattr(self.endpoint, CACHE_TABLES_ATTR, ())
+
+        async def versioned_handler(request: Request) -> Response:
+            key = cache_key(request)
+            versions = response_cache.versions(tables)
+            etag = version_etag(key, versions)
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return not_modified(etag)
+
+            cached = response_cache.get(key) if settings.RESPONSE_CACHE_TTL else None
+            if cached is not None:
+                status_code, raw_headers, body = cached
+                response = Response(content=body, status_code=status_code)
+                response.raw_headers = list(raw_headers)
+                response.headers[CACHE_STATUS_HEADER] = "HIT"
+            else:
+                response = await handler(request)
+                if response.status_code != 200:
+                    return response
+                body = getattr(response, "body", None)
+                if body is not None and settings.RESPONSE_CACHE_TTL:
+                    response_cache.put(
+                        key, (response.status_code, tuple(response.raw_headers), body), versions, tables
+                    )
+                response.headers[CACHE_STATUS_HEADER] = "MISS"
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        async def hashed_handler(request: Request) -> Response:
+            response = await handler(request)
+            body = getattr(response, "body", None)
+            if response.status_code != 200 or body is None:
+                return response
+            etag = body_etag(body)
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return not_modified(etag)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        async def route_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+            if tables:
+                return await versioned_handler(request)
+            return await hashed_handler(request)
+
+        return route_handler
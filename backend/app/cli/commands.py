@@ -3,21 +3,38 @@ CLI commands module providing command-line interfaces to core functionality.
 Following Single Responsibility and Dependency Injection principles.
 """
 import asyncio
+import json
 import logging
+import time
 import typer
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.api.fast_json import encode_rows, list_adapter
+from app.db.indexes import check_indexes
+from app.crud.crud_checkpoint import balance_checkpoint
+from app.crud.crud_rollup import monthly_rollup
+from app.db.session import AsyncSessionLocal, SessionLocal, engine
+from app.models.models import PaymentMode
+from app.models.transaction import Transaction
+from app.schemas.transaction import Transaction as TransactionSchema
+from app.services.export import EXPORT_ENCODERS, ExportFormat, ExportTable
+from app.services.importer import import_workbook, match_zoho_export
+from app.services.reconciliation import matched_pairs, reconcile, sync_descriptions
+from app.services.statements import ingest_statements
+from app.services.projection import generate_schedules
 from app.services.notification.telegram import TelegramNotificationProvider
 from app.services.payment.future_payment_service import FuturePaymentService
 
 app = typer.Typer()
 logger = logging.getLogger(__name__)
 
-def get_db() -> Session:
-    """Get database session."""
-    return SessionLocal()
+def get_db() -> AsyncSession:
+    """Get async database session."""
+    return AsyncSessionLocal()
 
 @app.command()
 def authorize_telegram(
@@ -89,7 +106,7 @@ def check_future_payments(
         except Exception as e:
             typer.echo(f"Error checking payments: {str(e)}", err=True)
         finally:
-            db.close()
+            await db.close()
             if notification_provider:
                 await notification_provider.disconnect()
     
@@ -138,7 +155,7 @@ def update_monthly_payments(
         except Exception as e:
             typer.echo(f"Error updating payments: {str(e)}", err=True)
         finally:
-            db.close()
+            await db.close()
     
     asyncio.run(_update_payments())
 
@@ -159,5 +176,282 @@ def verify_notification_service():
     
     asyncio.run(_verify())
 
+@app.command()
+def check_db_indexes():
+    """Create missing indexes and report which hot queries they cover."""
+    try:
+        plans = check_indexes(engine)
+        for plan in plans:
+            status = "covered" if plan.covered else "NOT covered"
+            typer.echo(f"{plan.name}: {status}")
+            for detail in plan.details:
+                typer.echo(f"    {detail}")
+    except Exception as e:
+        typer.echo(f"Error checking indexes: {str(e)}", err=True)
+
+@app.command()
+def rebuild_balance_checkpoints():
+    """Recompute the daily balance checkpoints from Transactions(Past)."""
+    db = SessionLocal()
+    try:
+        count = balance_checkpoint.rebuild(db)
+        typer.echo(f"Rebuilt {count} balance checkpoints")
+    except Exception as e:
+        typer.echo(f"Error rebuilding balance checkpoints: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command()
+def rebuild_monthly_rollups():
+    """Recompute the monthly rollups from Transactions(Past)."""
+    db = SessionLocal()
+    try:
+        count = monthly_rollup.rebuild(db)
+        typer.echo(f"Rebuilt {count} monthly rollups")
+    except Exception as e:
+        typer.echo(f"Error rebuilding monthly rollups: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command()
+def generate_amortization_schedules(
+    acc_id: Optional[List[str]] = typer.Option(None, help="Account to schedule; repeat for several"),
+    interest_only_months: int = typer.Option(12, help="Months generated for accounts without a Tenure"),
+    dry_run: bool = typer.Option(False, help="Print the schedules without writing them")
+):
+    """Regenerate EMI/HL/HLG amortization schedules in Freedom(Future)."""
+    db = SessionLocal()
+    try:
+        result = generate_schedules(
+            db,
+            start=datetime.now().date(),
+            acc_ids=acc_id or None,
+            interest_only_months=interest_only_months,
+            dry_run=dry_run,
+        )
+        for account in result.accounts:
+            typer.echo(
+                f"{account['AccID']}: {account['installments']} x {account['installment']:.2f} "
+                f"({account['first_due']} - {account['last_due']}), interest {account['total_interest']:.2f}"
+            )
+        action = "Would write" if dry_run else "Wrote"
+        typer.echo(
+            f"{action} {len(result.rows)} rows (replaced {result.replaced}, skipped {result.skipped})"
+        )
+    except Exception as e:
+        typer.echo(f"Error generating amortization schedules: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command()
+def benchmark_serialization(
+    rows: int = typer.Option(100_000, help="Transactions(Past) rows to serialize"),
+    repeat: int = typer.Option(3, help="Runs per path; the fastest is reported")
+):
+    """Time the response_model and orjson list serialization paths on synthetic rows."""
+    bench_engine = create_engine("sqlite://")
+    Transaction.__table__.create(bench_engine)
+    start = datetime(2020, 1, 1)
+    categories = ["Salary", "Hand_Loans", "Rent", "Groceries", "EMI"]
+    with bench_engine.begin() as conn:
+        conn.execute(insert(Transaction), [
+            {
+                "TrNo": i + 1,
+                "Date": start + timedelta(minutes=i),
+                "Description": f"Transaction {i}",
+                "Amount": round((i % 5000) * 1.37 - 2500, 2),
+                "PaymentMode": "UPI",
+                "AccID": f"BNK - {i % 20:03d}",
+                "Department": "Serendipity",
+                "Comments": None,
+                "Category": categories[i % len(categories)],
+                "ZohoMatch": "false",
+            }
+            for i in range(rows)
+        ])
+
+    def legacy() -> bytes:
+        with Session(bench_engine) as db:
+            records = db.scalars(select(Transaction)).all()
+            models = list_adapter(TransactionSchema).validate_python(records, from_attributes=True)
+            return json.dumps(jsonable_encoder(models)).encode()
+
+    def fast(validate: bool) -> bytes:
+        with bench_engine.connect() as conn:
+            return encode_rows(conn.execute(select(*Transaction.__table__.c)).all(), TransactionSchema, validate)
+
+    paths = [
+        ("response_model + jsonable_encoder", legacy),
+        ("orjson, trusted rows", lambda: fast(False)),
+        ("orjson, validated rows", lambda: fast(True)),
+    ]
+    baseline = None
+    for name, run in paths:
+        timings = []
+        for _ in range(max(repeat, 1)):
+            began = time.perf_counter()
+            body = run()
+            timings.append(time.perf_counter() - began)
+        best = min(timings)
+        baseline = baseline or best
+        typer.echo(f"{name}: {best:.3f}s, {len(body) / 1e6:.1f} MB ({baseline / best:.1f}x)")
+    bench_engine.dispose()
+
+@app.command()
+def export_table(
+    table: ExportTable = typer.Argument(..., help="Table to export"),
+    format: ExportFormat = typer.Option(ExportFormat.parquet, help="Output format"),
+    output: Optional[str] = typer.Option(None, help="File to write; defaults to <table>.<format>")
+):
+    """Write a full table to a file, streamed batch by batch like /export."""
+    path = output or f"{table.value}.{format.value}"
+
+    async def _export():
+        async with get_db() as db:
+            with open(path, "wb") as file:
+                async for chunk in EXPORT_ENCODERS[format](db, table):
+                    file.write(chunk)
+
+    try:
+        asyncio.run(_export())
+        typer.echo(f"Exported {table.value} to {path}")
+    except Exception as e:
+        typer.echo(f"Error exporting {table.value}: {str(e)}", err=True)
+
+@app.command()
+def import_excel(
+    path: str = typer.Argument("Kaas-sql.xlsx", help="Workbook to import"),
+    sheet: Optional[List[str]] = typer.Option(None, help="Sheet to import; repeat for several"),
+    delete_missing: bool = typer.Option(False, help="Delete table rows whose key is not in the sheet"),
+    dry_run: bool = typer.Option(False, help="Report the changes without writing them")
+):
+    """Import Accounts(Present), Freedom(Future) and Transactions(Past) incrementally."""
+    db = SessionLocal()
+    try:
+        results = import_workbook(
+            db, path, sheets=sheet or None, delete_missing=delete_missing, dry_run=dry_run
+        )
+        for result in results:
+            typer.echo(
+                f"{result.sheet}: {result.inserted} inserted, {result.updated} updated, "
+                f"{result.unchanged} unchanged, {result.deleted} deleted, {len(result.errors)} rejected"
+            )
+            for error in result.errors:
+                typer.echo(f"    row {error.row}: {error.error}", err=True)
+        if dry_run:
+            typer.echo("Dry run: nothing was written")
+    except Exception as e:
+        typer.echo(f"Error importing {path}: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command("ingest-statements")
+def ingest_statement_files(
+    paths: List[str] = typer.Argument(..., help="Statement files (CSV, XLSX or XLS)"),
+    bank: Optional[PaymentMode] = typer.Option(None, help="Bank account of every file; inferred from file names if omitted"),
+    workers: Optional[int] = typer.Option(None, help="Parser processes; defaults to STATEMENT_PARSE_WORKERS")
+):
+    """Stage bank statement lines in BankStatementLines for reconciliation."""
+    db = SessionLocal()
+    try:
+        files = []
+        for path in paths:
+            with open(path, "rb") as file:
+                files.append((path, file.read()))
+        for result in ingest_statements(db, files, bank=bank, workers=workers):
+            if result.error:
+                typer.echo(f"{result.file}: {result.error}", err=True)
+                continue
+            typer.echo(
+                f"{result.file} ({result.bank.name}): {result.inserted} staged, "
+                f"{result.duplicates} already staged, {result.skipped} rows skipped"
+            )
+    except Exception as e:
+        typer.echo(f"Error ingesting statements: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command("reconcile")
+def reconcile_statements(
+    start: datetime = typer.Option(..., formats=["%Y-%m-%d"], help="First statement date"),
+    end: datetime = typer.Option(..., formats=["%Y-%m-%d"], help="Last statement date"),
+    bank: Optional[PaymentMode] = typer.Option(None, help="Only reconcile this bank account"),
+    window_days: Optional[int] = typer.Option(None, help="Days a transaction may be dated from its statement line"),
+    dry_run: bool = typer.Option(False, help="Report the matches without storing them")
+):
+    """Match staged statement lines to Transactions(Past) and store the matches."""
+    db = SessionLocal()
+    try:
+        result = reconcile(
+            db, start.date(), end.date(), bank=bank, window_days=window_days, persist=not dry_run
+        )
+        typer.echo(
+            f"{len(result.matched)} matched, {len(result.ambiguous)} ambiguous, "
+            f"{len(result.unmatched)} unmatched"
+        )
+        for line_id, candidates in result.ambiguous.items():
+            choices = ", ".join(f"TrNo {c.tr_no} ({c.score:.2f})" for c in candidates)
+            typer.echo(f"    line {line_id}: {choices}")
+        if dry_run:
+            typer.echo("Dry run: no matches were stored")
+    except Exception as e:
+        typer.echo(f"Error reconciling statements: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command("sync-descriptions")
+def sync_statement_descriptions(
+    start: Optional[datetime] = typer.Option(None, formats=["%Y-%m-%d"], help="First statement date"),
+    end: Optional[datetime] = typer.Option(None, formats=["%Y-%m-%d"], help="Last statement date"),
+    dry_run: bool = typer.Option(False, help="Report the diff without writing it")
+):
+    """Copy the narrations of reconciled statement lines into Transactions(Past)."""
+    db = SessionLocal()
+    try:
+        pairs = matched_pairs(db, start.date() if start else None, end.date() if end else None)
+        result = sync_descriptions(db, pairs, dry_run=dry_run)
+        for change in result.changes:
+            typer.echo(f"TrNo {change.tr_no} {change.column}: {change.old!r} -> {change.new!r}")
+        for error in result.errors:
+            typer.echo(f"    {error}", err=True)
+        typer.echo(f"{result.updated} updated, {result.unchanged} unchanged")
+        if dry_run:
+            typer.echo("Dry run: nothing was written")
+    except Exception as e:
+        typer.echo(f"Error syncing descriptions: {str(e)}", err=True)
+    finally:
+        db.close()
+
+@app.command("match-zoho")
+def match_zoho(
+    path: str = typer.Argument(..., help="Zoho Books CSV export"),
+    dry_run: bool = typer.Option(False, help="Report the matches without setting ZohoMatch"),
+    reset_unmatched: bool = typer.Option(
+        False, help="Set ZohoMatch to No on unmatched transactions of the export's date range"
+    )
+):
+    """Set ZohoMatch on Transactions(Past) from a Zoho Books export and report unmatched rows."""
+    db = SessionLocal()
+    try:
+        result = match_zoho_export(db, path, dry_run=dry_run, reset_unmatched=reset_unmatched)
+        typer.echo(
+            f"{result.start} to {result.end}: {len(result.matched)} matched, "
+            f"{result.marked_yes} set to Yes, {result.marked_no} set to No, {result.skipped} Zoho rows skipped"
+        )
+        if result.unmatched_transactions:
+            typer.echo("Transactions missing from Zoho:")
+            for row in result.unmatched_transactions:
+                typer.echo(f"    TrNo {row.tr_no} {row.day} {row.amount:.2f} {row.description}")
+        if result.unmatched_zoho:
+            typer.echo("Zoho rows missing from Transactions(Past):")
+            for row in result.unmatched_zoho:
+                typer.echo(f"    line {row.line} {row.day} {row.amount:.2f} {row.description}")
+        if dry_run:
+            typer.echo("Dry run: ZohoMatch was not changed")
+    except Exception as e:
+        typer.echo(f"Error matching {path}: {str(e)}", err=True)
+    finally:
+        db.close()
+
 if __name__ == "__main__":
     app()
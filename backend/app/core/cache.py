@@ -0,0 +1,178 @@
+"""
+In-process caches invalidated by table write versions
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Sequence, Tuple
+
+
+class TableVersions:
+    """Per-table write counters.
+
+    CRUD mutations bump the tables they wrote after committing. A cached
+    result remembers the versions it was computed at and is stale as soon
+    as any of them moves on. Counters live in this process only.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def bump(self, *tables: str) -> None:
+        """Record a committed write to each of the tables.
+
+        Args:
+            tables: Table names, e.g. ``"Transactions(Past)"``
+        """
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def get(self, *tables: str) -> Tuple[int, ...]:
+        """Current versions of the tables, in the order given.
+
+        Args:
+            tables: Table names
+
+        Returns:
+            Tuple[int, ...]: One counter per table
+        """
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+
+table_versions = TableVersions()
+
+
+@dataclass
+class CacheStats:
+    """Counters of a VersionedCache.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that found no usable entry
+        evictions: Entries dropped to stay within maxsize
+        invalidations: Entries dropped because a table was written
+        expirations: Entries dropped because their TTL ran out
+        size: Entries currently held
+        maxsize: Capacity
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    expirations: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+
+class _Entry(NamedTuple):
+    tables: Tuple[str, ...]
+    versions: Tuple[int, ...]
+    expires_at: Optional[float]
+    value: Any
+
+
+class VersionedCache:
+    """LRU of values computed from database tables, with an optional TTL.
+
+    An entry is served only while the tables it was read from keep the
+    versions it was stored with. The TTL bounds staleness from writes this
+    process cannot see, such as scripts or other workers.
+
+    Attributes:
+        tables: Default tables of the cached values
+        maxsize: Number of keys kept before the least recently used is dropped
+        ttl: Seconds an entry stays valid, None for no expiry
+    """
+
+    def __init__(
+        self,
+        tables: Sequence[str] = (),
+        maxsize: int = 32,
+        ttl: Optional[float] = None,
+        versions: TableVersions = table_versions
+    ) -> None:
+        self.tables = tuple(tables)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._versions = versions
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._stats = CacheStats(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def versions(self, tables: Optional[Sequence[str]] = None) -> Tuple[int, ...]:
+        """Current versions of the cached tables.
+
+        Capture them before reading the database and pass them to ``put`` so
+        a write that lands during the read leaves the entry already stale.
+
+        Args:
+            tables: Tables to report, the cache's default tables if None
+        """
+        return self._versions.get(*(self.tables if tables is None else tables))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value if it is fresh and no table was written since.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            if self._versions.get(*entry.tables) != entry.versions:
+                del self._entries[key]
+                self._stats.invalidations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        versions: Tuple[int, ...],
+        tables: Optional[Sequence[str]] = None
+    ) -> None:
+        """Store a value computed at the given table versions.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            versions: Result of ``versions(tables)`` taken before computing value
+            tables: Tables the value was read from, the default tables if None
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        entry = _Entry(self.tables if tables is None else tuple(tables), versions, expires_at, value)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
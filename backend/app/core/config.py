@@ -1,9 +1,13 @@
 """
 Configuration settings for the application
 """
+import os
 from typing import Optional
 from pydantic_settings import BaseSettings
 
+# Default database lives next to the backend package: backend/kaas.db
+DEFAULT_DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../kaas.db'))
+
 class Settings(BaseSettings):
     """
     Application settings
@@ -18,6 +22,24 @@ class Settings(BaseSettings):
         TELEGRAM_PHONE_NUMBER: Telegram phone number
         TELEGRAM_CHANNEL_ID: Telegram channel ID
         DATABASE_URL: SQLite database URL
+        DB_ECHO: Log every SQL statement
+        DB_POOL_SIZE: Number of pooled connections kept open
+        DB_MAX_OVERFLOW: Extra connections allowed above the pool size
+        DB_POOL_TIMEOUT: Seconds to wait for a pooled connection
+        SQLITE_JOURNAL_MODE: SQLite journal mode (WAL allows concurrent readers)
+        SQLITE_SYNCHRONOUS: SQLite synchronous level
+        SQLITE_MMAP_SIZE: Bytes of the database file to memory-map
+        SQLITE_CACHE_SIZE: Page cache size (negative values are KiB)
+        SQLITE_TEMP_STORE: Where SQLite keeps temporary tables and indices
+        SQLITE_BUSY_TIMEOUT: Milliseconds to wait on a locked database
+        EXPORT_BATCH_SIZE: Rows fetched per server-side cursor batch when exporting
+        IMPORT_BATCH_SIZE: Workbook rows diffed and written per chunk when importing
+        STATEMENT_PARSE_WORKERS: Processes parsing bank statement files; 0 uses one per CPU
+        RECONCILE_WINDOW_DAYS: Days a ledger transaction may be dated before or after its statement line
+        RECONCILE_MARGIN: Score lead the best candidate needs over the next to be matched
+        RESPONSE_CACHE_SIZE: Number of cached read responses kept in memory
+        RESPONSE_CACHE_TTL: Seconds a cached read response is served; 0 disables the cache
+        FAST_JSON_VALIDATE: Validate database rows against the response schema on the orjson fast path
     """
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "BMS Serendipity"
@@ -31,7 +53,35 @@ class Settings(BaseSettings):
     TELEGRAM_CHANNEL_ID: Optional[str] = None
     
     # Database Settings
-    DATABASE_URL: str = "sqlite:///./sql_app.db"
+    DATABASE_URL: str = f"sqlite:///{DEFAULT_DB_PATH}"
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+
+    # SQLite pragmas applied on every connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_CACHE_SIZE: int = -64000
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_BUSY_TIMEOUT: int = 5000
+
+    # Export Settings
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Import Settings
+    IMPORT_BATCH_SIZE: int = 500
+    STATEMENT_PARSE_WORKERS: int = 0
+
+    # Reconciliation Settings
+    RECONCILE_WINDOW_DAYS: int = 3
+    RECONCILE_MARGIN: float = 0.1
+
+    # Response Cache Settings
+    RESPONSE_CACHE_SIZE: int = 256
+    RESPONSE_CACHE_TTL: int = 300
+    FAST_JSON_VALIDATE: bool = False
     
     class Config:
         env_file = ".env"
@@ -1,9 +1,19 @@
 """
 CRUD operations package
 """
-from .crud_account import CRUDAccount
-from .crud_future import CRUDFuture
-from .crud_transaction import transaction
-from .base import CRUDBase
+from .crud_account import AsyncCRUDAccount, CRUDAccount
+from .crud_future import AsyncCRUDFuture, CRUDFuture
+from .crud_transaction import AsyncCRUDTransaction, CRUDTransaction, transaction
+from .base import AsyncCRUDBase, CRUDBase
 
-__all__ = ['CRUDAccount', 'CRUDFuture', 'transaction', 'CRUDBase']
+__all__ = [
+    'CRUDAccount',
+    'CRUDFuture',
+    'CRUDTransaction',
+    'transaction',
+    'CRUDBase',
+    'AsyncCRUDAccount',
+    'AsyncCRUDFuture',
+    'AsyncCRUDTransaction',
+    'AsyncCRUDBase'
+]
@@ -1,9 +1,16 @@
 """Base CRUD operations."""
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import inspect, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+from app.core.cache import table_versions
+from app.crud.filters import QueryFilter, coerce_value, compile_filter
+from app.crud.pagination import Page, build_page, keyset_query
 from app.db.database import Base
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
@@ -38,7 +45,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Optional[ModelType]: Found record or None
         """
-        return db.query(self.model).filter(self.model.id == id).first()
+        return db.get(self.model, id)
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record.
@@ -50,10 +57,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             ModelType: Created record
         """
-        obj_in_data = jsonable_encoder(obj_in)
+        # Keep Python types (date, Decimal, enums) for the column types to bind
+        obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
         db.commit()
+        table_versions.bump(self.model.__tablename__)
         db.refresh(db_obj)
         return db_obj
 
@@ -84,6 +93,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
         db.commit()
+        table_versions.bump(self.model.__tablename__)
         db.refresh(db_obj)
         return db_obj
 
@@ -97,9 +107,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             ModelType: Removed record
         """
-        obj = db.query(self.model).get(id)
+        obj = db.get(self.model, id)
         db.delete(obj)
         db.commit()
+        table_versions.bump(self.model.__tablename__)
         return obj
 
     def get_by_field(
@@ -143,3 +154,299 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return db.query(self.model).filter(
             getattr(self.model, field_name) == value
         ).offset(skip).limit(limit).all()
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Base class for CRUD operations on an AsyncSession.
+
+    Mirrors CRUDBase so request handlers can await database IO instead of
+    blocking the event loop.
+
+    Attributes:
+        model: The SQLAlchemy model class
+        cursor_keys: Column names ordering keyset pages; the primary key if empty
+        filter_fields: Columns accepted in equality and IN filters
+        range_fields: Columns accepted in range filters
+        sort_fields: Columns accepted in the sort order
+    """
+
+    cursor_keys: Tuple[str, ...] = ()
+    filter_fields: Tuple[str, ...] = ()
+    range_fields: Tuple[str, ...] = ()
+    sort_fields: Tuple[str, ...] = ()
+
+    def __init__(self, model: Type[ModelType]):
+        """Initialize CRUD object with SQLAlchemy model.
+
+        Args:
+            model: The SQLAlchemy model class
+        """
+        self.model = model
+
+    async def get_all(self, db: AsyncSession) -> List[ModelType]:
+        result = await db.execute(select(self.model))
+        return list(result.scalars().all())
+
+    def _cursor_columns(self) -> List[ColumnElement]:
+        if self.cursor_keys:
+            return [getattr(self.model, name) for name in self.cursor_keys]
+        return [getattr(self.model, column.key) for column in inspect(self.model).primary_key]
+
+    def _coerce_filter_value(
+        self, column: ColumnElement, value: str, operator: Optional[str]
+    ) -> Any:
+        return coerce_value(column, value, operator)
+
+    def compile_filter(
+        self, query_filter: QueryFilter
+    ) -> Tuple[List[ColumnElement], List[Tuple[ColumnElement, bool]]]:
+        """Compile filters and sort order against the whitelisted fields.
+
+        Args:
+            query_filter: Parsed filters
+
+        Returns:
+            Tuple of WHERE clauses and (column, descending) sort keys
+
+        Raises:
+            InvalidFilterError: If a field is not whitelisted or a value is invalid
+        """
+        return compile_filter(
+            self.model,
+            query_filter,
+            filter_fields=self.filter_fields,
+            range_fields=self.range_fields,
+            sort_fields=self.sort_fields,
+            coerce=self._coerce_filter_value,
+        )
+
+    def row_columns(self) -> List[ColumnElement]:
+        """Columns selected by get_row_page, labelled as the response fields."""
+        return [getattr(self.model, column.key) for column in inspect(self.model).column_attrs]
+
+    def _page_query(
+        self,
+        entities: Sequence[Any],
+        *,
+        cursor: Optional[str],
+        limit: int,
+        where: Sequence[ColumnElement],
+        query_filter: Optional[QueryFilter],
+        skip: int
+    ) -> Tuple[Select, List[ColumnElement]]:
+        clauses, order = self.compile_filter(query_filter or QueryFilter())
+        keys = [column for column, _ in order]
+        descending = [desc for _, desc in order]
+        for column in self._cursor_columns():
+            if not any(column is key for key in keys):
+                keys.append(column)
+                descending.append(False)
+
+        stmt = select(*entities).where(*where, *clauses)
+        stmt = keyset_query(stmt, keys, cursor, limit, descending)
+        if skip:
+            stmt = stmt.offset(skip)
+        return stmt, keys
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        where: Sequence[ColumnElement] = (),
+        query_filter: Optional[QueryFilter] = None,
+        skip: int = 0,
+        options: Sequence[Any] = ()
+    ) -> Page[ModelType]:
+        """Get one keyset page of records.
+
+        Filters and sort order compile into a single statement that seeks
+        past the cursor, so every page costs the same as the first one.
+        A requested sort is followed by the cursor keys as tie-breakers.
+
+        Args:
+            db: Database session
+            cursor: Cursor returned with the previous page, None for the first page
+            limit: Maximum number of records to return
+            where: Extra filter clauses
+            query_filter: Whitelisted filters and sort order
+            skip: Legacy offset applied on top of the seek; avoid for deep pages
+            options: Loader options such as selectinload for the page's records
+
+        Returns:
+            Page[ModelType]: Records and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+            InvalidFilterError: If the filter is not allowed
+        """
+        stmt, keys = self._page_query(
+            [self.model], cursor=cursor, limit=limit, where=where,
+            query_filter=query_filter, skip=skip
+        )
+        result = await db.execute(stmt.options(*options))
+        return build_page(result.scalars().all(), keys, limit)
+
+    async def get_row_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        where: Sequence[ColumnElement] = (),
+        query_filter: Optional[QueryFilter] = None,
+        skip: int = 0
+    ) -> Page[Row]:
+        """Get one keyset page as Core rows.
+
+        Same statement as get_page, but selects row_columns through Core so
+        no ORM objects are built; the rows feed the orjson fast path.
+
+        Args:
+            db: Database session
+            cursor: Cursor returned with the previous page, None for the first page
+            limit: Maximum number of records to return
+            where: Extra filter clauses
+            query_filter: Whitelisted filters and sort order
+            skip: Legacy offset applied on top of the seek; avoid for deep pages
+
+        Returns:
+            Page[Row]: Rows labelled by field name and the next cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+            InvalidFilterError: If the filter is not allowed
+        """
+        stmt, keys = self._page_query(
+            self.row_columns(), cursor=cursor, limit=limit, where=where,
+            query_filter=query_filter, skip=skip
+        )
+        result = await db.execute(stmt)
+        return build_page(result.all(), keys, limit)
+
+    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """Get a record by primary key.
+
+        Args:
+            db: Database session
+            id: Record ID
+
+        Returns:
+            Optional[ModelType]: Found record or None
+        """
+        return await db.get(self.model, id)
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """Create a new record.
+
+        Args:
+            db: Database session
+            obj_in: Create schema with record data
+
+        Returns:
+            ModelType: Created record
+        """
+        # Keep Python types (date, Decimal, enums) for the column types to bind
+        obj_in_data = obj_in.model_dump()
+        db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        await db.commit()
+        table_versions.bump(self.model.__tablename__)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """Update a record.
+
+        Args:
+            db: Database session
+            db_obj: Existing record to update
+            obj_in: Update data
+
+        Returns:
+            ModelType: Updated record
+        """
+        obj_data = jsonable_encoder(db_obj)
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        await db.commit()
+        table_versions.bump(self.model.__tablename__)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[ModelType]:
+        """Remove a record.
+
+        Args:
+            db: Database session
+            id: Record ID
+
+        Returns:
+            Optional[ModelType]: Removed record or None if it did not exist
+        """
+        obj = await db.get(self.model, id)
+        if obj is None:
+            return None
+        await db.delete(obj)
+        await db.commit()
+        table_versions.bump(self.model.__tablename__)
+        return obj
+
+    async def get_by_field(
+        self, db: AsyncSession, field_name: str, value: Any
+    ) -> Optional[ModelType]:
+        """Get a record by a specific field value.
+
+        Args:
+            db: Database session
+            field_name: Name of the field to filter by
+            value: Value to filter for
+
+        Returns:
+            Optional[ModelType]: Found record or None
+        """
+        result = await db.execute(
+            select(self.model).where(getattr(self.model, field_name) == value).limit(1)
+        )
+        return result.scalars().first()
+
+    async def get_multi_by_field(
+        self,
+        db: AsyncSession,
+        field_name: str,
+        value: Any,
+        *,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[ModelType]:
+        """Get multiple records by a specific field value.
+
+        Args:
+            db: Database session
+            field_name: Name of the field to filter by
+            value: Value to filter for
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List[ModelType]: List of found records
+        """
+        result = await db.execute(
+            select(self.model).where(
+                getattr(self.model, field_name) == value
+            ).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
@@ -2,12 +2,25 @@
 Import all CRUD modules and expose them
 """
 
-from .crud_future import crud_future as future
-from .crud_transaction import transaction
-from .crud_account import account
+from .crud_future import crud_future as future, async_future
+from .crud_transaction import transaction, async_transaction
+from .crud_account import account, async_account
+from .crud_checkpoint import balance_checkpoint, async_balance_checkpoint
+from .crud_summary import async_summary
+from .crud_rollup import monthly_rollup, async_monthly_rollup
+from .crud_calendar import async_calendar
 
 __all__ = [
     "future",
     "transaction",
-    "account"
+    "account",
+    "async_future",
+    "async_transaction",
+    "async_account",
+    "balance_checkpoint",
+    "async_balance_checkpoint",
+    "async_summary",
+    "monthly_rollup",
+    "async_monthly_rollup",
+    "async_calendar"
 ]
@@ -1,17 +1,30 @@
 """CRUD operations for accounts."""
 
 import logging
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import List, Optional, Sequence
+from sqlalchemy import exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 from decimal import Decimal
 
-from app.crud.base import CRUDBase
-from app.models.models import AccountsPresent
+from app.core.cache import table_versions
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.crud.ledger import BalanceLedger
+from app.models.models import AccountsPresent, BalanceCheckpoint, FreedomFuture
+from app.models.transaction import Transaction
 from app.schemas.schemas import AccountCreate, AccountUpdate
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Relationships of AccountsPresent that callers may ask to load
+ACCOUNT_RELATIONSHIPS = ("past_transactions", "future_transactions")
+
+# A manual adjustment moves the balance and today's checkpoint
+ADJUSTED_TABLES = (AccountsPresent.__tablename__, BalanceCheckpoint.__tablename__)
+
 class CRUDAccount(CRUDBase[AccountsPresent, AccountCreate, AccountUpdate]):
     """CRUD operations for accounts.
     
@@ -144,6 +157,9 @@ class CRUDAccount(CRUDBase[AccountsPresent, AccountCreate, AccountUpdate]):
 
     def update_balance(self, db: Session, *, cc_id: str, amount: Decimal) -> Optional[AccountsPresent]:
         """Update account balance by adding/subtracting amount.
+
+        The change is applied atomically in SQL through BalanceLedger and is
+        dated today, so balances as of earlier days are unaffected.
         
         Args:
             db: Database session
@@ -155,16 +171,254 @@ class CRUDAccount(CRUDBase[AccountsPresent, AccountCreate, AccountUpdate]):
         """
         logger.info(f"Adjusting balance for account {cc_id} by {amount}")
         try:
-            account = self.get_by_cc_id(db, cc_id)
-            if not account:
+            ledger = BalanceLedger()
+            ledger.add(cc_id, amount, on=date.today())
+            # A zero amount leaves nothing to write but still returns the account
+            if ledger.apply(db):
+                db.commit()
+                table_versions.bump(*ADJUSTED_TABLES)
+            else:
+                # Drop the checkpoint seeded for an unknown account
+                db.rollback()
+            account = db.scalars(
+                select(self.model).where(self.model.AccID == cc_id)
+                .execution_options(populate_existing=True)
+            ).first()
+            if account is None:
                 logger.warning(f"Account with CC ID {cc_id} not found")
-                return None
-            
-            new_balance = account.Balance + amount
-            update_data = {"Balance": new_balance}
-            return super().update(db, db_obj=account, obj_in=update_data)
+            return account
         except Exception as e:
+            db.rollback()
             logger.error(f"Error adjusting balance for account {cc_id}: {str(e)}")
             raise
 
 account = CRUDAccount(AccountsPresent)
+
+
+class AsyncCRUDAccount(AsyncCRUDBase[AccountsPresent, AccountCreate, AccountUpdate]):
+    """Async CRUD operations for accounts.
+
+    AsyncSession counterpart of CRUDAccount used by the API handlers.
+    """
+
+    filter_fields = ("SLNo", "Type", "AccID", "Bank", "NextDueDate")
+    range_fields = ("Balance", "IntRate", "EMIAmt", "Tenure")
+    sort_fields = ("SLNo", "AccountName", "Type", "AccID", "Balance", "IntRate", "Bank", "EMIAmt")
+
+    def loader_options(self, include: Sequence[str]) -> List[LoaderOption]:
+        """Build selectinload options for the requested relationships.
+
+        Each relationship is fetched for all loaded accounts in one extra
+        IN query, instead of one lazy load per account.
+
+        Args:
+            include: Names from ACCOUNT_RELATIONSHIPS
+
+        Returns:
+            List[LoaderOption]: Options to pass to a select of accounts
+
+        Raises:
+            ValueError: If a name is not a loadable relationship
+        """
+        unknown = [name for name in include if name not in ACCOUNT_RELATIONSHIPS]
+        if unknown:
+            raise ValueError(
+                f"Cannot include {', '.join(unknown)}; allowed: {', '.join(ACCOUNT_RELATIONSHIPS)}"
+            )
+        return [selectinload(getattr(self.model, name)) for name in dict.fromkeys(include)]
+
+    async def get_by_acc_id(self, db: AsyncSession, acc_id: str) -> Optional[AccountsPresent]:
+        """Get an account by its AccID.
+
+        Args:
+            db: Database session
+            acc_id: Account ID to search for
+
+        Returns:
+            Optional[AccountsPresent]: Found account or None
+        """
+        return await self.get_by_cc_id(db, acc_id)
+
+    async def get_by_sl_no(
+        self, db: AsyncSession, sl_no: int, include: Sequence[str] = ()
+    ) -> Optional[AccountsPresent]:
+        """Get an account by its serial number.
+
+        Args:
+            db: Database session
+            sl_no: Serial number to search for
+            include: Relationships to load with the account
+
+        Returns:
+            Optional[AccountsPresent]: Found account or None
+        """
+        logger.info(f"Fetching account with SLNo: {sl_no}")
+        try:
+            if not include:
+                return await db.get(self.model, sl_no)
+            result = await db.execute(
+                select(self.model).where(self.model.SLNo == sl_no)
+                .options(*self.loader_options(include))
+                .execution_options(populate_existing=True)
+            )
+            return result.scalars().first()
+        except Exception as e:
+            logger.error(f"Error fetching account with SLNo {sl_no}: {str(e)}")
+            raise
+
+    async def get_by_cc_id(
+        self, db: AsyncSession, cc_id: str, include: Sequence[str] = ()
+    ) -> Optional[AccountsPresent]:
+        """Get an account by its CC ID (AccID).
+
+        Args:
+            db: Database session
+            cc_id: CC ID (AccID) to search for
+            include: Relationships to load with the account
+
+        Returns:
+            Optional[AccountsPresent]: Found account or None
+        """
+        logger.info(f"Fetching account with CC ID: {cc_id}")
+        try:
+            stmt = select(self.model).where(self.model.AccID == cc_id).limit(1)
+            if include:
+                stmt = stmt.options(*self.loader_options(include)).execution_options(populate_existing=True)
+            result = await db.execute(stmt)
+            return result.scalars().first()
+        except Exception as e:
+            logger.error(f"Error fetching account with CC ID {cc_id}: {str(e)}")
+            raise
+
+    async def get_all(self, db: AsyncSession) -> List[AccountsPresent]:
+        """Get all accounts.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List[AccountsPresent]: List of all accounts
+        """
+        logger.info("Fetching all accounts")
+        try:
+            return await super().get_all(db)
+        except Exception as e:
+            logger.error(f"Error fetching all accounts: {str(e)}")
+            raise
+
+    async def get_by_type(
+        self, db: AsyncSession, account_type: str, skip: int = 0, limit: int = 100
+    ) -> List[AccountsPresent]:
+        """Get accounts by type with pagination.
+
+        Args:
+            db: Database session
+            account_type: Type of accounts to fetch
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List[AccountsPresent]: List of accounts of specified type
+        """
+        logger.info(f"Fetching accounts of type: {account_type}")
+        try:
+            return await self.get_multi_by_field(
+                db, "Type", account_type, skip=skip, limit=limit
+            )
+        except Exception as e:
+            logger.error(f"Error fetching accounts of type {account_type}: {str(e)}")
+            raise
+
+    async def get_accounts_due(self, db: AsyncSession, due_date: str) -> List[AccountsPresent]:
+        """Get accounts with specified due date.
+
+        Args:
+            db: Database session
+            due_date: Due date to filter by
+
+        Returns:
+            List[AccountsPresent]: List of accounts with specified due date
+        """
+        logger.info(f"Fetching accounts with due date: {due_date}")
+        try:
+            result = await db.execute(
+                select(self.model).where(self.model.NextDueDate == due_date)
+            )
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Error fetching accounts with due date {due_date}: {str(e)}")
+            raise
+
+    async def has_transactions(self, db: AsyncSession, acc_id: str) -> bool:
+        """Check whether any past or future transaction belongs to an account.
+
+        Args:
+            db: Database session
+            acc_id: Account ID to look for
+
+        Returns:
+            bool: True if Transactions(Past) or Freedom(Future) has a row for the account
+        """
+        return bool(await db.scalar(select(or_(
+            exists().where(Transaction.AccID == acc_id),
+            exists().where(FreedomFuture.AccID == acc_id),
+        ))))
+
+    async def create(self, db: AsyncSession, *, obj_in: AccountCreate) -> AccountsPresent:
+        """Create a new account.
+
+        Args:
+            db: Database session
+            obj_in: Account creation data
+
+        Returns:
+            AccountsPresent: Created account
+        """
+        logger.info(f"Creating new account: {obj_in.AccountName}")
+        try:
+            return await super().create(db, obj_in=obj_in)
+        except Exception as e:
+            logger.error(f"Error creating account {obj_in.AccountName}: {str(e)}")
+            raise
+
+    async def update_balance(
+        self, db: AsyncSession, *, cc_id: str, amount: Decimal
+    ) -> Optional[AccountsPresent]:
+        """Update account balance by adding/subtracting amount.
+
+        The change is applied atomically in SQL through BalanceLedger and is
+        dated today, so balances as of earlier days are unaffected.
+
+        Args:
+            db: Database session
+            cc_id: Account CC ID (AccID)
+            amount: Amount to adjust (positive for credit, negative for debit)
+
+        Returns:
+            Optional[AccountsPresent]: Updated account or None
+        """
+        logger.info(f"Adjusting balance for account {cc_id} by {amount}")
+        try:
+            ledger = BalanceLedger()
+            ledger.add(cc_id, amount, on=date.today())
+            # A zero amount leaves nothing to write but still returns the account
+            if await ledger.apply_async(db):
+                await db.commit()
+                table_versions.bump(*ADJUSTED_TABLES)
+            else:
+                # Drop the checkpoint seeded for an unknown account
+                await db.rollback()
+            result = await db.execute(
+                select(self.model).where(self.model.AccID == cc_id)
+                .execution_options(populate_existing=True)
+            )
+            account = result.scalars().first()
+            if account is None:
+                logger.warning(f"Account with CC ID {cc_id} not found")
+            return account
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Error adjusting balance for account {cc_id}: {str(e)}")
+            raise
+
+async_account = AsyncCRUDAccount(AccountsPresent)
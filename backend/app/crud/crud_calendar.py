@@ -0,0 +1,134 @@
+"""Month calendar of past transactions and future predictions."""
+
+import logging
+from datetime import date, datetime
+from typing import Dict, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.cache import VersionedCache
+from app.models.models import FreedomFuture
+from app.models.transaction import Transaction
+from app.schemas.calendar import CalendarDay, CalendarFutureEntry, CalendarMonth
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Months kept in memory; a calendar user pages back and forth around today
+CACHED_MONTHS = 24
+
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """First day of the month and of the following month."""
+    if month == 12:
+        return date(year, month, 1), date(year + 1, 1, 1)
+    return date(year, month, 1), date(year, month + 1, 1)
+
+
+def _transaction_days_query(start: date, end: date) -> Select:
+    # Grouping on the stored Date keeps the walk in index order; the rare
+    # same-day groups with different times are folded afterwards
+    return select(
+        Transaction.Date, func.count(), func.coalesce(func.sum(Transaction.Amount), 0)
+    ).where(
+        Transaction.Date >= datetime.combine(start, datetime.min.time()),
+        Transaction.Date < datetime.combine(end, datetime.min.time()),
+    ).group_by(Transaction.Date)
+
+
+def _future_entries_query(start: date, end: date) -> Select:
+    # Listing both Paid values lets the (Paid, Date, TrNo) index seek the range
+    return select(
+        FreedomFuture.TrNo,
+        FreedomFuture.Date,
+        FreedomFuture.Description,
+        FreedomFuture.Amount,
+        FreedomFuture.AccID,
+        FreedomFuture.Category,
+        FreedomFuture.Paid,
+    ).where(
+        FreedomFuture.Paid.in_([False, True]),
+        FreedomFuture.Date >= start,
+        FreedomFuture.Date < end,
+    )
+
+
+class AsyncCRUDCalendar:
+    """Per-day calendar buckets, cached per month until either table is written.
+
+    Attributes:
+        cache: Computed months keyed by (year, month)
+    """
+
+    def __init__(self) -> None:
+        self.cache = VersionedCache(
+            (Transaction.__tablename__, FreedomFuture.__tablename__), maxsize=CACHED_MONTHS
+        )
+
+    async def get_month(self, db: AsyncSession, year: int, month: int) -> CalendarMonth:
+        """Get the per-day buckets of a month.
+
+        Runs one range query on Transactions(Past), aggregated per day, and
+        one on Freedom(Future); the merged result is served from memory
+        until a CRUD write bumps either table.
+
+        Args:
+            db: Database session
+            year: Calendar year
+            month: Calendar month (1-12)
+
+        Returns:
+            CalendarMonth: Days with activity in date order
+        """
+        key = (year, month)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        versions = self.cache.versions()
+        start, end = month_bounds(year, month)
+        days: Dict[date, CalendarDay] = {}
+
+        def bucket(day: date) -> CalendarDay:
+            if day not in days:
+                days[day] = CalendarDay(date=day)
+            return days[day]
+
+        for day, count, total in await db.execute(_transaction_days_query(start, end)):
+            entry = bucket(day.date())
+            entry.transaction_count += count
+            entry.transaction_total = round(entry.transaction_total + float(total), 2)
+
+        for row in await db.execute(_future_entries_query(start, end)):
+            entry = bucket(row.Date)
+            future = CalendarFutureEntry(
+                TrNo=row.TrNo,
+                Description=row.Description.strip(),
+                Amount=float(row.Amount),
+                AccID=row.AccID,
+                Category=getattr(row.Category, "value", row.Category),
+                Paid=row.Paid,
+            )
+            if row.Paid:
+                entry.paid.append(future)
+                entry.paid_total = round(entry.paid_total + future.Amount, 2)
+            else:
+                entry.due.append(future)
+                entry.due_total = round(entry.due_total + future.Amount, 2)
+
+        for entry in days.values():
+            entry.due.sort(key=lambda future: future.TrNo)
+            entry.paid.sort(key=lambda future: future.TrNo)
+
+        result = CalendarMonth(
+            month=f"{year:04d}-{month:02d}",
+            days=[days[day] for day in sorted(days)],
+        )
+        self.cache.put(key, result, versions)
+        logger.info(f"Built calendar for {result.month} with {len(result.days)} active days")
+        return result
+
+
+async_calendar = AsyncCRUDCalendar()
@@ -0,0 +1,225 @@
+"""CRUD operations for daily balance checkpoints."""
+
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, Numeric, String, bindparam, delete, func, insert, inspect, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable, Select
+
+from app.core.cache import table_versions
+from app.models.models import AccountsPresent, BalanceCheckpoint
+from app.models.transaction import Transaction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+
+_checkpoints = BalanceCheckpoint.__table__
+_accounts = AccountsPresent.__table__
+_transactions = Transaction.__table__
+
+
+def _running_total(acc_id, *conditions) -> Select:
+    """Latest RunningTotal of an account matching the extra conditions."""
+    return select(_checkpoints.c.RunningTotal).where(
+        _checkpoints.c.AccID == acc_id, *conditions
+    ).order_by(_checkpoints.c.Day.desc()).limit(1)
+
+
+def checkpoint_statements(
+    day_deltas: Mapping[Tuple[str, date], Decimal]
+) -> List[Tuple[Executable, List[dict]]]:
+    """Build the executemany statements that fold daily deltas into checkpoints.
+
+    Missing (AccID, Day) rows are seeded with the running total of the
+    previous day, then each delta is added to that day's NetChange and to
+    the RunningTotal of that day and every later one.
+
+    Args:
+        day_deltas: Net amount per (AccID, day)
+
+    Returns:
+        List of (statement, parameter list) pairs to execute in order
+    """
+    params = [
+        {"acc_id": acc_id, "day": day, "delta": delta}
+        for (acc_id, day), delta in sorted(day_deltas.items())
+        if delta
+    ]
+    if not params:
+        return []
+
+    acc_id = bindparam("acc_id", type_=String)
+    day = bindparam("day", type_=Date)
+    delta = bindparam("delta", type_=Numeric(14, 2))
+
+    seed = sqlite_insert(_checkpoints).values(
+        AccID=acc_id,
+        Day=day,
+        NetChange=0,
+        RunningTotal=func.coalesce(
+            _running_total(acc_id, _checkpoints.c.Day < day).scalar_subquery(), 0
+        ),
+    ).on_conflict_do_nothing()
+    net = update(_checkpoints).where(
+        _checkpoints.c.AccID == acc_id, _checkpoints.c.Day == day
+    ).values(NetChange=_checkpoints.c.NetChange + delta)
+    shift = update(_checkpoints).where(
+        _checkpoints.c.AccID == acc_id, _checkpoints.c.Day >= day
+    ).values(RunningTotal=_checkpoints.c.RunningTotal + delta)
+
+    return [(seed, params), (net, params), (shift, params)]
+
+
+def _balances_as_of_query(as_of: date, acc_ids: Optional[Sequence[str]] = None) -> Select:
+    """Current balance plus the running totals needed to roll it back to as_of."""
+    latest = _running_total(_accounts.c.AccID).scalar_subquery()
+    upto = _running_total(_accounts.c.AccID, _checkpoints.c.Day <= as_of).scalar_subquery()
+    stmt = select(
+        _accounts.c.AccID,
+        _accounts.c.Balance,
+        func.coalesce(latest, 0).label("total"),
+        func.coalesce(upto, 0).label("upto"),
+    ).order_by(_accounts.c.AccID)
+    if acc_ids is not None:
+        stmt = stmt.where(_accounts.c.AccID.in_(list(acc_ids)))
+    return stmt
+
+
+def _as_of_balances(rows) -> Dict[str, Decimal]:
+    # Balance on a day = current balance minus everything dated after it
+    return {
+        row.AccID: (
+            Decimal(str(row.Balance)) - Decimal(str(row.total)) + Decimal(str(row.upto))
+        ).quantize(CENT)
+        for row in rows
+    }
+
+
+class CRUDBalanceCheckpoint:
+    """Balance checkpoint maintenance and as-of lookups."""
+
+    def balances_as_of(
+        self, db: Session, as_of: date, acc_ids: Optional[Sequence[str]] = None
+    ) -> Dict[str, Decimal]:
+        """Get account balances at the end of a day.
+
+        Args:
+            db: Database session
+            as_of: Day to report balances for
+            acc_ids: Accounts to include, all accounts if None
+
+        Returns:
+            Dict[str, Decimal]: Balance per AccID
+        """
+        return _as_of_balances(db.execute(_balances_as_of_query(as_of, acc_ids)))
+
+    def rebuild(self, db: Session) -> int:
+        """Recompute all checkpoints from Transactions(Past).
+
+        Manual balance adjustments are not backed by transactions; the part
+        of each day's NetChange they account for is carried over so balances
+        as of earlier days stay put.
+
+        Args:
+            db: Database session
+
+        Returns:
+            int: Number of checkpoints written
+        """
+        day = func.date(_transactions.c.Date)
+        day_total = select(func.coalesce(func.sum(_transactions.c.Amount), 0)).where(
+            _transactions.c.AccID == _checkpoints.c.AccID, day == _checkpoints.c.Day
+        ).scalar_subquery()
+        adjustments = {}
+        for acc_id, on, residual in db.execute(
+            select(_checkpoints.c.AccID, _checkpoints.c.Day, _checkpoints.c.NetChange - day_total)
+        ):
+            residual = Decimal(str(residual)).quantize(CENT)
+            if residual:
+                adjustments[(acc_id, on)] = residual
+
+        net = func.round(func.sum(_transactions.c.Amount), 2)
+        daily = select(
+            _transactions.c.AccID,
+            day,
+            net,
+            func.round(func.sum(func.sum(_transactions.c.Amount)).over(
+                partition_by=_transactions.c.AccID, order_by=day
+            ), 2),
+        ).where(
+            _transactions.c.AccID.isnot(None), _transactions.c.Date.isnot(None)
+        ).group_by(_transactions.c.AccID, day)
+
+        try:
+            db.execute(delete(_checkpoints))
+            db.execute(insert(_checkpoints).from_select(
+                ["AccID", "Day", "NetChange", "RunningTotal"], daily
+            ))
+            for stmt, params in checkpoint_statements(adjustments):
+                db.execute(stmt, params)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error rebuilding balance checkpoints: {str(e)}")
+            raise
+
+        table_versions.bump(_checkpoints.name)
+        count = db.execute(select(func.count()).select_from(_checkpoints)).scalar_one()
+        logger.info(f"Rebuilt {count} balance checkpoints")
+        return count
+
+
+class AsyncCRUDBalanceCheckpoint:
+    """AsyncSession counterpart of CRUDBalanceCheckpoint used by the API handlers."""
+
+    async def balances_as_of(
+        self, db: AsyncSession, as_of: date, acc_ids: Optional[Sequence[str]] = None
+    ) -> Dict[str, Decimal]:
+        """Get account balances at the end of a day.
+
+        Args:
+            db: Database session
+            as_of: Day to report balances for
+            acc_ids: Accounts to include, all accounts if None
+
+        Returns:
+            Dict[str, Decimal]: Balance per AccID
+        """
+        result = await db.execute(_balances_as_of_query(as_of, acc_ids))
+        return _as_of_balances(result)
+
+
+balance_checkpoint = CRUDBalanceCheckpoint()
+async_balance_checkpoint = AsyncCRUDBalanceCheckpoint()
+
+
+def ensure_checkpoints(engine: Engine) -> bool:
+    """Create the checkpoint table if needed and backfill it when empty.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        bool: True if the checkpoints were rebuilt
+    """
+    tables = set(inspect(engine).get_table_names())
+    if _transactions.name not in tables:
+        logger.warning(f"Skipping balance checkpoints: '{_transactions.name}' is missing")
+        return False
+
+    _checkpoints.create(bind=engine, checkfirst=True)
+    with Session(engine) as db:
+        has_checkpoints = db.execute(select(_checkpoints.c.AccID).limit(1)).first()
+        has_transactions = db.execute(select(_transactions.c.TrNo).limit(1)).first()
+        if has_checkpoints or not has_transactions:
+            return False
+        balance_checkpoint.rebuild(db)
+    return True
@@ -3,19 +3,51 @@ CRUD operations for Future Predictions
 """
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import logging
 
-from app.crud.base import CRUDBase
+from app.core.cache import table_versions
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.crud.filters import QueryFilter
+from app.crud.pagination import Page
 from app.models.models import FreedomFuture
 from app.schemas.schemas import FutureCreate, FutureUpdate
-from sqlalchemy import and_, desc, cast, Date, func, text
+from sqlalchemy import and_, desc, cast, Date, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+def _date_range_filters(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    paid_status: Optional[bool] = None
+) -> List[ColumnElement]:
+    """Build the filter clauses shared by the date range queries."""
+    filters = []
+    if start_date:
+        filters.append(FreedomFuture.Date >= start_date)
+    if end_date:
+        filters.append(FreedomFuture.Date <= end_date)
+    if paid_status is not None:
+        filters.append(FreedomFuture.Paid == paid_status)
+    return filters
+
+
+def _date_range_query(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    paid_status: Optional[bool] = None
+) -> Select:
+    """Build the date-ordered query behind get_by_date_range."""
+    return select(FreedomFuture).where(
+        *_date_range_filters(start_date, end_date, paid_status)
+    ).order_by(FreedomFuture.Date, FreedomFuture.TrNo)
+
+
 class CRUDFuture(CRUDBase[FreedomFuture, FutureCreate, FutureUpdate]):
     """
     CRUD operations for Future Predictions
@@ -100,6 +132,29 @@ class CRUDFuture(CRUDBase[FreedomFuture, FutureCreate, FutureUpdate]):
             logger.error(f"Error in get_unpaid: {str(e)}", exc_info=True)
             raise
 
+    def get_by_date_range(
+        self,
+        db: Session,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        paid_status: Optional[bool] = None
+    ) -> List[FreedomFuture]:
+        """
+        Get future predictions within an optional date range
+
+        Args:
+            db: Database session
+            start_date: Optional inclusive start date
+            end_date: Optional inclusive end date
+            paid_status: Optional paid status filter
+
+        Returns:
+            List of matching future predictions ordered by date
+        """
+        query = _date_range_query(start_date, end_date, paid_status)
+        return list(db.execute(query).scalars().all())
+
     def mark_as_paid(
         self, db: Session, *, id: int, paid: bool = True
     ) -> Optional[FreedomFuture]:
@@ -119,8 +174,195 @@ class CRUDFuture(CRUDBase[FreedomFuture, FutureCreate, FutureUpdate]):
             # Convert boolean to string for BooleanStr type
             obj.Paid = str(paid).lower()
             db.commit()
+            table_versions.bump(self.model.__tablename__)
             db.refresh(obj)
         return obj
 
+    def replace_generated(
+        self,
+        db: Session,
+        *,
+        acc_ids: Sequence[str],
+        start: date,
+        marker: str,
+        rows: List[Dict[str, Any]]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Replace generated unpaid predictions of accounts in one transaction
+
+        Unpaid rows from start on whose Comments begin with marker are
+        deleted and the new rows bulk inserted. Months where an account
+        still has a manually entered unpaid row are left to that row.
+
+        Args:
+            db: Database session
+            acc_ids: Accounts whose generated rows are replaced
+            start: First date to replace
+            marker: Comments prefix identifying generated rows
+            rows: New rows as column dicts
+
+        Returns:
+            Tuple of (rows deleted, rows inserted)
+        """
+        unpaid = (
+            self.model.AccID.in_(list(acc_ids)),
+            self.model.Date >= start,
+            self.model.Paid == False,  # noqa: E712 - BooleanStr comparison
+        )
+        try:
+            replaced = db.execute(
+                delete(self.model).where(*unpaid, self.model.Comments.like(f"{marker}%"))
+            ).rowcount
+            manual = {
+                (acc_id, day.year, day.month)
+                for acc_id, day in db.execute(select(self.model.AccID, self.model.Date).where(*unpaid))
+            }
+            written = [
+                row for row in rows
+                if (row["AccID"], row["Date"].year, row["Date"].month) not in manual
+            ]
+            if written:
+                db.execute(insert(self.model), written)
+            db.commit()
+            table_versions.bump(self.model.__tablename__)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error replacing generated future predictions: {str(e)}")
+            raise
+        return replaced, written
+
 
 crud_future = CRUDFuture(FreedomFuture)
+
+
+class AsyncCRUDFuture(AsyncCRUDBase[FreedomFuture, FutureCreate, FutureUpdate]):
+    """
+    Async CRUD operations for Future Predictions
+
+    AsyncSession counterpart of CRUDFuture used by the API handlers
+    """
+
+    cursor_keys = ("Date", "TrNo")
+    filter_fields = ("TrNo", "PaymentMode", "AccID", "Department", "Category", "Paid")
+    range_fields = ("Date", "Amount")
+    sort_fields = ("TrNo", "Date", "Amount", "PaymentMode", "AccID", "Department", "Category")
+
+    async def get_unpaid(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        start_date: Optional[date] = None
+    ) -> List[FreedomFuture]:
+        """
+        Get unpaid future predictions
+
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            start_date: Optional start date to filter from
+
+        Returns:
+            List of unpaid future predictions
+        """
+        try:
+            query = select(self.model).where(
+                self.model.Paid == 'false'
+            ).order_by(self.model.Date)
+            if limit:
+                query = query.limit(limit)
+
+            result = await db.execute(query)
+            results = list(result.scalars().all())
+            logger.debug(f"get_unpaid found {len(results)} results")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in get_unpaid: {str(e)}", exc_info=True)
+            raise
+
+    async def get_by_date_range(
+        self,
+        db: AsyncSession,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        paid_status: Optional[bool] = None
+    ) -> List[FreedomFuture]:
+        """
+        Get future predictions within an optional date range
+
+        Args:
+            db: Database session
+            start_date: Optional inclusive start date
+            end_date: Optional inclusive end date
+            paid_status: Optional paid status filter
+
+        Returns:
+            List of matching future predictions ordered by date
+        """
+        result = await db.execute(_date_range_query(start_date, end_date, paid_status))
+        return list(result.scalars().all())
+
+    async def get_page_by_date_range(
+        self,
+        db: AsyncSession,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        paid_status: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        query_filter: Optional[QueryFilter] = None
+    ) -> Page[FreedomFuture]:
+        """
+        Get one keyset page of future predictions ordered by the requested
+        sort, then (Date, TrNo)
+
+        Args:
+            db: Database session
+            start_date: Optional inclusive start date
+            end_date: Optional inclusive end date
+            paid_status: Optional paid status filter
+            cursor: Cursor returned with the previous page
+            limit: Maximum number of records to return
+            query_filter: Whitelisted filters and sort order
+
+        Returns:
+            Page of future predictions and the cursor of the next page
+        """
+        return await self.get_page(
+            db,
+            cursor=cursor,
+            limit=limit,
+            where=_date_range_filters(start_date, end_date, paid_status),
+            query_filter=query_filter
+        )
+
+    async def mark_as_paid(
+        self, db: AsyncSession, *, id: int, paid: bool = True
+    ) -> Optional[FreedomFuture]:
+        """
+        Mark a future prediction as paid/unpaid
+
+        Args:
+            db: Database session
+            id: ID of the future prediction
+            paid: Paid status to set
+
+        Returns:
+            Updated future prediction or None if not found
+        """
+        obj = await db.get(self.model, id)
+        if obj:
+            # Convert boolean to string for BooleanStr type
+            obj.Paid = str(paid).lower()
+            await db.commit()
+            table_versions.bump(self.model.__tablename__)
+            await db.refresh(obj)
+        return obj
+
+
+async_future = AsyncCRUDFuture(FreedomFuture)
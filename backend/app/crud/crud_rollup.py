@@ -0,0 +1,222 @@
+"""Monthly transaction rollups and the triggers that maintain them."""
+
+import logging
+from typing import Dict, List, Sequence
+
+from sqlalchemy import delete, func, insert, inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import table_versions
+from app.crud.filters import QueryFilter, coerce_value, compile_filter
+from app.models.models import MonthlyRollup
+from app.models.transaction import Transaction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = ("AccID", "Category", "Department", "PaymentMode")
+
+_rollups = MonthlyRollup.__table__
+_transactions = Transaction.__table__
+
+# Rollup key of a transaction row; NULL dimensions are stored as ''
+_KEY = (
+    "substr({row}.Date, 1, 7), coalesce({row}.AccID, ''), coalesce({row}.Category, ''), "
+    "coalesce({row}.Department, ''), coalesce({row}.PaymentMode, '')"
+)
+_MATCHES_KEY = (
+    "YearMonth = substr({row}.Date, 1, 7) AND AccID = coalesce({row}.AccID, '') "
+    "AND Category = coalesce({row}.Category, '') AND Department = coalesce({row}.Department, '') "
+    "AND PaymentMode = coalesce({row}.PaymentMode, '')"
+)
+# Remaining rows of OLD's group; the month bounds let the Date index narrow the scan
+_GROUP_ROWS = (
+    'FROM "Transactions(Past)" AS t WHERE t.Date >= substr(OLD.Date, 1, 7) || \'-01\' '
+    "AND t.Date < date(substr(OLD.Date, 1, 7) || '-01', '+1 month') "
+    "AND coalesce(t.AccID, '') = coalesce(OLD.AccID, '') "
+    "AND coalesce(t.Category, '') = coalesce(OLD.Category, '') "
+    "AND coalesce(t.Department, '') = coalesce(OLD.Department, '') "
+    "AND coalesce(t.PaymentMode, '') = coalesce(OLD.PaymentMode, '')"
+)
+
+_ADD_NEW = f"""
+    INSERT INTO "MonthlyRollups"
+        (YearMonth, AccID, Category, Department, PaymentMode, Total, Count, MinAmount, MaxAmount)
+    VALUES ({_KEY.format(row="NEW")}, round(NEW.Amount, 2), 1, NEW.Amount, NEW.Amount)
+    ON CONFLICT (YearMonth, AccID, Category, Department, PaymentMode) DO UPDATE SET
+        Total = round(Total + excluded.Total, 2),
+        Count = Count + 1,
+        MinAmount = min(MinAmount, excluded.MinAmount),
+        MaxAmount = max(MaxAmount, excluded.MaxAmount);
+"""
+
+# min/max are only rescanned when the removed amount was the extreme
+_REMOVE_OLD = f"""
+    UPDATE "MonthlyRollups" SET
+        Total = round(Total - OLD.Amount, 2),
+        Count = Count - 1,
+        MinAmount = CASE WHEN OLD.Amount > MinAmount THEN MinAmount
+                         ELSE (SELECT min(t.Amount) {_GROUP_ROWS}) END,
+        MaxAmount = CASE WHEN OLD.Amount < MaxAmount THEN MaxAmount
+                         ELSE (SELECT max(t.Amount) {_GROUP_ROWS}) END
+    WHERE {_MATCHES_KEY.format(row="OLD")};
+    DELETE FROM "MonthlyRollups" WHERE {_MATCHES_KEY.format(row="OLD")} AND Count <= 0;
+"""
+
+TRIGGERS: Dict[str, str] = {
+    "trg_monthly_rollups_insert": f"""
+        CREATE TRIGGER trg_monthly_rollups_insert AFTER INSERT ON "Transactions(Past)"
+        WHEN NEW.Date IS NOT NULL AND NEW.Amount IS NOT NULL
+        BEGIN {_ADD_NEW} END
+    """,
+    "trg_monthly_rollups_delete": f"""
+        CREATE TRIGGER trg_monthly_rollups_delete AFTER DELETE ON "Transactions(Past)"
+        WHEN OLD.Date IS NOT NULL AND OLD.Amount IS NOT NULL
+        BEGIN {_REMOVE_OLD} END
+    """,
+    "trg_monthly_rollups_update_old": f"""
+        CREATE TRIGGER trg_monthly_rollups_update_old
+        AFTER UPDATE OF Date, Amount, AccID, Category, Department, PaymentMode ON "Transactions(Past)"
+        WHEN OLD.Date IS NOT NULL AND OLD.Amount IS NOT NULL
+        BEGIN {_REMOVE_OLD} END
+    """,
+    # Firing order does not matter: the min/max rescan reads the updated table
+    "trg_monthly_rollups_update_new": f"""
+        CREATE TRIGGER trg_monthly_rollups_update_new
+        AFTER UPDATE OF Date, Amount, AccID, Category, Department, PaymentMode ON "Transactions(Past)"
+        WHEN NEW.Date IS NOT NULL AND NEW.Amount IS NOT NULL
+        BEGIN {_ADD_NEW} END
+    """,
+}
+
+
+def _coerce_filter_value(column, value, operator):
+    # Categories are stored as Hand_Loans but shown as Hand Loans
+    if column.key == "Category" and value == "Hand Loans":
+        return "Hand_Loans"
+    return coerce_value(column, value, operator)
+
+
+def _rollup_query(query_filter: QueryFilter, group_by: Sequence[str]):
+    """Re-aggregate the rollups to YearMonth plus the requested dimensions."""
+    clauses, order = compile_filter(
+        MonthlyRollup, query_filter,
+        filter_fields=("YearMonth",) + DIMENSIONS,
+        range_fields=("YearMonth",),
+        sort_fields=("YearMonth",) + tuple(group_by),
+        coerce=_coerce_filter_value,
+    )
+    keys = [MonthlyRollup.YearMonth] + [getattr(MonthlyRollup, name) for name in group_by]
+    stmt = select(
+        *keys,
+        func.round(func.sum(MonthlyRollup.Total), 2).label("Total"),
+        func.sum(MonthlyRollup.Count).label("Count"),
+        func.min(MonthlyRollup.MinAmount).label("MinAmount"),
+        func.max(MonthlyRollup.MaxAmount).label("MaxAmount"),
+    ).where(*clauses).group_by(*keys)
+    order_by = [column.desc() if descending else column for column, descending in order]
+    return stmt.order_by(*order_by, *keys)
+
+
+class CRUDMonthlyRollup:
+    """Monthly rollup maintenance."""
+
+    def rebuild(self, db: Session) -> int:
+        """Recompute all rollups from Transactions(Past).
+
+        Args:
+            db: Database session
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        key = [
+            func.substr(_transactions.c.Date, 1, 7),
+            *(func.coalesce(_transactions.c[name], "") for name in DIMENSIONS),
+        ]
+        monthly = select(
+            *key,
+            func.round(func.sum(_transactions.c.Amount), 2),
+            func.count(),
+            func.min(_transactions.c.Amount),
+            func.max(_transactions.c.Amount),
+        ).where(
+            _transactions.c.Date.isnot(None), _transactions.c.Amount.isnot(None)
+        ).group_by(*key)
+
+        try:
+            db.execute(delete(_rollups))
+            db.execute(insert(_rollups).from_select(
+                ["YearMonth", *DIMENSIONS, "Total", "Count", "MinAmount", "MaxAmount"], monthly
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error rebuilding monthly rollups: {str(e)}")
+            raise
+
+        table_versions.bump(_rollups.name)
+        count = db.execute(select(func.count()).select_from(_rollups)).scalar_one()
+        logger.info(f"Rebuilt {count} monthly rollups")
+        return count
+
+
+class AsyncCRUDMonthlyRollup:
+    """AsyncSession queries over the monthly rollups used by the API handlers."""
+
+    async def query(
+        self,
+        db: AsyncSession,
+        *,
+        query_filter: QueryFilter,
+        group_by: Sequence[str] = DIMENSIONS
+    ) -> List[dict]:
+        """Get monthly totals grouped by YearMonth and the requested dimensions.
+
+        Args:
+            db: Database session
+            query_filter: Filters on YearMonth and the dimensions, and sort order
+            group_by: Dimensions to keep; the others are summed over
+
+        Returns:
+            List[dict]: One row per month and dimension combination
+
+        Raises:
+            InvalidFilterError: If a filter or sort field is not allowed
+        """
+        result = await db.execute(_rollup_query(query_filter, group_by))
+        return [dict(row) for row in result.mappings()]
+
+
+monthly_rollup = CRUDMonthlyRollup()
+async_monthly_rollup = AsyncCRUDMonthlyRollup()
+
+
+def ensure_rollups(engine: Engine) -> bool:
+    """Create the rollup table, (re)install its triggers and backfill it when empty.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        bool: True if the rollups were rebuilt
+    """
+    if _transactions.name not in set(inspect(engine).get_table_names()):
+        logger.warning(f"Skipping monthly rollups: '{_transactions.name}' is missing")
+        return False
+
+    _rollups.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        for name, ddl in TRIGGERS.items():
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            conn.execute(text(ddl))
+
+    with Session(engine) as db:
+        has_rollups = db.execute(select(_rollups.c.YearMonth).limit(1)).first()
+        has_transactions = db.execute(select(_transactions.c.TrNo).limit(1)).first()
+        if has_rollups or not has_transactions:
+            return False
+        monthly_rollup.rebuild(db)
+    return True
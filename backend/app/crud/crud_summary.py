@@ -0,0 +1,180 @@
+"""Aggregate queries behind the role dashboards."""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import AccountsPresent, FreedomFuture
+from app.models.transaction import Transaction
+from app.schemas.summary import DashboardSummary, GroupTotal, OutstandingFutures, SummaryRole, TypeTotal
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Sections computed for each role, mirroring what its dashboard renders
+ROLE_SECTIONS = {
+    SummaryRole.ca: ("accounts", "monthly_expenses"),
+    SummaryRole.budget_analyst: ("accounts", "monthly_expenses", "expenses", "outstanding"),
+    SummaryRole.owner: ("accounts", "monthly_expenses", "net", "outstanding"),
+}
+
+
+def _month_bounds(as_of: date) -> Tuple[datetime, datetime]:
+    """First instant of as_of's month and of the following month."""
+    start = datetime(as_of.year, as_of.month, 1)
+    if as_of.month == 12:
+        return start, datetime(as_of.year + 1, 1, 1)
+    return start, datetime(as_of.year, as_of.month + 1, 1)
+
+
+def _group_totals(totals: Dict[str, List[float]]) -> List[GroupTotal]:
+    return [
+        GroupTotal(name=name, count=int(count), amount=round(amount, 2))
+        for name, (count, amount) in sorted(totals.items())
+        if count
+    ]
+
+
+class AsyncCRUDSummary:
+    """GROUP BY aggregates for the CA, Budget Analyst and Owner dashboards."""
+
+    async def accounts_by_type(self, db: AsyncSession) -> List[TypeTotal]:
+        """Get the account count and balance per account Type.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List[TypeTotal]: One entry per Type
+        """
+        result = await db.execute(
+            select(AccountsPresent.Type, func.count(), func.coalesce(func.sum(AccountsPresent.Balance), 0))
+            .group_by(AccountsPresent.Type)
+            .order_by(AccountsPresent.Type)
+        )
+        return [
+            TypeTotal(Type=getattr(type_, "value", type_), count=count, balance=round(float(balance), 2))
+            for type_, count, balance in result
+        ]
+
+    async def monthly_expenses(self, db: AsyncSession, as_of: date) -> float:
+        """Get total debits dated in as_of's month.
+
+        Args:
+            db: Database session
+            as_of: Any day of the month to report
+
+        Returns:
+            float: Sum of the absolute debit amounts
+        """
+        start, end = _month_bounds(as_of)
+        total = await db.scalar(
+            select(func.coalesce(func.sum(-Transaction.Amount), 0)).where(
+                Transaction.Date >= start, Transaction.Date < end, Transaction.Amount < 0
+            )
+        )
+        return round(float(total), 2)
+
+    async def transaction_groups(
+        self, db: AsyncSession
+    ) -> Tuple[Dict[str, List[float]], Dict[str, List[float]], Dict[str, List[float]]]:
+        """Get debit totals per Department and Category, and net totals per Department.
+
+        One GROUP BY over (Department, Category) with conditional sums; the
+        handful of resulting rows are folded into the three breakdowns.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Tuple of {name: [count, amount]} for expenses by Department,
+            expenses by Category and net amount by Department
+        """
+        debit = Transaction.Amount < 0
+        result = await db.execute(
+            select(
+                Transaction.Department,
+                Transaction.Category,
+                func.sum(case((debit, 1), else_=0)),
+                func.coalesce(func.sum(case((debit, -Transaction.Amount), else_=0)), 0),
+                func.count(),
+                func.coalesce(func.sum(Transaction.Amount), 0),
+            ).group_by(Transaction.Department, Transaction.Category)
+        )
+        by_department = defaultdict(lambda: [0, 0.0])
+        by_category = defaultdict(lambda: [0, 0.0])
+        net = defaultdict(lambda: [0, 0.0])
+        for department, category, debits, expenses, count, amount in result:
+            department = department or "Unassigned"
+            category = category or "Uncategorised"
+            for totals, key in ((by_department, department), (by_category, category)):
+                totals[key][0] += debits
+                totals[key][1] += float(expenses)
+            net[department][0] += count
+            net[department][1] += float(amount)
+        return by_department, by_category, net
+
+    async def outstanding(self, db: AsyncSession, as_of: date) -> OutstandingFutures:
+        """Get unpaid future predictions due on/after as_of and overdue before it.
+
+        Args:
+            db: Database session
+            as_of: Day separating upcoming from overdue predictions
+
+        Returns:
+            OutstandingFutures: Counts and absolute totals
+        """
+        overdue = FreedomFuture.Date < as_of
+        amount = func.abs(FreedomFuture.Amount)
+        row = (await db.execute(
+            select(
+                func.sum(case((overdue, 0), else_=1)),
+                func.sum(case((overdue, 0), else_=amount)),
+                func.sum(case((overdue, 1), else_=0)),
+                func.sum(case((overdue, amount), else_=0)),
+            ).where(FreedomFuture.Paid == False)  # noqa: E712
+        )).one()
+        count, total, overdue_count, overdue_total = (value or 0 for value in row)
+        return OutstandingFutures(
+            count=count, total=round(float(total), 2),
+            overdue_count=overdue_count, overdue_total=round(float(overdue_total), 2),
+        )
+
+    async def dashboard(self, db: AsyncSession, role: SummaryRole, as_of: date) -> DashboardSummary:
+        """Compute the aggregates a role's dashboard displays.
+
+        Args:
+            db: Database session
+            role: Dashboard audience
+            as_of: Day the dashboard is viewed on
+
+        Returns:
+            DashboardSummary: Only the sections used by the role
+        """
+        sections = ROLE_SECTIONS[role]
+        summary = DashboardSummary(role=role, as_of=as_of)
+        logger.info(f"Building {role.value} dashboard summary as of {as_of}")
+
+        if "accounts" in sections:
+            summary.accounts_by_type = await self.accounts_by_type(db)
+            summary.account_count = sum(t.count for t in summary.accounts_by_type)
+            summary.total_balance = round(sum(t.balance for t in summary.accounts_by_type), 2)
+        if "monthly_expenses" in sections:
+            summary.monthly_expenses = await self.monthly_expenses(db, as_of)
+        if "expenses" in sections or "net" in sections:
+            by_department, by_category, net = await self.transaction_groups(db)
+            if "expenses" in sections:
+                summary.expenses_by_department = _group_totals(by_department)
+                summary.expenses_by_category = _group_totals(by_category)
+            if "net" in sections:
+                summary.net_by_department = _group_totals(net)
+        if "outstanding" in sections:
+            summary.outstanding = await self.outstanding(db, as_of)
+        return summary
+
+
+async_summary = AsyncCRUDSummary()
@@ -1,11 +1,73 @@
-from typing import List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from sqlalchemy import between
+from sqlalchemy import between, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
+from app.core.cache import table_versions
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.crud.fingerprint import fingerprint_owners, row_fingerprint, transaction_fingerprint
+from app.crud.ledger import BalanceLedger
+from app.models.models import AccountsPresent, BalanceCheckpoint, MonthlyRollup
 from app.models.transaction import Transaction
-from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.schemas.transaction import (
+    TransactionBulkResult,
+    TransactionBulkRowResult,
+    TransactionCreate,
+    TransactionUpdate,
+)
 
-class CRUDTransaction:
+logger = logging.getLogger(__name__)
+
+# A transaction write also moves account balances and checkpoints through
+# BalanceLedger, and the monthly rollups through their triggers
+WRITTEN_TABLES = (
+    Transaction.__tablename__,
+    AccountsPresent.__tablename__,
+    BalanceCheckpoint.__tablename__,
+    MonthlyRollup.__tablename__,
+)
+
+
+def _fingerprint(obj_in: TransactionCreate) -> str:
+    return transaction_fingerprint(
+        obj_in.Date, obj_in.Amount, obj_in.AccID, obj_in.PaymentMode, obj_in.Description
+    )
+
+
+def _transaction_values(obj_in: TransactionCreate) -> Dict[str, Any]:
+    # Convert Hand Loans to Hand_Loans for database storage
+    category = obj_in.Category
+    if category == 'Hand Loans':
+        category = 'Hand_Loans'
+
+    return dict(
+        Date=obj_in.Date,
+        Description=obj_in.Description,
+        Amount=obj_in.Amount,
+        PaymentMode=obj_in.PaymentMode,
+        AccID=obj_in.AccID,
+        Department=obj_in.Department,
+        Comments=obj_in.Comments,
+        Category=category,
+        ZohoMatch=obj_in.ZohoMatch,
+        Fingerprint=_fingerprint(obj_in)
+    )
+
+
+def _transaction_from_schema(obj_in: TransactionCreate) -> Transaction:
+    return Transaction(**_transaction_values(obj_in))
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class CRUDTransaction(CRUDBase[Transaction, TransactionCreate, TransactionUpdate]):
     def get_all(self, db: Session, skip: int = 0, limit: int = 100) -> List[Transaction]:
         return db.query(Transaction).offset(skip).limit(limit).all()
 
@@ -20,24 +82,10 @@ class CRUDTransaction:
         ).all()
 
     def create(self, db: Session, *, obj_in: TransactionCreate) -> Transaction:
-        # Convert Hand Loans to Hand_Loans for database storage
-        category = obj_in.Category
-        if category == 'Hand Loans':
-            category = 'Hand_Loans'
-
-        db_obj = Transaction(
-            Date=obj_in.Date,
-            Description=obj_in.Description,
-            Amount=obj_in.Amount,
-            PaymentMode=obj_in.PaymentMode,
-            AccID=obj_in.AccID,
-            Department=obj_in.Department,
-            Comments=obj_in.Comments,
-            Category=category,
-            ZohoMatch=obj_in.ZohoMatch
-        )
+        db_obj = _transaction_from_schema(obj_in)
         db.add(db_obj)
         db.commit()
+        table_versions.bump(*WRITTEN_TABLES)
         db.refresh(db_obj)
         return db_obj
 
@@ -47,15 +95,265 @@ class CRUDTransaction:
         update_data = obj_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_obj, field, value)
+        db_obj.Fingerprint = row_fingerprint(db_obj)
         db.add(db_obj)
         db.commit()
+        table_versions.bump(*WRITTEN_TABLES)
         db.refresh(db_obj)
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> Transaction:
-        obj = db.query(Transaction).get(id)
+        obj = db.get(Transaction, id)
         db.delete(obj)
         db.commit()
+        table_versions.bump(*WRITTEN_TABLES)
         return obj
 
-transaction = CRUDTransaction()
+    def create_many(
+        self,
+        db: Session,
+        *,
+        rows: Sequence[Union[TransactionCreate, Dict[str, Any]]]
+    ) -> TransactionBulkResult:
+        """Validate and insert a batch of transactions in one transaction.
+
+        Rows are validated individually and their AccIDs checked with a single
+        set lookup. Rows whose content fingerprint is already stored, or
+        repeats an earlier row of the batch, are flagged as duplicates after
+        one indexed lookup. Valid rows are inserted with one executemany, the
+        net balance change per account is applied by one BalanceLedger
+        statement, and everything commits together.
+        Invalid rows are reported without affecting the rest of the batch.
+
+        Args:
+            db: Database session
+            rows: Transactions as schemas or raw dicts
+
+        Returns:
+            TransactionBulkResult: Per-row results in input order
+        """
+        results: List[Optional[TransactionBulkRowResult]] = [None] * len(rows)
+        valid: List[Tuple[int, TransactionCreate]] = []
+        for index, row in enumerate(rows):
+            try:
+                obj_in = row if isinstance(row, TransactionCreate) else TransactionCreate.model_validate(row)
+            except ValidationError as e:
+                results[index] = TransactionBulkRowResult(
+                    index=index, status="error", error=_validation_message(e)
+                )
+                continue
+            valid.append((index, obj_in))
+
+        acc_ids = {obj_in.AccID for _, obj_in in valid}
+        known = set(db.scalars(
+            select(AccountsPresent.AccID).where(AccountsPresent.AccID.in_(acc_ids))
+        )) if acc_ids else set()
+
+        fingerprints = {index: _fingerprint(obj_in) for index, obj_in in valid}
+        owners = fingerprint_owners(db, fingerprints.values())
+        first_in_batch: Dict[str, int] = {}
+        to_insert = []
+        for index, obj_in in valid:
+            fingerprint = fingerprints[index]
+            if obj_in.AccID not in known:
+                results[index] = TransactionBulkRowResult(
+                    index=index, status="error",
+                    error=f"Account with ID {obj_in.AccID} not found"
+                )
+            elif fingerprint in owners:
+                results[index] = TransactionBulkRowResult(
+                    index=index, status="duplicate", TrNo=owners[fingerprint],
+                    error=f"Duplicate of transaction {owners[fingerprint]}"
+                )
+            elif fingerprint in first_in_batch:
+                results[index] = TransactionBulkRowResult(
+                    index=index, status="duplicate",
+                    error=f"Duplicate of row {first_in_batch[fingerprint]}"
+                )
+            else:
+                first_in_batch[fingerprint] = index
+                to_insert.append((index, obj_in))
+
+        ledger = BalanceLedger()
+        try:
+            if to_insert:
+                tr_nos = db.scalars(
+                    insert(Transaction).returning(Transaction.TrNo, sort_by_parameter_order=True),
+                    [_transaction_values(obj_in) for _, obj_in in to_insert],
+                ).all()
+                for (index, obj_in), tr_no in zip(to_insert, tr_nos):
+                    results[index] = TransactionBulkRowResult(index=index, status="created", TrNo=tr_no)
+                    ledger.add(obj_in.AccID, obj_in.Amount, on=obj_in.Date)
+            deltas = ledger.deltas
+            ledger.apply(db)
+            db.commit()
+            table_versions.bump(*WRITTEN_TABLES)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error in bulk transaction insert: {str(e)}")
+            raise
+
+        logger.info(f"Bulk inserted {len(to_insert)} of {len(rows)} transactions")
+        duplicates = sum(1 for result in results if result.status == "duplicate")
+        return TransactionBulkResult(
+            created=len(to_insert),
+            duplicates=duplicates,
+            failed=len(rows) - len(to_insert) - duplicates,
+            balance_changes={acc_id: float(delta) for acc_id, delta in deltas.items()},
+            results=results,
+        )
+
+transaction = CRUDTransaction(Transaction)
+
+
+class AsyncCRUDTransaction(AsyncCRUDBase[Transaction, TransactionCreate, TransactionUpdate]):
+    cursor_keys = ("Date", "TrNo")
+    filter_fields = ("TrNo", "PaymentMode", "AccID", "Department", "Category", "ZohoMatch")
+    range_fields = ("Date", "Amount")
+    sort_fields = ("TrNo", "Date", "Amount", "PaymentMode", "AccID", "Department", "Category")
+
+    def row_columns(self):
+        # The fingerprint is internal to duplicate detection, not a response field
+        return [column for column in super().row_columns() if column.key != "Fingerprint"]
+
+    def _coerce_filter_value(self, column, value, operator):
+        # Categories are stored as Hand_Loans but shown as Hand Loans
+        if column.key == "Category" and value == "Hand Loans":
+            return "Hand_Loans"
+        return super()._coerce_filter_value(column, value, operator)
+
+    async def get_all(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100
+    ) -> List[Transaction]:
+        result = await db.execute(select(Transaction).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_by_sl_no(self, db: AsyncSession, sl_no: int) -> Optional[Transaction]:
+        return await db.get(Transaction, sl_no)
+
+    async def get_by_date_range(
+        self, db: AsyncSession, start_date: datetime, end_date: datetime
+    ) -> List[Transaction]:
+        result = await db.execute(
+            select(Transaction).where(between(Transaction.Date, start_date, end_date))
+        )
+        return list(result.scalars().all())
+
+    async def get_by_fingerprint(self, db: AsyncSession, fingerprint: str) -> Optional[Transaction]:
+        """Get the transaction holding a content fingerprint.
+
+        Args:
+            db: Database session
+            fingerprint: Result of transaction_fingerprint
+
+        Returns:
+            Optional[Transaction]: Transaction with that content, None if there is none
+        """
+        result = await db.execute(select(Transaction).where(Transaction.Fingerprint == fingerprint))
+        return result.scalars().first()
+
+    async def create(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: TransactionCreate,
+        ledger: Optional[BalanceLedger] = None
+    ) -> Transaction:
+        """Create a transaction, committing any pending balance changes with it.
+
+        Args:
+            db: Database session
+            obj_in: Transaction data
+            ledger: Balance changes to apply in the same transaction
+
+        Returns:
+            Transaction: Created transaction
+        """
+        db_obj = _transaction_from_schema(obj_in)
+        db.add(db_obj)
+        if ledger:
+            await ledger.apply_async(db)
+        await db.commit()
+        table_versions.bump(*WRITTEN_TABLES)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Transaction,
+        obj_in: TransactionUpdate,
+        ledger: Optional[BalanceLedger] = None
+    ) -> Transaction:
+        """Update a transaction, committing any pending balance changes with it.
+
+        Args:
+            db: Database session
+            db_obj: Existing transaction
+            obj_in: Updated fields
+            ledger: Balance changes to apply in the same transaction
+
+        Returns:
+            Transaction: Updated transaction
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+        db_obj.Fingerprint = row_fingerprint(db_obj)
+        db.add(db_obj)
+        if ledger:
+            await ledger.apply_async(db)
+        await db.commit()
+        table_versions.bump(*WRITTEN_TABLES)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        ledger: Optional[BalanceLedger] = None
+    ) -> Optional[Transaction]:
+        """Delete a transaction, committing any pending balance changes with it.
+
+        Args:
+            db: Database session
+            id: Transaction number
+            ledger: Balance changes to apply in the same transaction
+
+        Returns:
+            Optional[Transaction]: Deleted transaction or None if it did not exist
+        """
+        obj = await db.get(Transaction, id)
+        if obj is None:
+            return None
+        await db.delete(obj)
+        if ledger:
+            await ledger.apply_async(db)
+        await db.commit()
+        table_versions.bump(*WRITTEN_TABLES)
+        return obj
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        rows: Sequence[Union[TransactionCreate, Dict[str, Any]]]
+    ) -> TransactionBulkResult:
+        """Validate and insert a batch of transactions in one transaction.
+
+        Runs CRUDTransaction.create_many on the session's sync facade so the
+        whole batch is one round of executemany and a single commit.
+
+        Args:
+            db: Database session
+            rows: Transactions as schemas or raw dicts
+
+        Returns:
+            TransactionBulkResult: Per-row results in input order
+        """
+        return await db.run_sync(lambda session: transaction.create_many(session, rows=rows))
+
+async_transaction = AsyncCRUDTransaction(Transaction)
@@ -0,0 +1,212 @@
+"""Declarative, whitelisted filtering and sorting compiled into SQL."""
+
+import enum
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Boolean
+from sqlalchemy.sql import ColumnElement
+
+from app.models.models import BooleanStr
+
+# Query parameter suffixes and the comparison they compile to
+RANGE_OPERATORS: Dict[str, Callable[[ColumnElement, Any], ColumnElement]] = {
+    "gte": lambda column, value: column >= value,
+    "gt": lambda column, value: column > value,
+    "lte": lambda column, value: column <= value,
+    "lt": lambda column, value: column < value,
+}
+IN_OPERATOR = "in"
+OPERATOR_SEPARATOR = "__"
+# Accepted spellings of boolean filter values
+BOOLEAN_VALUES: Dict[str, bool] = {"true": True, "1": True, "false": False, "0": False}
+
+
+class InvalidFilterError(ValueError):
+    """Raised when a filter or sort references a field that is not whitelisted."""
+
+
+@dataclass
+class QueryFilter:
+    """Parsed list filters and sort order.
+
+    Attributes:
+        equals: Field name to accepted values; one value compiles to ``=``,
+            several to ``IN``
+        ranges: (field name, operator, value) comparisons, operator being a
+            key of RANGE_OPERATORS
+        sort: (field name, descending) pairs in priority order
+    """
+
+    equals: Dict[str, List[str]] = field(default_factory=dict)
+    ranges: List[Tuple[str, str, str]] = field(default_factory=list)
+    sort: List[Tuple[str, bool]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.equals or self.ranges or self.sort)
+
+    def add_equals(self, name: str, *values: str) -> None:
+        """Add accepted values for a field, e.g. from a legacy query parameter."""
+        self.equals.setdefault(name, []).extend(values)
+
+
+def parse_sort(sort: Optional[str]) -> List[Tuple[str, bool]]:
+    """Parse ``-Date,TrNo`` style sort strings.
+
+    Args:
+        sort: Comma separated field names, ``-`` prefix for descending
+
+    Returns:
+        List[Tuple[str, bool]]: (field name, descending) pairs
+    """
+    if not sort:
+        return []
+    keys = []
+    for part in sort.split(","):
+        part = part.strip()
+        if part:
+            keys.append((part.lstrip("-"), part.startswith("-")))
+    return keys
+
+
+def parse_query_params(
+    params: Iterable[Tuple[str, str]],
+    sort: Optional[str] = None,
+    reserved: Iterable[str] = ()
+) -> QueryFilter:
+    """Build a QueryFilter from raw query parameters.
+
+    ``Field=value`` (repeatable) filters on equality, ``Field__in=a,b`` on a
+    list of values and ``Field__gte/gt/lte/lt=value`` on ranges. Parameters
+    listed in ``reserved`` belong to the endpoint itself and are skipped.
+
+    Args:
+        params: Query parameter (name, value) pairs
+        sort: Sort string, see parse_sort
+        reserved: Parameter names handled by the endpoint
+
+    Returns:
+        QueryFilter: Parsed filters
+
+    Raises:
+        InvalidFilterError: If an operator suffix is unknown
+    """
+    reserved = set(reserved) | {"sort"}
+    query_filter = QueryFilter(sort=parse_sort(sort))
+    for name, value in params:
+        if name in reserved:
+            continue
+        base, _, operator = name.partition(OPERATOR_SEPARATOR)
+        if not operator:
+            query_filter.add_equals(base, value)
+        elif operator == IN_OPERATOR:
+            query_filter.add_equals(base, *[v.strip() for v in value.split(",") if v.strip()])
+        elif operator in RANGE_OPERATORS:
+            query_filter.ranges.append((base, operator, value))
+        else:
+            raise InvalidFilterError(f"Unknown filter operator '{operator}' in '{name}'")
+    return query_filter
+
+
+def coerce_value(column: ColumnElement, value: str, operator: Optional[str] = None) -> Any:
+    """Convert a query string value to the Python type of a column.
+
+    A bare date compared with ``lte``/``gt`` on a datetime column covers the
+    whole day.
+
+    Args:
+        column: Column being filtered
+        value: Raw query string value
+        operator: Range operator, if any
+
+    Returns:
+        Any: Value typed for binding against the column
+
+    Raises:
+        InvalidFilterError: If the value cannot be converted
+    """
+    # BooleanStr reports python_type object, so booleans are matched on the column type
+    if isinstance(column.type, (BooleanStr, Boolean)):
+        flag = value.strip().lower()
+        if flag not in BOOLEAN_VALUES:
+            raise InvalidFilterError(f"Invalid value '{value}' for {column.key}")
+        return BOOLEAN_VALUES[flag]
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    try:
+        if python_type is datetime:
+            if len(value) == 10:
+                day = date.fromisoformat(value)
+                return datetime.combine(day, time.max if operator in ("lte", "gt") else time.min)
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value[:10])
+        if issubclass(python_type, enum.Enum):
+            try:
+                return python_type(value)
+            except ValueError:
+                return python_type[value]
+        if python_type is Decimal:
+            return Decimal(value)
+        return python_type(value)
+    except (ValueError, KeyError, TypeError, InvalidOperation) as e:
+        raise InvalidFilterError(f"Invalid value '{value}' for {column.key}") from e
+
+
+def compile_filter(
+    model: Any,
+    query_filter: QueryFilter,
+    *,
+    filter_fields: Sequence[str],
+    range_fields: Sequence[str],
+    sort_fields: Sequence[str],
+    coerce: Callable[[ColumnElement, str, Optional[str]], Any] = coerce_value
+) -> Tuple[List[ColumnElement], List[Tuple[ColumnElement, bool]]]:
+    """Compile a QueryFilter against a model's whitelisted fields.
+
+    Args:
+        model: SQLAlchemy model class
+        query_filter: Parsed filters
+        filter_fields: Fields allowed in equality and IN filters
+        range_fields: Fields allowed in range filters
+        sort_fields: Fields allowed in the sort order
+        coerce: Converts raw values to column types
+
+    Returns:
+        Tuple of WHERE clauses and (column, descending) sort keys
+
+    Raises:
+        InvalidFilterError: If a field is not whitelisted or a value is invalid
+    """
+    clauses = []
+    for name, values in query_filter.equals.items():
+        if name not in filter_fields:
+            raise InvalidFilterError(
+                f"Cannot filter on '{name}'; allowed: {', '.join(filter_fields)}"
+            )
+        column = getattr(model, name)
+        typed = [coerce(column, value, None) for value in values]
+        clauses.append(column == typed[0] if len(typed) == 1 else column.in_(typed))
+
+    for name, operator, value in query_filter.ranges:
+        if name not in range_fields:
+            raise InvalidFilterError(
+                f"Cannot range filter on '{name}'; allowed: {', '.join(range_fields)}"
+            )
+        column = getattr(model, name)
+        clauses.append(RANGE_OPERATORS[operator](column, coerce(column, value, operator)))
+
+    order = []
+    for name, descending in query_filter.sort:
+        if name not in sort_fields:
+            raise InvalidFilterError(
+                f"Cannot sort on '{name}'; allowed: {', '.join(sort_fields)}"
+            )
+        order.append((getattr(model, name), descending))
+    return clauses, order
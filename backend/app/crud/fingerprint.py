@@ -0,0 +1,209 @@
+"""Content fingerprints that keep duplicate transactions out of Transactions(Past)."""
+
+import hashlib
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import bindparam, inspect, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.transaction import Transaction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_COLUMNS = ("Date", "Amount", "AccID", "PaymentMode", "Description")
+
+_transactions = Transaction.__table__
+
+
+def _text(value: Any) -> str:
+    value = getattr(value, "name", value)
+    return " ".join(str(value or "").split()).lower()
+
+
+def transaction_fingerprint(
+    date_value: Any,
+    amount: Any,
+    acc_id: Any,
+    payment_mode: Any,
+    description: Any
+) -> str:
+    """Hash the identifying content of a transaction.
+
+    Values are normalized first, so a re-imported row differing only in the
+    time of day, float noise in the amount, case or whitespace gets the same
+    fingerprint.
+
+    Args:
+        date_value: Transaction date, datetime or ISO string
+        amount: Signed amount
+        acc_id: Account ID
+        payment_mode: Payment mode name or enum member
+        description: Description
+
+    Returns:
+        str: 32 character hex digest
+    """
+    if isinstance(date_value, datetime):
+        day = date_value.date().isoformat()
+    elif isinstance(date_value, date):
+        day = date_value.isoformat()
+    else:
+        day = str(date_value or "")[:10]
+    cents = "" if amount is None else str(Decimal(str(amount)).quantize(Decimal("0.01")))
+    content = "|".join((day, cents, _text(acc_id), _text(payment_mode), _text(description)))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def row_fingerprint(row: Any) -> str:
+    """Fingerprint of a mapping or object with the Transactions(Past) columns.
+
+    Args:
+        row: Dict of column values, Row mapping or Transaction
+
+    Returns:
+        str: Result of transaction_fingerprint
+    """
+    if isinstance(row, Mapping):
+        return transaction_fingerprint(*(row.get(name) for name in FINGERPRINT_COLUMNS))
+    return transaction_fingerprint(*(getattr(row, name, None) for name in FINGERPRINT_COLUMNS))
+
+
+def has_fingerprint_column(engine: Engine) -> bool:
+    """Check whether Transactions(Past) has its Fingerprint column yet.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        bool: False for databases that predate the column or lack the table
+    """
+    inspector = inspect(engine)
+    if _transactions.name not in inspector.get_table_names():
+        return False
+    return "Fingerprint" in {column["name"] for column in inspector.get_columns(_transactions.name)}
+
+
+def computed_owners(db: Session) -> Dict[str, int]:
+    """Fingerprint every stored transaction in memory, without writing.
+
+    Used where the column cannot be added, such as dry runs against a
+    database that predates it. As in the backfill, the lowest TrNo owns a
+    fingerprint its duplicates share.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict[str, int]: Fingerprint -> TrNo of the row that would hold it
+    """
+    owners: Dict[str, int] = {}
+    for row in db.execute(
+        select(_transactions.c.TrNo, *(_transactions.c[name] for name in FINGERPRINT_COLUMNS))
+        .order_by(_transactions.c.TrNo)
+    ).mappings():
+        owners.setdefault(row_fingerprint(row), row["TrNo"])
+    return owners
+
+
+def is_fingerprint_conflict(error: IntegrityError) -> bool:
+    """Check whether a failed write collided with the fingerprint unique index.
+
+    Args:
+        error: Error raised by a flush or commit
+
+    Returns:
+        bool: True if another row already holds the fingerprint
+    """
+    return "Fingerprint" in str(error.orig)
+
+
+def fingerprint_owners(
+    db: Session,
+    fingerprints: Iterable[str],
+    batch_size: Optional[int] = None
+) -> Dict[str, int]:
+    """Find the transactions already holding some fingerprints.
+
+    One indexed IN lookup is issued per batch of fingerprints.
+
+    Args:
+        db: Database session
+        fingerprints: Fingerprints to look up
+        batch_size: Fingerprints per query, defaults to settings.IMPORT_BATCH_SIZE
+
+    Returns:
+        Dict[str, int]: Fingerprint -> TrNo of the row holding it
+    """
+    size = batch_size or settings.IMPORT_BATCH_SIZE
+    wanted = sorted(set(fingerprints))
+    owners: Dict[str, int] = {}
+    for start in range(0, len(wanted), size):
+        for row in db.execute(
+            select(_transactions.c.Fingerprint, _transactions.c.TrNo)
+            .where(_transactions.c.Fingerprint.in_(wanted[start:start + size]))
+        ):
+            owners[row.Fingerprint] = row.TrNo
+    return owners
+
+
+def ensure_fingerprints(engine: Engine) -> List[int]:
+    """Add the fingerprint column and unique index if needed and backfill them.
+
+    Rows without a fingerprint get one in TrNo order. A row whose content
+    is already fingerprinted by an earlier row is left NULL and reported:
+    it is a duplicate that predates the index.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        List[int]: TrNos of the duplicates left without a fingerprint
+    """
+    if _transactions.name not in inspect(engine).get_table_names():
+        logger.warning(f"Skipping fingerprints: '{_transactions.name}' is missing")
+        return []
+    if not has_fingerprint_column(engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f'ALTER TABLE "{_transactions.name}" ADD COLUMN "Fingerprint" VARCHAR')
+        logger.info(f"Added Fingerprint column to '{_transactions.name}'")
+
+    duplicates = []
+    with Session(engine) as db:
+        pending = db.execute(
+            select(_transactions.c.TrNo, *(_transactions.c[name] for name in FINGERPRINT_COLUMNS))
+            .where(_transactions.c.Fingerprint.is_(None))
+            .order_by(_transactions.c.TrNo)
+        ).mappings().all()
+        if pending:
+            computed = [(row["TrNo"], row_fingerprint(row)) for row in pending]
+            taken = fingerprint_owners(db, (fingerprint for _, fingerprint in computed))
+            params = []
+            for tr_no, fingerprint in computed:
+                if fingerprint in taken:
+                    duplicates.append(tr_no)
+                    continue
+                taken[fingerprint] = tr_no
+                params.append({"key_TrNo": tr_no, "new_Fingerprint": fingerprint})
+            if params:
+                db.execute(
+                    update(_transactions)
+                    .where(_transactions.c.TrNo == bindparam("key_TrNo"))
+                    .values(Fingerprint=bindparam("new_Fingerprint")),
+                    params,
+                )
+            db.commit()
+            logger.info(f"Fingerprinted {len(params)} transactions")
+        if duplicates:
+            logger.warning(f"Transactions duplicating earlier rows, left without a fingerprint: {duplicates}")
+
+    for index in _transactions.indexes:
+        if "Fingerprint" in index.columns:
+            index.create(bind=engine, checkfirst=True)
+    return duplicates
@@ -0,0 +1,108 @@
+"""Atomic, coalesced account balance updates."""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Optional, Tuple, Union
+
+from sqlalchemy import case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Update
+
+from app.crud.crud_checkpoint import checkpoint_statements
+from app.models.models import AccountsPresent
+
+logger = logging.getLogger(__name__)
+
+Amount = Union[Decimal, float, int, str]
+
+
+class BalanceLedger:
+    """Collects balance deltas per AccID and applies them in one statement.
+
+    The UPDATE adds to the stored balance (``Balance = Balance + delta``)
+    instead of writing back a value computed in Python, so concurrent
+    writers cannot overwrite each other's adjustments. Deltas for the same
+    account are summed, and all accounts are updated by a single statement
+    that runs in the caller's transaction.
+
+    Dated deltas (transaction writes) are also folded into the daily
+    BalanceCheckpoints in the same transaction.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: Dict[str, Decimal] = defaultdict(Decimal)
+        self._day_deltas: Dict[Tuple[str, date], Decimal] = defaultdict(Decimal)
+
+    def add(self, acc_id: str, amount: Amount, on: Optional[date] = None) -> None:
+        """Record a balance change for an account.
+
+        Args:
+            acc_id: Account ID (AccID)
+            amount: Amount to adjust (positive for credit, negative for debit)
+            on: Transaction date; undated changes skip the daily checkpoints
+        """
+        amount = Decimal(str(amount))
+        self._deltas[acc_id] += amount
+        if on is not None:
+            day = on.date() if isinstance(on, datetime) else on
+            self._day_deltas[(acc_id, day)] += amount
+
+    @property
+    def deltas(self) -> Dict[str, Decimal]:
+        """Net non-zero change per account."""
+        return {acc_id: delta for acc_id, delta in self._deltas.items() if delta}
+
+    def statement(self) -> Optional[Update]:
+        """Build the coalesced UPDATE, or None when nothing changes."""
+        deltas = self.deltas
+        if not deltas:
+            return None
+        table = AccountsPresent.__table__
+        return (
+            table.update()
+            .where(table.c.AccID.in_(list(deltas)))
+            .values(Balance=table.c.Balance + case(deltas, value=table.c.AccID, else_=0))
+        )
+
+    def _applied(self, rowcount: int) -> int:
+        deltas = self.deltas
+        if rowcount != len(deltas):
+            logger.warning(f"Balance update matched {rowcount} of {len(deltas)} accounts")
+        if deltas:
+            logger.info(f"Applied balance changes to {rowcount} accounts: {deltas}")
+        self._deltas.clear()
+        self._day_deltas.clear()
+        return rowcount
+
+    def apply(self, db: Session) -> int:
+        """Apply and clear the pending deltas without committing.
+
+        Args:
+            db: Database session
+
+        Returns:
+            int: Number of accounts updated
+        """
+        for stmt, params in checkpoint_statements(self._day_deltas):
+            db.execute(stmt, params)
+        stmt = self.statement()
+        rowcount = db.execute(stmt).rowcount if stmt is not None else 0
+        return self._applied(rowcount)
+
+    async def apply_async(self, db: AsyncSession) -> int:
+        """Apply and clear the pending deltas without committing.
+
+        Args:
+            db: Database session
+
+        Returns:
+            int: Number of accounts updated
+        """
+        for stmt, params in checkpoint_statements(self._day_deltas):
+            await db.execute(stmt, params)
+        stmt = self.statement()
+        rowcount = (await db.execute(stmt)).rowcount if stmt is not None else 0
+        return self._applied(rowcount)
@@ -0,0 +1,185 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import and_, false, or_, tuple_
+from sqlalchemy.sql import ColumnElement, Select
+
+ItemType = TypeVar("ItemType")
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded for the requested keys."""
+
+
+@dataclass
+class Page(Generic[ItemType]):
+    """One page of a keyset-paginated query.
+
+    Attributes:
+        items: Records on this page
+        next_cursor: Opaque cursor for the following page, None on the last page
+    """
+
+    items: List[ItemType] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any, column: ColumnElement) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the key values of the last row on a page as an opaque cursor.
+
+    Args:
+        values: Key column values in key order
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[ColumnElement]) -> List[Any]:
+    """Decode a cursor back into typed key values.
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+        keys: Key columns the cursor was built from
+
+    Returns:
+        List[Any]: Key values typed for the key columns
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the keys
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise InvalidCursorError("Cursor does not match the pagination keys")
+        return [_decode_value(value, key) for value, key in zip(values, keys)]
+    except InvalidCursorError:
+        raise
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {str(e)}") from e
+
+
+def _nullable(key: ColumnElement) -> bool:
+    return getattr(key, "nullable", True)
+
+
+def _order(key: ColumnElement, desc: bool) -> ColumnElement:
+    """Sort a key with NULLs before every value, as SQLite does by default."""
+    if not _nullable(key):
+        return key.desc() if desc else key
+    return key.desc().nulls_last() if desc else key.nulls_first()
+
+
+def _step(key: ColumnElement, value: Any, desc: bool) -> ColumnElement:
+    """Rows strictly past a key value in the _order direction."""
+    if value is None:
+        return false() if desc else key.is_not(None)
+    if desc:
+        return or_(key < value, key.is_(None)) if _nullable(key) else key < value
+    return key > value
+
+
+def _seek_clause(
+    keys: Sequence[ColumnElement],
+    values: Sequence[Any],
+    descending: Sequence[bool]
+) -> ColumnElement:
+    """Build the "after this row" condition for a key order."""
+    # Row-value comparisons are NULL against a NULL key, so they only serve
+    # cursors without NULLs, and descending keys only when they cannot be NULL
+    comparable = all(value is not None for value in values) and not any(
+        desc and _nullable(key) for key, desc in zip(keys, descending)
+    )
+    if comparable and not any(descending):
+        return keys[0] > values[0] if len(keys) == 1 else tuple_(*keys) > tuple_(*values)
+    if comparable and all(descending):
+        return keys[0] < values[0] if len(keys) == 1 else tuple_(*keys) < tuple_(*values)
+
+    # Expanded form: (a > x) OR (a = x AND b < y) OR ...
+    alternatives = []
+    for i, (key, value, desc) in enumerate(zip(keys, values, descending)):
+        equal = [keys[j].is_(None) if values[j] is None else keys[j] == values[j] for j in range(i)]
+        alternatives.append(and_(*equal, _step(key, value, desc)))
+    return or_(*alternatives)
+
+
+def keyset_query(
+    stmt: Select,
+    keys: Sequence[ColumnElement],
+    cursor: Optional[str],
+    limit: int,
+    descending: Optional[Sequence[bool]] = None
+) -> Select:
+    """Restrict a select to the page after a cursor, ordered by the keys.
+
+    One extra row is fetched so the caller can tell whether a next page exists.
+
+    Args:
+        stmt: Base select statement with any filters applied
+        keys: Key columns ending in a unique one, e.g. (Date, TrNo)
+        cursor: Cursor of the previous page, or None for the first page
+        limit: Page size
+        descending: Per-key sort direction, ascending if omitted
+
+    Returns:
+        Select: Statement seeking past the cursor
+    """
+    descending = list(descending) if descending else [False] * len(keys)
+    if cursor:
+        stmt = stmt.where(_seek_clause(keys, decode_cursor(cursor, keys), descending))
+    order = [_order(key, desc) for key, desc in zip(keys, descending)]
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def build_page(
+    rows: Sequence[ItemType],
+    keys: Sequence[ColumnElement],
+    limit: int
+) -> Page[ItemType]:
+    """Trim the look-ahead row and compute the next cursor.
+
+    Args:
+        rows: Rows returned by a keyset_query statement
+        keys: Key columns used for the query
+        limit: Page size
+
+    Returns:
+        Page[ItemType]: Page items and the cursor of the next page
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+    return Page(items=items, next_cursor=next_cursor)
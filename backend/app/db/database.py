@@ -1,37 +1,18 @@
 """Database configuration and session management."""
 
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
 from typing import Generator
-import os
 from sqlalchemy.ext.declarative import declarative_base
 from app.models.models import Base
+from app.db.session import engine, SessionLocal
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# Get the absolute path to the database file
-DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../kaas.db'))
-logger.debug(f"Database path: {DB_PATH}")
-
-# Database URL - Using SQLite for development
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
-logger.debug(f"Database URL: {SQLALCHEMY_DATABASE_URL}")
-
-# Create SQLAlchemy engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
-    echo=True  # Enable SQL query logging
-)
-
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 Base = declarative_base()
 
 def get_db() -> Generator[Session, None, None]:
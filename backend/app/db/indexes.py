@@ -0,0 +1,167 @@
+"""Managed secondary indexes and query-plan coverage checks."""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from sqlalchemy import func, inspect, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Select
+
+from app.models.models import AccountsPresent, FreedomFuture, TransactionsPast
+
+logger = logging.getLogger(__name__)
+
+MANAGED_TABLES = (
+    TransactionsPast.__table__,
+    AccountsPresent.__table__,
+    FreedomFuture.__table__,
+)
+
+# Managed indexes that were replaced by wider ones and are dropped when found
+RETIRED_INDEXES: Dict[str, List[str]] = {
+    "Transactions(Past)": ["ix_transactions_past_date"],
+    "Freedom(Future)": ["ix_freedom_future_paid_date"],
+}
+
+# Statements mirroring the hot lookups in app/crud/*. Bound values do not
+# influence SQLite's plan, so they are only placeholders.
+HOT_QUERIES: Dict[str, Callable[[], Select]] = {
+    "CRUDTransaction.get_by_date_range": lambda: select(TransactionsPast).where(
+        TransactionsPast.Date.between("2024-01-01", "2024-01-31")
+    ),
+    "CRUDAccount.get_by_cc_id": lambda: select(AccountsPresent).where(
+        AccountsPresent.AccID == "EMI - 001"
+    ),
+    "CRUDAccount.get_accounts_due": lambda: select(AccountsPresent).where(
+        AccountsPresent.NextDueDate == "5th of Each Month"
+    ),
+    "CRUDFuture.get_unpaid": lambda: select(FreedomFuture).where(
+        FreedomFuture.Paid == False  # noqa: E712 - BooleanStr comparison
+    ).order_by(FreedomFuture.Date),
+    "AsyncCRUDTransaction.get_page": lambda: select(TransactionsPast).where(
+        tuple_(TransactionsPast.Date, TransactionsPast.TrNo) > tuple_("2024-01-01", 0)
+    ).order_by(TransactionsPast.Date, TransactionsPast.TrNo).limit(101),
+    "AsyncCRUDFuture.get_page_by_date_range": lambda: select(FreedomFuture).where(
+        FreedomFuture.Paid == False,  # noqa: E712 - BooleanStr comparison
+        tuple_(FreedomFuture.Date, FreedomFuture.TrNo) > tuple_("2024-01-01", 0)
+    ).order_by(FreedomFuture.Date, FreedomFuture.TrNo).limit(101),
+    "AsyncCRUDCalendar.transaction_days": lambda: select(
+        TransactionsPast.Date, func.count(), func.sum(TransactionsPast.Amount)
+    ).where(
+        TransactionsPast.Date >= "2024-01-01", TransactionsPast.Date < "2024-02-01"
+    ).group_by(TransactionsPast.Date),
+    "AsyncCRUDCalendar.future_entries": lambda: select(FreedomFuture).where(
+        FreedomFuture.Paid.in_([False, True]),
+        FreedomFuture.Date >= "2024-01-01",
+        FreedomFuture.Date < "2024-02-01",
+    ),
+}
+
+
+@dataclass
+class QueryPlan:
+    """EXPLAIN QUERY PLAN result for a single hot query.
+
+    Attributes:
+        name: Hot query name
+        details: Plan detail lines reported by SQLite
+    """
+
+    name: str
+    details: List[str]
+
+    @property
+    def covered(self) -> bool:
+        """Whether the query avoids full table scans and temporary sorts."""
+        for detail in self.details:
+            if "TEMP B-TREE" in detail:
+                return False
+            if detail.startswith("SCAN") and "USING" not in detail:
+                return False
+        return True
+
+
+def ensure_indexes(engine: Engine) -> List[str]:
+    """Create any managed index that is missing from the database.
+
+    Tables created by ``create_all`` already carry these indexes; this covers
+    ``kaas.db`` files that were loaded from Excel or predate the index set.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        List[str]: Names of the indexes that were created
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+
+    for table in MANAGED_TABLES:
+        if table.name not in existing_tables:
+            logger.warning(f"Skipping indexes for missing table '{table.name}'")
+            continue
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for name in RETIRED_INDEXES.get(table.name, []):
+            if name in existing:
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(f'DROP INDEX "{name}"')
+                logger.info(f"Dropped retired index {name} on '{table.name}'")
+
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name in existing:
+                continue
+            try:
+                index.create(bind=engine)
+                created.append(index.name)
+                logger.info(f"Created index {index.name} on '{table.name}'")
+            except SQLAlchemyError as e:
+                logger.error(f"Could not create index {index.name}: {str(e)}")
+
+    return created
+
+
+def explain_hot_queries(engine: Engine) -> List[QueryPlan]:
+    """Run EXPLAIN QUERY PLAN for every registered hot query.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        List[QueryPlan]: One plan per hot query
+    """
+    plans = []
+    with engine.connect() as conn:
+        for name, build in HOT_QUERIES.items():
+            compiled = build().compile(
+                dialect=engine.dialect, compile_kwargs={"render_postcompile": True}
+            )
+            params = tuple(None for _ in compiled.positiontup or ())
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+            plans.append(QueryPlan(name=name, details=[row[3] for row in rows]))
+    return plans
+
+
+def check_indexes(engine: Engine) -> List[QueryPlan]:
+    """Create missing indexes and log which hot queries they cover.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        List[QueryPlan]: Plans for the hot queries after index creation
+    """
+    created = ensure_indexes(engine)
+    if created:
+        logger.info(f"Created {len(created)} missing indexes: {created}")
+
+    plans = explain_hot_queries(engine)
+    for plan in plans:
+        if plan.covered:
+            logger.info(f"Hot query {plan.name} is index-covered: {plan.details}")
+        else:
+            logger.warning(f"Hot query {plan.name} is NOT index-covered: {plan.details}")
+    return plans
@@ -1,6 +1,6 @@
 import logging
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 from .session import engine, SessionLocal
 from ..models.models import Base, TransactionsPast, AccountsPresent  # Import from models.py
 
@@ -25,7 +25,7 @@ def init_db() -> None:
         db = SessionLocal()
         try:
             # Test the connection
-            db.execute("SELECT 1")
+            db.execute(text("SELECT 1"))
             logger.info("Database connection successful")
         except SQLAlchemyError as e:
             logger.error(f"Database connection failed: {e}")
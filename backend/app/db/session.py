@@ -1,21 +1,141 @@
 """Database session management."""
 
 import logging
+from typing import Any, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from ..core.config import settings
+from ..core.config import Settings, settings
 
 logger = logging.getLogger(__name__)
 
-# Create engine with echo=True for debugging and allow SQLite to be used across threads
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=True,  # This will log all SQL statements
-    pool_pre_ping=True,
-    connect_args={"check_same_thread": False}  # Allow SQLite to be used across threads
-)
+
+def _is_memory_database(database_url: str) -> bool:
+    """Check whether a SQLite URL points at an in-memory database."""
+    url = make_url(database_url)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, config: Settings = settings) -> None:
+    """Apply the configured performance pragmas to a raw SQLite connection.
+
+    Args:
+        dbapi_connection: DBAPI connection (pysqlite or aiosqlite adapter)
+        config: Settings holding the pragma values
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={int(config.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size={int(config.SQLITE_CACHE_SIZE)}")
+        cursor.execute(f"PRAGMA temp_store={config.SQLITE_TEMP_STORE}")
+        cursor.execute(f"PRAGMA busy_timeout={int(config.SQLITE_BUSY_TIMEOUT)}")
+    finally:
+        cursor.close()
+
+
+def async_database_url(database_url: str) -> str:
+    """Translate a SQLite URL to its aiosqlite equivalent.
+
+    Args:
+        database_url: Synchronous SQLite URL (``sqlite:///...``)
+
+    Returns:
+        str: URL using the ``sqlite+aiosqlite`` driver
+    """
+    url = make_url(database_url)
+    if url.drivername == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+def engine_options(
+    database_url: str,
+    config: Settings = settings,
+    **overrides: Any
+) -> dict:
+    """Build create_engine keyword arguments for a database URL.
+
+    Args:
+        database_url: SQLAlchemy database URL
+        config: Settings holding echo and pool configuration
+        **overrides: Extra create_engine arguments that take precedence
+
+    Returns:
+        dict: Keyword arguments for create_engine/create_async_engine
+    """
+    options = {
+        "echo": config.DB_ECHO,
+        "pool_pre_ping": True,
+        "connect_args": {"check_same_thread": False},  # Allow SQLite to be used across threads
+    }
+    # Pool sizing only applies to the default queue pool of file databases
+    if not _is_memory_database(database_url) and "poolclass" not in overrides:
+        options.update(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+        )
+    options.update(overrides)
+    return options
+
+
+def create_db_engine(
+    database_url: Optional[str] = None,
+    config: Settings = settings,
+    **overrides: Any
+) -> Engine:
+    """Create a SQLite engine with the tuned pragmas applied on every connection.
+
+    Args:
+        database_url: Database URL, defaults to ``settings.DATABASE_URL``
+        config: Settings holding pool and pragma configuration
+        **overrides: Extra create_engine arguments that take precedence
+
+    Returns:
+        Engine: Configured SQLAlchemy engine
+    """
+    database_url = database_url or config.DATABASE_URL
+    db_engine = create_engine(database_url, **engine_options(database_url, config, **overrides))
+
+    @event.listens_for(db_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, config)
+
+    return db_engine
+
+
+def create_async_db_engine(
+    database_url: Optional[str] = None,
+    config: Settings = settings,
+    **overrides: Any
+) -> AsyncEngine:
+    """Create an aiosqlite engine with the same pragmas and pool settings.
+
+    Args:
+        database_url: Database URL, defaults to ``settings.DATABASE_URL``
+        config: Settings holding pool and pragma configuration
+        **overrides: Extra create_async_engine arguments that take precedence
+
+    Returns:
+        AsyncEngine: Configured async SQLAlchemy engine
+    """
+    database_url = async_database_url(database_url or config.DATABASE_URL)
+    db_engine = create_async_engine(database_url, **engine_options(database_url, config, **overrides))
+
+    @event.listens_for(db_engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, config)
+
+    return db_engine
+
+
+engine = create_db_engine()
+async_engine = create_async_db_engine()
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -24,6 +144,15 @@ SessionLocal = sessionmaker(
     class_=Session,  # Explicitly specify Session class
 )
 
+# Objects stay loaded after commit so responses can be serialized without
+# triggering lazy IO outside the event loop
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
 
 def test_connection() -> bool:
     """
@@ -32,9 +161,9 @@ def test_connection() -> bool:
     Returns:
         bool: True if connection is successful, False otherwise
     """
+    db = SessionLocal()
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
+        db.execute(text("SELECT 1"))
         logger.info("Database connection test successful")
         return True
     except Exception as e:
@@ -44,6 +173,4 @@ def test_connection() -> bool:
         db.close()
 
 
-# Add diagnostic logging
-logger.debug(f"SessionLocal type: {type(SessionLocal)}")
-logger.debug(f"Engine type: {type(engine)}")
+logger.debug(f"Database URL: {engine.url}")
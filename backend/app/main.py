@@ -5,7 +5,15 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_v1.api import api_router
+from app.api.response_cache import CACHE_STATUS_HEADER
 from app.core.config import settings
+from app.crud.crud_checkpoint import ensure_checkpoints
+from app.crud.crud_rollup import ensure_rollups
+from app.crud.fingerprint import ensure_fingerprints
+from app.crud.pagination import NEXT_CURSOR_HEADER
+from app.db.session import engine
+from app.db.indexes import check_indexes
+from app.services.statements import shutdown_parse_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +32,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, CACHE_STATUS_HEADER, "ETag"],
 )
 
 # Include API router
@@ -41,7 +50,23 @@ async def startup_event():
     Initialize services and verify database connection on startup.
     """
     logger.info("Starting up BMS Serendipity API")
-    # Add any startup initialization here
+    try:
+        # Before the index check, which manages the fingerprint's unique index
+        ensure_fingerprints(engine)
+    except Exception as e:
+        logger.error(f"Transaction fingerprint backfill failed: {str(e)}")
+    try:
+        check_indexes(engine)
+    except Exception as e:
+        logger.error(f"Index check failed: {str(e)}")
+    try:
+        ensure_checkpoints(engine)
+    except Exception as e:
+        logger.error(f"Balance checkpoint backfill failed: {str(e)}")
+    try:
+        ensure_rollups(engine)
+    except Exception as e:
+        logger.error(f"Monthly rollup setup failed: {str(e)}")
 
 # Shutdown event
 @app.on_event("shutdown")
@@ -50,4 +75,5 @@ async def shutdown_event():
     Clean up resources on shutdown.
     """
     logger.info("Shutting down BMS Serendipity API")
+    shutdown_parse_pool()
     # Add any cleanup code here
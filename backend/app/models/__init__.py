@@ -9,8 +9,13 @@ from .models import (
     AccountType,
     TransactionsPast,
     AccountsPresent,
-    FreedomFuture
+    FreedomFuture,
+    BalanceCheckpoint,
+    MonthlyRollup,
+    BankStatementLine,
+    StatementMatch
 )
+from .transaction import Transaction
 from .base import BaseModel
 
 __all__ = [
@@ -22,5 +27,10 @@ __all__ = [
     'TransactionsPast',
     'AccountsPresent',
     'FreedomFuture',
+    'BalanceCheckpoint',
+    'MonthlyRollup',
+    'BankStatementLine',
+    'StatementMatch',
+    'Transaction',
     'BaseModel'
 ]
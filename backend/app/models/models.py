@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Date, Numeric, Boolean, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Date, Numeric, Boolean, ForeignKey, Enum, DateTime, Index, Float
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.types import TypeDecorator
 import enum
 from datetime import datetime
@@ -74,6 +75,13 @@ class AccountType(str, enum.Enum):
 
 class TransactionsPast(Base):
     __tablename__ = "Transactions(Past)"
+    __table_args__ = (
+        # TrNo breaks Date ties for keyset pages; Excel-loaded tables have no rowid alias
+        Index("ix_transactions_past_date_tr_no", "Date", "TrNo"),
+        Index("ix_transactions_past_acc_id", "AccID"),
+        Index("ix_transactions_past_category", "Category"),
+        Index("ix_transactions_past_department", "Department"),
+    )
     
     TrNo = Column(Integer, primary_key=True, autoincrement=True, doc="Serial number of transaction")
     Date = Column(Date, nullable=False, doc="Date of creation")
@@ -91,11 +99,15 @@ class TransactionsPast(Base):
 
 class AccountsPresent(Base):
     __tablename__ = "Accounts(Present)"
+    __table_args__ = (
+        Index("ix_accounts_present_acc_id", "AccID", unique=True),
+        Index("ix_accounts_present_next_due_date", "NextDueDate"),
+    )
     
     SLNo = Column(Integer, primary_key=True, autoincrement=True, doc="Serial number of account")
     AccountName = Column(String, nullable=False, doc="Name of the Account")
     Type = Column(Enum(AccountType), nullable=False, doc="Type of account with short ID")
-    AccID = Column(String, unique=True, nullable=False, doc="Account ID for categorization")
+    AccID = Column(String, nullable=False, doc="Account ID for categorization")
     Balance = Column(Numeric(10, 2), nullable=False, doc="Current Balance of the account")
     IntRate = Column(Numeric(5, 2), nullable=False, doc="Monthly Interest rate for the account")
     NextDueDate = Column(String, nullable=False, doc="Monthly specified date for paying EMI or Interest")
@@ -104,11 +116,33 @@ class AccountsPresent(Base):
     EMIAmt = Column(Numeric(10, 2), nullable=True, doc="Monthly Estimated Installment or Interest amount")
     Comments = Column(String, nullable=True, doc="Detailed descriptions of the Account")
 
+    # AccID is not a foreign key in the Excel-loaded tables, so the joins are
+    # declared explicitly and read-only. lazy="raise" keeps loads opt-in: use
+    # selectinload, never per-row lazy loads.
+    past_transactions = relationship(
+        "Transaction",
+        primaryjoin="AccountsPresent.AccID == foreign(Transaction.AccID)",
+        order_by="[Transaction.Date, Transaction.TrNo]",
+        viewonly=True,
+        lazy="raise",
+    )
+    future_transactions = relationship(
+        "FreedomFuture",
+        primaryjoin="AccountsPresent.AccID == foreign(FreedomFuture.AccID)",
+        order_by="[FreedomFuture.Date, FreedomFuture.TrNo]",
+        viewonly=True,
+        lazy="raise",
+    )
+
     def __repr__(self):
         return f"<AccountsPresent(SLNo={self.SLNo}, AccountName={self.AccountName}, Balance={self.Balance})>"
 
 class FreedomFuture(Base):
     __tablename__ = "Freedom(Future)"
+    __table_args__ = (
+        Index("ix_freedom_future_paid_date_tr_no", "Paid", "Date", "TrNo"),
+        Index("ix_freedom_future_acc_id", "AccID"),
+    )
     
     TrNo = Column(Integer, primary_key=True, autoincrement=True, doc="Serial number")
     Date = Column(Date, nullable=False, doc="Date of creation")
@@ -123,3 +157,69 @@ class FreedomFuture(Base):
 
     def __repr__(self):
         return f"<FreedomFuture(TrNo={self.TrNo}, Date={self.Date}, Amount={self.Amount}, Paid={self.Paid})>"
+
+class BalanceCheckpoint(Base):
+    """Daily per-account transaction totals backing as-of balance lookups."""
+    __tablename__ = "BalanceCheckpoints"
+
+    AccID = Column(String, primary_key=True, doc="Account ID the checkpoint belongs to")
+    Day = Column(Date, primary_key=True, doc="Calendar day of the transactions")
+    NetChange = Column(Numeric(14, 2), nullable=False, default=0, doc="Sum of the day's transaction amounts")
+    RunningTotal = Column(Numeric(14, 2), nullable=False, default=0, doc="Sum of all transaction amounts up to and including Day")
+
+    def __repr__(self):
+        return f"<BalanceCheckpoint(AccID={self.AccID}, Day={self.Day}, RunningTotal={self.RunningTotal})>"
+
+class MonthlyRollup(Base):
+    """Per-month transaction aggregates, maintained by triggers on Transactions(Past)."""
+    __tablename__ = "MonthlyRollups"
+
+    YearMonth = Column(String(7), primary_key=True, doc="Month of the transactions as YYYY-MM")
+    AccID = Column(String, primary_key=True, doc="Account ID, empty if unset")
+    Category = Column(String, primary_key=True, doc="Transaction category, empty if unset")
+    Department = Column(String, primary_key=True, doc="Department, empty if unset")
+    PaymentMode = Column(String, primary_key=True, doc="Payment mode, empty if unset")
+    Total = Column(Numeric(14, 2), nullable=False, default=0, doc="Sum of the transaction amounts")
+    Count = Column(Integer, nullable=False, default=0, doc="Number of transactions")
+    MinAmount = Column(Numeric(10, 2), doc="Smallest transaction amount")
+    MaxAmount = Column(Numeric(10, 2), doc="Largest transaction amount")
+
+    def __repr__(self):
+        return f"<MonthlyRollup(YearMonth={self.YearMonth}, AccID={self.AccID}, Category={self.Category}, Total={self.Total})>"
+
+class BankStatementLine(Base):
+    """A bank statement line staged for reconciliation against the ledger."""
+    __tablename__ = "BankStatementLines"
+    __table_args__ = (
+        # A line is staged once however often, and under whatever file name, it is uploaded
+        Index("ux_bank_statement_lines_hash", "LineHash", unique=True),
+        Index("ix_bank_statement_lines_bank_date", "Bank", "Date"),
+    )
+
+    LineID = Column(Integer, primary_key=True, autoincrement=True, doc="Serial number of the staged line")
+    Bank = Column(Enum(PaymentMode), nullable=False, doc="Bank account (payment mode) the statement belongs to")
+    SourceFile = Column(String, nullable=False, doc="Name of the uploaded statement file")
+    LineNo = Column(Integer, nullable=False, doc="Row of the line in the statement file")
+    ValueDate = Column(Date, nullable=True, doc="Value date, when the statement has one")
+    Date = Column(Date, nullable=False, doc="Transaction date")
+    Description = Column(String, nullable=False, doc="Narration as printed on the statement")
+    Reference = Column(String, nullable=True, doc="Cheque or reference number")
+    Amount = Column(Numeric(14, 2), nullable=False, doc="Signed amount: credits positive, debits negative")
+    Balance = Column(Numeric(14, 2), nullable=True, doc="Running balance after the line")
+    LineHash = Column(String, nullable=False, doc="Content hash of the line, see statements.line_hash")
+    ImportedAt = Column(DateTime, nullable=False, default=datetime.utcnow, doc="When the line was staged")
+
+    def __repr__(self):
+        return f"<BankStatementLine(LineID={self.LineID}, Bank={self.Bank}, Date={self.Date}, Amount={self.Amount})>"
+
+class StatementMatch(Base):
+    """An accepted match between a staged statement line and a ledger transaction."""
+    __tablename__ = "StatementMatches"
+
+    LineID = Column(Integer, ForeignKey("BankStatementLines.LineID"), primary_key=True, doc="Matched statement line")
+    TrNo = Column(Integer, nullable=False, unique=True, doc="Matched Transactions(Past) row")
+    Score = Column(Float, nullable=False, doc="Match score between 0 and 1")
+    MatchedAt = Column(DateTime, nullable=False, default=datetime.utcnow, doc="When the match was accepted")
+
+    def __repr__(self):
+        return f"<StatementMatch(LineID={self.LineID}, TrNo={self.TrNo}, Score={self.Score})>"
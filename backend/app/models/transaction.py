@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Index, Integer, String, Float, DateTime
 from app.models.models import Base
 
 class Transaction(Base):
     __tablename__ = "Transactions(Past)"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Content hash of the row; duplicates found by the backfill keep NULL, which may repeat
+        Index("ux_transactions_past_fingerprint", "Fingerprint", unique=True),
+        {'extend_existing': True},
+    )
 
     TrNo = Column(Integer, primary_key=True, index=True)
     Date = Column(DateTime)
@@ -14,4 +18,5 @@ class Transaction(Base):
     Department = Column(String)
     Comments = Column(String)
     Category = Column(String)
-    ZohoMatch = Column(String) 
\ No newline at end of file
+    ZohoMatch = Column(String) 
+    Fingerprint = Column(String, nullable=True)
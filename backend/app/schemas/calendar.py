@@ -0,0 +1,27 @@
+from datetime import date
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+class CalendarFutureEntry(BaseModel):
+    """A future prediction falling on a calendar day."""
+    TrNo: int
+    Description: str
+    Amount: float
+    AccID: str
+    Category: Optional[str] = None
+    Paid: bool
+
+class CalendarDay(BaseModel):
+    """Past transaction totals and future predictions for one day."""
+    date: date
+    transaction_count: int = 0
+    transaction_total: float = 0.0
+    due: List[CalendarFutureEntry] = Field(default_factory=list)
+    paid: List[CalendarFutureEntry] = Field(default_factory=list)
+    due_total: float = 0.0
+    paid_total: float = 0.0
+
+class CalendarMonth(BaseModel):
+    """Days of a month that have transactions or predictions, in date order."""
+    month: str
+    days: List[CalendarDay]
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import List
+
+class ImportRowError(BaseModel):
+    """A worksheet row skipped by the importer."""
+    row: int
+    error: str
+
+class SheetImportSummary(BaseModel):
+    """Changes applied (or found, on a dry run) for one sheet."""
+    sheet: str
+    rows: int
+    inserted: int
+    updated: int
+    unchanged: int
+    deleted: int
+    errors: List[ImportRowError]
+
+class WorkbookImportSummary(BaseModel):
+    """Outcome of importing a workbook."""
+    dry_run: bool
+    sheets: List[SheetImportSummary]
@@ -0,0 +1,39 @@
+from datetime import date
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.services.projection import Granularity
+
+class AccountProjection(BaseModel):
+    """Projected series for one account."""
+    AccID: str
+    Type: str
+    opening_balance: float
+    balances: List[float]
+    flows: List[float]
+
+class CashflowProjection(BaseModel):
+    """Projected closing balances and net flows per period."""
+    as_of: date
+    granularity: Granularity
+    periods: List[str]
+    total_balances: List[float]
+    net_flows: List[float]
+    accounts: Optional[List[AccountProjection]] = None
+
+class AccountSchedule(BaseModel):
+    """Generated amortization schedule of one account."""
+    AccID: str
+    installment: float
+    installments: int
+    total_interest: float
+    first_due: date
+    last_due: date
+
+class ScheduleGenerationResult(BaseModel):
+    """Outcome of regenerating amortization schedules in Freedom(Future)."""
+    generated: int
+    replaced: int
+    skipped: int
+    dry_run: bool
+    accounts: List[AccountSchedule]
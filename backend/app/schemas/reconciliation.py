@@ -0,0 +1,56 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import List, Optional
+
+class MatchCandidate(BaseModel):
+    """A ledger transaction a statement line could match."""
+    TrNo: int
+    score: float
+
+class MatchedLine(BaseModel):
+    """A statement line matched to a ledger transaction."""
+    LineID: int
+    TrNo: int
+    score: float
+
+class AmbiguousLine(BaseModel):
+    """A statement line with several equally likely transactions."""
+    LineID: int
+    candidates: List[MatchCandidate]
+
+class ReconciliationSummary(BaseModel):
+    """Outcome of a reconciliation run over a date range."""
+    start: date
+    end: date
+    persisted: bool
+    matched: List[MatchedLine]
+    ambiguous: List[AmbiguousLine]
+    unmatched: List[int]
+
+class SyncPairIn(BaseModel):
+    """A reconciled statement line and the row its narration is copied to."""
+    LineID: int
+    TrNo: int
+    Comments: Optional[str] = None
+
+class DescriptionSyncRequest(BaseModel):
+    """Pairs to sync; the stored reconciliation matches are used if omitted."""
+    pairs: Optional[List[SyncPairIn]] = None
+
+class DescriptionChangeOut(BaseModel):
+    """One column value replaced by the sync."""
+    TrNo: int
+    LineID: int
+    column: str
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+class DescriptionSyncSummary(BaseModel):
+    """Diff applied (or found, on a dry run) by a description sync."""
+    target: str
+    dry_run: bool
+    pairs: int
+    updated: int
+    unchanged: int
+    changes: List[DescriptionChangeOut]
+    errors: List[str]
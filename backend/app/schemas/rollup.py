@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class MonthlyRollupRow(BaseModel):
+    """Monthly totals for one combination of the grouped dimensions."""
+    YearMonth: str
+    AccID: Optional[str] = None
+    Category: Optional[str] = None
+    Department: Optional[str] = None
+    PaymentMode: Optional[str] = None
+    Total: float
+    Count: int
+    MinAmount: Optional[float] = None
+    MaxAmount: Optional[float] = None
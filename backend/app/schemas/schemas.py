@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, model_validator, validator
+from typing import Any, Optional, List
 from datetime import date
 from decimal import Decimal
+from sqlalchemy import inspect
 from .base import BaseSchema
+from .transaction import Transaction as LedgerTransaction
 from app.models.models import PaymentMode, Department, Category, AccountType
 
 class TransactionBase(BaseModel):
@@ -79,14 +81,35 @@ class AccountUpdate(BaseModel):
 class Account(AccountBase, BaseSchema):
     """Schema for account response."""
     SLNo: int  # Updated to match Excel column name
-    past_transactions: List[Transaction] = []
+    # Filled only when requested with include=; same rows as /transactions/
+    past_transactions: List[LedgerTransaction] = []
     future_transactions: List['FuturePrediction'] = []
 
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, value: Any) -> Any:
+        """Read an ORM account without lazy loading its relationships."""
+        state = inspect(value, raiseerr=False)
+        if state is None or not hasattr(state, "unloaded"):
+            return value
+        skipped = state.unloaded & set(state.mapper.relationships.keys())
+        return {
+            name: getattr(value, name)
+            for name in cls.model_fields
+            if name not in skipped and hasattr(type(value), name)
+        }
+
     class Config:
         orm_mode = True
         allow_population_by_field_name = True
         alias_generator = lambda x: x  # Preserve original casing
 
+class AccountBalance(BaseModel):
+    """Schema for an account balance at the end of a day."""
+    AccID: str
+    as_of: date
+    Balance: Decimal
+
 class FutureBase(BaseModel):
     """Base schema for future predictions."""
     Date: date
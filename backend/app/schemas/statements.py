@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from app.models.models import PaymentMode
+
+class StatementFileSummary(BaseModel):
+    """Lines staged from one uploaded statement file."""
+    file: str
+    bank: Optional[PaymentMode] = None
+    lines: int
+    inserted: int
+    duplicates: int
+    skipped: int
+    error: Optional[str] = None
+
+class StatementIngestSummary(BaseModel):
+    """Outcome of ingesting a batch of statement files."""
+    files: List[StatementFileSummary]
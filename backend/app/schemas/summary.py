@@ -0,0 +1,42 @@
+from datetime import date
+from enum import Enum
+from pydantic import BaseModel
+from typing import List, Optional
+
+class SummaryRole(str, Enum):
+    """Dashboard audiences served by /summary/{role}."""
+    ca = "ca"
+    budget_analyst = "budget-analyst"
+    owner = "owner"
+
+class TypeTotal(BaseModel):
+    """Account count and combined balance for one account Type."""
+    Type: str
+    count: int
+    balance: float
+
+class GroupTotal(BaseModel):
+    """Transaction count and amount for one Department or Category."""
+    name: str
+    count: int
+    amount: float
+
+class OutstandingFutures(BaseModel):
+    """Unpaid future predictions, split into upcoming and overdue."""
+    count: int
+    total: float
+    overdue_count: int
+    overdue_total: float
+
+class DashboardSummary(BaseModel):
+    """Aggregates behind a role dashboard; sections a role does not show are omitted."""
+    role: SummaryRole
+    as_of: date
+    total_balance: Optional[float] = None
+    account_count: Optional[int] = None
+    monthly_expenses: Optional[float] = None
+    accounts_by_type: Optional[List[TypeTotal]] = None
+    expenses_by_department: Optional[List[GroupTotal]] = None
+    expenses_by_category: Optional[List[GroupTotal]] = None
+    net_by_department: Optional[List[GroupTotal]] = None
+    outstanding: Optional[OutstandingFutures] = None
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, field_validator, model_validator
-from typing import Optional
+from typing import Dict, List, Optional
 
 class TransactionBase(BaseModel):
     Date: datetime
@@ -56,4 +56,20 @@ class Transaction(TransactionCreate):
         from_attributes = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+        }
+
+class TransactionBulkRowResult(BaseModel):
+    """Outcome of one row of a bulk insert."""
+    index: int
+    status: str  # "created", "duplicate" or "error"
+    TrNo: Optional[int] = None
+    error: Optional[str] = None
+
+
+class TransactionBulkResult(BaseModel):
+    """Outcome of a bulk insert, with per-row results in request order."""
+    created: int
+    failed: int
+    duplicates: int = 0
+    balance_changes: Dict[str, float] = {}
+    results: List[TransactionBulkRowResult]
@@ -0,0 +1,43 @@
+"""
+Export service package
+"""
+from typing import AsyncIterator, Callable, Dict
+
+from .arrow_export import arrow_schema, iter_arrow, iter_parquet, iter_record_batches
+from .table_export import (
+    EXPORT_EXCLUDED,
+    EXPORT_TABLES,
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportTable,
+    export_columns,
+    exported_columns,
+    iter_csv,
+    iter_ndjson,
+    stream_rows,
+)
+
+EXPORT_ENCODERS: Dict[ExportFormat, Callable[..., AsyncIterator[bytes]]] = {
+    ExportFormat.ndjson: iter_ndjson,
+    ExportFormat.csv: iter_csv,
+    ExportFormat.arrow: iter_arrow,
+    ExportFormat.parquet: iter_parquet,
+}
+
+__all__ = [
+    "EXPORT_ENCODERS",
+    "EXPORT_EXCLUDED",
+    "EXPORT_TABLES",
+    "MEDIA_TYPES",
+    "ExportFormat",
+    "ExportTable",
+    "arrow_schema",
+    "export_columns",
+    "exported_columns",
+    "iter_arrow",
+    "iter_csv",
+    "iter_ndjson",
+    "iter_parquet",
+    "iter_record_batches",
+    "stream_rows",
+]
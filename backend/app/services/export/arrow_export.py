@@ -0,0 +1,201 @@
+"""
+Columnar table export.
+Batches from the streaming export are converted to Arrow record batches with
+typed columns (decimals, dates, dictionary-encoded enums) and written as an
+Arrow IPC stream or as Parquet row groups, one chunk per batch.
+"""
+import enum
+import logging
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Numeric
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import BooleanStr
+from .table_export import ExportTable, exported_columns, stream_rows
+
+logger = logging.getLogger(__name__)
+
+# Transactions(Past) is loaded from Excel as plain strings and floats; these
+# columns are exported with the types TransactionsPast declares for them
+ARROW_TYPE_OVERRIDES: Dict[ExportTable, Dict[str, pa.DataType]] = {
+    ExportTable.transactions: {
+        "Amount": pa.decimal128(10, 2),
+        "PaymentMode": pa.dictionary(pa.int32(), pa.string()),
+        "AccID": pa.dictionary(pa.int32(), pa.string()),
+        "Department": pa.dictionary(pa.int32(), pa.string()),
+        "Category": pa.dictionary(pa.int32(), pa.string()),
+    },
+}
+
+
+def arrow_type(column: Any) -> pa.DataType:
+    """Map a SQLAlchemy column to its Arrow type.
+
+    Args:
+        column: Table column
+
+    Returns:
+        pa.DataType: Arrow type of the column's values
+    """
+    column_type = column.type
+    if isinstance(column_type, Enum):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(column_type, (Boolean, BooleanStr)):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision or 18, column_type.scale or 0)
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def arrow_schema(table: ExportTable) -> pa.Schema:
+    """Arrow schema of an exported table, in table order.
+
+    Args:
+        table: Table to export
+
+    Returns:
+        pa.Schema: One nullable field per column
+    """
+    overrides = ARROW_TYPE_OVERRIDES.get(table, {})
+    return pa.schema([
+        pa.field(column.name, overrides.get(column.name) or arrow_type(column), nullable=column.nullable)
+        for column in exported_columns(table)
+    ])
+
+
+def _arrow_values(values: List[Any], data_type: pa.DataType) -> pa.Array:
+    """Build one column of a record batch."""
+    if pa.types.is_dictionary(data_type):
+        values = [value.value if isinstance(value, enum.Enum) else value for value in values]
+        return pa.array(values, type=data_type.value_type).dictionary_encode()
+    if pa.types.is_decimal(data_type):
+        # Float columns are rounded to the declared scale instead of failing the cast
+        quantum = Decimal(1).scaleb(-data_type.scale)
+        values = [
+            None if value is None else Decimal(value).quantize(quantum)
+            for value in values
+        ]
+    return pa.array(values, type=data_type)
+
+
+def record_batch(rows: List[Dict[str, Any]], schema: pa.Schema) -> pa.RecordBatch:
+    """Convert a batch of row mappings to an Arrow record batch.
+
+    Args:
+        rows: Rows as column -> value mappings
+        schema: Result of arrow_schema for the table
+
+    Returns:
+        pa.RecordBatch: Typed columnar batch
+    """
+    return pa.record_batch(
+        [_arrow_values([row[field.name] for row in rows], field.type) for field in schema],
+        schema=schema,
+    )
+
+
+async def iter_record_batches(
+    db: AsyncSession,
+    table: ExportTable,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[pa.RecordBatch]:
+    """Yield a table as Arrow record batches.
+
+    Args:
+        db: Database session
+        table: Table to export
+        batch_size: Rows per batch
+
+    Yields:
+        pa.RecordBatch: One typed batch per server-side cursor batch
+    """
+    schema = arrow_schema(table)
+    async for partition in stream_rows(db, table, batch_size):
+        yield record_batch(partition, schema)
+
+
+class _ChunkSink:
+    """Write-only file object whose written bytes are drained per chunk."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def iter_arrow(
+    db: AsyncSession,
+    table: ExportTable,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Encode a table as an Arrow IPC stream, one chunk per batch.
+
+    Args:
+        db: Database session
+        table: Table to export
+        batch_size: Rows per batch
+
+    Yields:
+        bytes: Stream schema, one record batch or the end-of-stream marker
+    """
+    schema = arrow_schema(table)
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, schema)
+    async for batch in iter_record_batches(db, table, batch_size):
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+async def iter_parquet(
+    db: AsyncSession,
+    table: ExportTable,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Encode a table as Parquet, one row group per batch.
+
+    Args:
+        db: Database session
+        table: Table to export
+        batch_size: Rows per batch
+
+    Yields:
+        bytes: Parquet bytes written for one row group, then the footer
+    """
+    schema = arrow_schema(table)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    async for batch in iter_record_batches(db, table, batch_size):
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
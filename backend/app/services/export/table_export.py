@@ -0,0 +1,175 @@
+"""
+Streaming table export.
+Rows are read through a server-side cursor in fixed-size batches and encoded
+incrementally, so memory stays flat regardless of table size.
+"""
+import csv
+import enum
+import io
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, Table, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.models import AccountsPresent, FreedomFuture
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+
+class ExportTable(str, enum.Enum):
+    """Tables available for export."""
+    transactions = "transactions"
+    accounts = "accounts"
+    future = "future"
+
+
+class ExportFormat(str, enum.Enum):
+    """Supported streaming export formats."""
+    ndjson = "ndjson"
+    csv = "csv"
+    arrow = "arrow"
+    parquet = "parquet"
+
+
+EXPORT_TABLES: Dict[ExportTable, Table] = {
+    ExportTable.transactions: Transaction.__table__,
+    ExportTable.accounts: AccountsPresent.__table__,
+    ExportTable.future: FreedomFuture.__table__,
+}
+
+# Index-backed orderings so the export is deterministic without a sort step
+EXPORT_ORDER: Dict[ExportTable, List[str]] = {
+    ExportTable.transactions: ["Date", "TrNo"],
+    ExportTable.accounts: ["SLNo"],
+    ExportTable.future: ["Date", "TrNo"],
+}
+
+# Internal columns that are not part of the exported data
+EXPORT_EXCLUDED: Dict[ExportTable, Tuple[str, ...]] = {
+    ExportTable.transactions: ("Fingerprint",),
+}
+
+MEDIA_TYPES: Dict[ExportFormat, str] = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+    ExportFormat.arrow: "application/vnd.apache.arrow.stream",
+    ExportFormat.parquet: "application/vnd.apache.parquet",
+}
+
+
+def exported_columns(table: ExportTable) -> List[Column]:
+    """Columns of an exported table, in table order."""
+    excluded = EXPORT_EXCLUDED.get(table, ())
+    return [column for column in EXPORT_TABLES[table].columns if column.name not in excluded]
+
+
+def export_columns(table: ExportTable) -> List[str]:
+    """Column names of an exported table, in table order."""
+    return [column.name for column in exported_columns(table)]
+
+
+def json_value(value: Any) -> Any:
+    """Convert a database value to a JSON-compatible value."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def csv_value(value: Any) -> Any:
+    """Convert a database value to a CSV cell."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def stream_rows(
+    db: AsyncSession,
+    table: ExportTable,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield a table's rows in batches from a server-side cursor.
+
+    Args:
+        db: Database session
+        table: Table to export
+        batch_size: Rows per batch, defaults to settings.EXPORT_BATCH_SIZE
+
+    Yields:
+        List[Dict[str, Any]]: One batch of rows as column -> value mappings
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    sql_table = EXPORT_TABLES[table]
+    stmt = select(*exported_columns(table)).order_by(
+        *(sql_table.c[name] for name in EXPORT_ORDER[table])
+    ).execution_options(yield_per=batch_size)
+
+    result = await db.stream(stmt)
+    rows = 0
+    async for partition in result.mappings().partitions():
+        rows += len(partition)
+        yield partition
+    logger.info(f"Exported {rows} rows from '{sql_table.name}'")
+
+
+async def iter_ndjson(
+    db: AsyncSession,
+    table: ExportTable,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Encode a table as newline-delimited JSON, one chunk per batch.
+
+    Args:
+        db: Database session
+        table: Table to export
+        batch_size: Rows per batch
+
+    Yields:
+        bytes: NDJSON lines for one batch
+    """
+    async for partition in stream_rows(db, table, batch_size):
+        lines = [
+            json.dumps({key: json_value(value) for key, value in row.items()}, separators=(",", ":"))
+            for row in partition
+        ]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def iter_csv(
+    db: AsyncSession,
+    table: ExportTable,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Encode a table as CSV with a header row, one chunk per batch.
+
+    Args:
+        db: Database session
+        table: Table to export
+        batch_size: Rows per batch
+
+    Yields:
+        bytes: CSV text for the header or one batch
+    """
+    columns = export_columns(table)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+
+    async for partition in stream_rows(db, table, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([csv_value(row[column]) for column in columns] for row in partition)
+        yield buffer.getvalue().encode()
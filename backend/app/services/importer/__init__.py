@@ -0,0 +1,38 @@
+"""
+Import service package
+"""
+from .workbook_import import (
+    IMPORT_SHEETS,
+    RowError,
+    SheetImportResult,
+    SheetSpec,
+    WorkbookImportError,
+    coerce_cell,
+    import_sheet,
+    import_workbook,
+)
+from .zoho_match import (
+    UnmatchedTransaction,
+    ZohoImportError,
+    ZohoMatchResult,
+    ZohoRow,
+    match_zoho_export,
+    read_zoho_rows,
+)
+
+__all__ = [
+    "IMPORT_SHEETS",
+    "RowError",
+    "SheetImportResult",
+    "SheetSpec",
+    "UnmatchedTransaction",
+    "WorkbookImportError",
+    "ZohoImportError",
+    "ZohoMatchResult",
+    "ZohoRow",
+    "coerce_cell",
+    "import_sheet",
+    "import_workbook",
+    "match_zoho_export",
+    "read_zoho_rows",
+]
@@ -0,0 +1,489 @@
+"""
+Incremental workbook import.
+Sheets of Kaas-sql.xlsx are streamed with openpyxl in read-only mode, each
+cell is coerced to the type of its mapped column, and rows are diffed by key
+against the table in fixed-size chunks: only new and changed rows are
+written, so re-importing a workbook costs what changed, not its size.
+"""
+import enum
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import IO, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+import openpyxl
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Numeric, Table, bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import table_versions
+from app.core.config import settings
+from app.crud.crud_checkpoint import checkpoint_statements, ensure_checkpoints
+from app.crud.crud_rollup import ensure_rollups
+from app.crud.crud_transaction import WRITTEN_TABLES
+from app.crud.fingerprint import (
+    computed_owners,
+    ensure_fingerprints,
+    fingerprint_owners,
+    has_fingerprint_column,
+    row_fingerprint,
+)
+from app.models.models import (
+    AccountsPresent,
+    BooleanStr,
+    Category,
+    Department,
+    FreedomFuture,
+    PaymentMode,
+)
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+TRUE_STRINGS = ("true", "yes", "y", "1")
+FALSE_STRINGS = ("false", "no", "n", "0")
+
+
+@dataclass(frozen=True)
+class SheetSpec:
+    """How one worksheet maps onto a table.
+
+    Attributes:
+        table: Table the rows are imported into
+        key: Column identifying a row in both the sheet and the table
+        enums: String columns holding enum member names, validated against the enum
+        written_tables: Tables whose cached reads a change invalidates
+        fingerprint: Computes the Fingerprint column of a row; new and changed
+            rows whose fingerprint belongs to another row are rejected
+    """
+    table: Table
+    key: str
+    enums: Mapping[str, Type[enum.Enum]] = field(default_factory=dict)
+    written_tables: Tuple[str, ...] = ()
+    fingerprint: Optional[Callable[[Mapping[str, Any]], str]] = None
+
+
+# Sheet name -> spec, in import order. Transactions(Past) is stored with the
+# plain types of models/transaction.py, so its enum columns keep member names
+IMPORT_SHEETS: Dict[str, SheetSpec] = {
+    AccountsPresent.__tablename__: SheetSpec(
+        table=AccountsPresent.__table__,
+        key="SLNo",
+        written_tables=(AccountsPresent.__tablename__,),
+    ),
+    FreedomFuture.__tablename__: SheetSpec(
+        table=FreedomFuture.__table__,
+        key="TrNo",
+        written_tables=(FreedomFuture.__tablename__,),
+    ),
+    Transaction.__tablename__: SheetSpec(
+        table=Transaction.__table__,
+        key="TrNo",
+        enums={"PaymentMode": PaymentMode, "Department": Department, "Category": Category},
+        written_tables=WRITTEN_TABLES,
+        fingerprint=row_fingerprint,
+    ),
+}
+
+
+class WorkbookImportError(Exception):
+    """Raised when a workbook or sheet cannot be imported at all."""
+
+
+@dataclass
+class RowError:
+    """A sheet row that was skipped.
+
+    Attributes:
+        row: 1-based worksheet row number
+        error: Why the row was rejected
+    """
+    row: int
+    error: str
+
+
+@dataclass
+class SheetImportResult:
+    """Outcome of importing one sheet.
+
+    Attributes:
+        sheet: Worksheet (and table) name
+        rows: Data rows read, excluding blank rows
+        inserted: Rows added to the table
+        updated: Existing rows whose values changed
+        unchanged: Rows already matching the table
+        deleted: Table rows missing from the sheet that were removed
+        errors: Rows skipped because a cell could not be coerced
+    """
+    sheet: str
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+
+def _enum_member(enum_class: Type[enum.Enum], value: Any) -> enum.Enum:
+    """Find an enum member by name, then by value."""
+    if isinstance(value, enum_class):
+        return value
+    text = str(value).strip()
+    if text in enum_class.__members__:
+        return enum_class[text]
+    try:
+        return enum_class(text)
+    except ValueError:
+        allowed = ", ".join(enum_class.__members__)
+        raise ValueError(f"'{value}' is not one of {allowed}")
+
+
+def _boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in TRUE_STRINGS:
+        return True
+    if text in FALSE_STRINGS:
+        return False
+    raise ValueError(f"'{value}' is not a boolean")
+
+
+def coerce_cell(column: Any, value: Any, enum_class: Optional[Type[enum.Enum]] = None) -> Any:
+    """Coerce a worksheet cell to the Python type of its column.
+
+    Args:
+        column: Table column the cell is imported into
+        value: Cell value as read by openpyxl
+        enum_class: Enum whose member name a String column stores
+
+    Returns:
+        Any: Value ready to bind, None for blank cells
+
+    Raises:
+        ValueError: If the cell is blank in a required column or has the wrong type
+    """
+    if isinstance(value, str) and not value.strip():
+        value = None
+    if value is None:
+        if not column.nullable:
+            raise ValueError(f"{column.name} is required")
+        return None
+
+    column_type = column.type
+    try:
+        if enum_class is not None:
+            return _enum_member(enum_class, value).name
+        if isinstance(column_type, Enum) and column_type.enum_class is not None:
+            return _enum_member(column_type.enum_class, value)
+        if isinstance(column_type, (BooleanStr, Boolean)):
+            return _boolean(value)
+        if isinstance(column_type, Integer):
+            number = Decimal(str(value))
+            if number != number.to_integral_value():
+                raise ValueError(f"'{value}' is not a whole number")
+            return int(number)
+        if isinstance(column_type, Float):
+            return float(value)
+        if isinstance(column_type, Numeric):
+            number = Decimal(str(value))
+            if column_type.scale is not None:
+                number = number.quantize(Decimal(1).scaleb(-column_type.scale))
+            return number
+        if isinstance(column_type, DateTime):
+            if isinstance(value, datetime):
+                return value
+            if isinstance(value, date):
+                return datetime.combine(value, datetime.min.time())
+            return datetime.fromisoformat(str(value).strip())
+        if isinstance(column_type, Date):
+            if isinstance(value, datetime):
+                return value.date()
+            if isinstance(value, date):
+                return value
+            return date.fromisoformat(str(value).strip()[:10])
+        return str(value)
+    except (ValueError, TypeError, InvalidOperation) as e:
+        raise ValueError(f"{column.name}: {e}")
+
+
+def _sheet_rows(
+    worksheet: Any,
+    spec: SheetSpec,
+    result: SheetImportResult
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield worksheet row numbers and coerced rows, recording rejected rows in result."""
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return
+    positions = {
+        str(name).strip(): index for index, name in enumerate(header) if name is not None
+    }
+    columns = [column for column in spec.table.columns if column.name in positions]
+    missing = [
+        column.name for column in spec.table.columns
+        if column.name not in positions and not column.nullable
+    ]
+    if missing:
+        raise WorkbookImportError(
+            f"Sheet '{result.sheet}' is missing required columns: {', '.join(missing)}"
+        )
+
+    seen = set()
+    for number, values in enumerate(rows, start=2):
+        if all(value is None or value == "" for value in values):
+            continue
+        result.rows += 1
+        try:
+            row = {
+                column.name: coerce_cell(
+                    column,
+                    values[positions[column.name]] if positions[column.name] < len(values) else None,
+                    spec.enums.get(column.name),
+                )
+                for column in columns
+            }
+            key = row[spec.key]
+            if key in seen:
+                raise ValueError(f"duplicate {spec.key} {key}")
+        except ValueError as e:
+            result.errors.append(RowError(row=number, error=str(e)))
+            continue
+        seen.add(key)
+        yield number, row
+
+
+def _chunks(rows: Iterator[Tuple[int, Dict[str, Any]]], size: int) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _DayDeltas:
+    """Checkpoint deltas of changed Transactions(Past) rows."""
+
+    def __init__(self) -> None:
+        self.deltas: Dict[Tuple[str, date], Decimal] = defaultdict(Decimal)
+
+    def add(self, row: Mapping[str, Any], sign: int) -> None:
+        if row.get("AccID") is None or row.get("Date") is None or row.get("Amount") is None:
+            return
+        day = row["Date"].date() if isinstance(row["Date"], datetime) else row["Date"]
+        self.deltas[(row["AccID"], day)] += sign * Decimal(str(row["Amount"]))
+
+
+def import_sheet(
+    db: Session,
+    worksheet: Any,
+    sheet: str,
+    *,
+    batch_size: Optional[int] = None,
+    delete_missing: bool = False,
+    dry_run: bool = False
+) -> SheetImportResult:
+    """Diff one worksheet against its table and write the differences.
+
+    The sheet is read and compared batch_size rows at a time: each chunk
+    loads only the table rows with the chunk's keys, then inserts the new
+    rows and updates the changed ones with one executemany each. Changes
+    to Transactions(Past) are folded into the balance checkpoints, and new
+    or changed rows whose content fingerprint already belongs to another
+    row are rejected as duplicates after one indexed lookup per chunk.
+
+    Args:
+        db: Database session; the caller commits
+        worksheet: openpyxl worksheet
+        sheet: Sheet name, a key of IMPORT_SHEETS
+        batch_size: Rows per chunk, defaults to settings.IMPORT_BATCH_SIZE
+        delete_missing: Also delete table rows whose key is not in the sheet
+        dry_run: Count the changes without writing them
+
+    Returns:
+        SheetImportResult: Row counts and rejected rows
+
+    Raises:
+        WorkbookImportError: If required columns are missing
+    """
+    spec = IMPORT_SHEETS[sheet]
+    table = spec.table
+    key_column = table.c[spec.key]
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    result = SheetImportResult(sheet=sheet)
+    day_deltas = _DayDeltas() if table is Transaction.__table__ else None
+    seen_keys = set()
+    # Fingerprint -> key of the row written with it by this import
+    claimed: Dict[str, Any] = {}
+    columns = list(table.c)
+    # Without the stored column (a dry run against an older database) the
+    # table's fingerprints are computed once in memory instead of looked up
+    computed: Optional[Dict[str, Any]] = None
+    if spec.fingerprint is not None and not has_fingerprint_column(db.get_bind()):
+        columns = [column for column in columns if column.name != "Fingerprint"]
+        computed = computed_owners(db)
+
+    for chunk in _chunks(_sheet_rows(worksheet, spec, result), batch_size):
+        keys = [row[spec.key] for _, row in chunk]
+        seen_keys.update(keys)
+        existing = {
+            row[spec.key]: row
+            for row in db.execute(select(*columns).where(key_column.in_(keys))).mappings()
+        }
+
+        changed = []
+        for number, row in chunk:
+            current = existing.get(row[spec.key])
+            # A stored fingerprint is derived from the other columns, so it is not diffed
+            if current is None or any(
+                current[name] != value for name, value in row.items() if name != "Fingerprint"
+            ):
+                changed.append((number, row, current))
+            else:
+                result.unchanged += 1
+
+        owners: Dict[str, Any] = {}
+        if spec.fingerprint is not None:
+            for _, row, _ in changed:
+                row["Fingerprint"] = spec.fingerprint(row)
+            if computed is None:
+                owners = fingerprint_owners(db, (row["Fingerprint"] for _, row, _ in changed), batch_size)
+            else:
+                owners = computed
+
+        inserts, updates = [], []
+        for number, row, current in changed:
+            if spec.fingerprint is not None:
+                owner = claimed.get(row["Fingerprint"], owners.get(row["Fingerprint"]))
+                if owner is not None and owner != row[spec.key]:
+                    result.errors.append(RowError(row=number, error=f"duplicate of {spec.key} {owner}"))
+                    continue
+                claimed[row["Fingerprint"]] = row[spec.key]
+            if current is None:
+                inserts.append(row)
+            else:
+                updates.append(row)
+                if day_deltas is not None:
+                    day_deltas.add(current, -1)
+            if day_deltas is not None:
+                day_deltas.add(row, 1)
+        result.inserted += len(inserts)
+        result.updated += len(updates)
+
+        if dry_run:
+            continue
+        if inserts:
+            db.execute(insert(table), inserts)
+        # executemany needs one parameter shape, so rows are grouped by their columns
+        shapes: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for row in updates:
+            shapes[tuple(row)].append({f"new_{name}": value for name, value in row.items()})
+        for names, params in shapes.items():
+            stmt = update(table).where(key_column == bindparam(f"new_{spec.key}")).values({
+                name: bindparam(f"new_{name}") for name in names if name != spec.key
+            })
+            db.execute(stmt, params)
+
+    if delete_missing:
+        stale = [
+            row for row in db.execute(
+                select(*(table.c[name] for name in (spec.key, "AccID", "Date", "Amount") if name in table.c))
+            ).mappings()
+            if row[spec.key] not in seen_keys
+        ]
+        result.deleted = len(stale)
+        if day_deltas is not None:
+            for row in stale:
+                day_deltas.add(row, -1)
+        if stale and not dry_run:
+            stale_keys = [row[spec.key] for row in stale]
+            for start in range(0, len(stale_keys), batch_size):
+                db.execute(delete(table).where(key_column.in_(stale_keys[start:start + batch_size])))
+
+    if day_deltas is not None and not dry_run:
+        for stmt, params in checkpoint_statements(day_deltas.deltas):
+            db.execute(stmt, params)
+
+    logger.info(
+        f"Imported '{sheet}': {result.inserted} inserted, {result.updated} updated, "
+        f"{result.unchanged} unchanged, {result.deleted} deleted, {len(result.errors)} rejected"
+    )
+    return result
+
+
+def import_workbook(
+    db: Session,
+    source: Union[str, IO[bytes]],
+    *,
+    sheets: Optional[Sequence[str]] = None,
+    batch_size: Optional[int] = None,
+    delete_missing: bool = False,
+    dry_run: bool = False
+) -> List[SheetImportResult]:
+    """Import the ledger sheets of a workbook incrementally.
+
+    Each sheet is applied in its own transaction; tables that do not exist
+    yet are created with their model's types and indexes, and the balance
+    checkpoints and monthly rollups are set up before Transactions(Past).
+
+    Args:
+        db: Database session
+        source: Path or binary file object of an .xlsx workbook
+        sheets: Sheets to import, all of IMPORT_SHEETS if omitted
+        batch_size: Rows per chunk, defaults to settings.IMPORT_BATCH_SIZE
+        delete_missing: Delete table rows whose key is not in the sheet
+        dry_run: Count the changes without writing them
+
+    Returns:
+        List[SheetImportResult]: One result per imported sheet
+
+    Raises:
+        WorkbookImportError: If the workbook, a sheet or a required column is missing
+    """
+    names = list(sheets or IMPORT_SHEETS)
+    unknown = [name for name in names if name not in IMPORT_SHEETS]
+    if unknown:
+        raise WorkbookImportError(
+            f"Cannot import {', '.join(unknown)}; allowed: {', '.join(IMPORT_SHEETS)}"
+        )
+
+    try:
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    except Exception as e:
+        raise WorkbookImportError(f"Cannot read workbook: {e}")
+
+    results = []
+    try:
+        for name in names:
+            if name not in workbook.sheetnames:
+                raise WorkbookImportError(f"Workbook has no sheet '{name}'")
+            spec = IMPORT_SHEETS[name]
+            if not dry_run:
+                spec.table.create(db.get_bind(), checkfirst=True)
+                if spec.table is Transaction.__table__:
+                    # Derived tables must be current before the deltas are folded in
+                    ensure_checkpoints(db.get_bind())
+                    ensure_rollups(db.get_bind())
+            if spec.fingerprint is not None and not dry_run:
+                # Older databases get the column before rows are compared with it
+                ensure_fingerprints(db.get_bind())
+            try:
+                result = import_sheet(
+                    db, workbook[name], name,
+                    batch_size=batch_size, delete_missing=delete_missing, dry_run=dry_run
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            if not dry_run and (result.inserted or result.updated or result.deleted):
+                table_versions.bump(*spec.written_tables)
+            results.append(result)
+    finally:
+        workbook.close()
+    return results
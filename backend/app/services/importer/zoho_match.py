@@ -0,0 +1,288 @@
+"""
+Zoho Books matching.
+Rows of a Zoho Books CSV export are loaded into a hash index keyed by
+(date, amount, normalized reference), then Transactions(Past) rows of the
+export's date range are streamed once and probed against it. Matched rows
+get ZohoMatch 'Yes', written in bulk, and rows left over on either side are
+reported. An export covers one Zoho module only, so unmatched rows keep their
+ZohoMatch unless the caller asks to reset them to 'No'.
+"""
+import csv
+import io
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import table_versions
+from app.core.config import settings
+from app.models.transaction import Transaction
+from app.services.statements import parse_amount, parse_date
+
+logger = logging.getLogger(__name__)
+
+ZOHO_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d %b %Y", "%d-%b-%Y", "%m/%d/%Y")
+
+# Column aliases of the Zoho Books exports (expenses, bank and account
+# transactions), compared after dropping everything but letters and digits
+ZOHO_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "date": ("date", "expensedate", "transactiondate", "paymentdate"),
+    "amount": ("amount", "total", "bcytotal", "expensetotal", "fcyamount"),
+    "debit": ("debit", "withdrawals"),
+    "credit": ("credit", "deposits"),
+    "reference": ("reference", "referencenumber", "referenceno", "transaction", "transactionnumber"),
+    "description": ("description", "transactiondetails", "expensedescription", "notes", "payee", "vendorname"),
+}
+
+
+class ZohoImportError(Exception):
+    """Raised when a Zoho Books export cannot be read."""
+
+
+@dataclass(frozen=True)
+class ZohoRow:
+    """A row of the Zoho Books export."""
+    line: int
+    day: date
+    amount: Decimal
+    reference: str
+    description: str
+
+
+@dataclass(frozen=True)
+class UnmatchedTransaction:
+    """A Transactions(Past) row with no Zoho Books counterpart."""
+    tr_no: int
+    day: date
+    amount: float
+    description: str
+
+
+@dataclass
+class ZohoMatchResult:
+    """Outcome of matching a Zoho Books export against the ledger.
+
+    Attributes:
+        start: First date of the export
+        end: Last date of the export
+        zoho_rows: Zoho rows read
+        transactions: Ledger rows of the date range
+        matched: (Zoho line, TrNo) pairs
+        marked_yes: Rows whose ZohoMatch was set to 'Yes'
+        marked_no: Rows whose ZohoMatch was set to 'No', only with reset_unmatched
+        skipped: Zoho rows without a date or amount
+        unmatched_transactions: Ledger rows missing from Zoho
+        unmatched_zoho: Zoho rows missing from the ledger
+    """
+    start: Optional[date] = None
+    end: Optional[date] = None
+    zoho_rows: int = 0
+    transactions: int = 0
+    matched: List[Tuple[int, int]] = field(default_factory=list)
+    marked_yes: int = 0
+    marked_no: int = 0
+    skipped: int = 0
+    unmatched_transactions: List[UnmatchedTransaction] = field(default_factory=list)
+    unmatched_zoho: List[ZohoRow] = field(default_factory=list)
+
+
+def normalize_reference(value: Any) -> str:
+    """Reduce a reference or description to lowercase letters and digits."""
+    return re.sub(r"[^a-z0-9]", "", str(value or "").lower())
+
+
+def _cents(amount: Any) -> int:
+    # Zoho exports expenses as positive totals while the ledger signs debits
+    return abs(int(round(Decimal(str(amount)) * 100)))
+
+
+def read_zoho_rows(source: Union[str, IO[bytes]]) -> Tuple[List[ZohoRow], int]:
+    """Read a Zoho Books CSV export.
+
+    Args:
+        source: Path or binary file object of the CSV
+
+    Returns:
+        Tuple of the rows and the number of rows skipped for lacking a
+        date or an amount
+
+    Raises:
+        ZohoImportError: If the date or amount column is missing
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            content = file.read()
+    else:
+        content = source.read()
+    reader = csv.reader(io.StringIO(content.decode("utf-8-sig", errors="replace")))
+    header = [normalize_reference(name) for name in next(reader, [])]
+    positions = {}
+    for key, aliases in ZOHO_COLUMNS.items():
+        positions[key] = next((header.index(alias) for alias in aliases if alias in header), None)
+    if positions["date"] is None:
+        raise ZohoImportError("Zoho export has no date column")
+    if positions["amount"] is None and positions["debit"] is None and positions["credit"] is None:
+        raise ZohoImportError("Zoho export has no amount column")
+
+    def cell(row: Sequence[str], key: str) -> Optional[str]:
+        index = positions[key]
+        return row[index] if index is not None and index < len(row) else None
+
+    rows, skipped = [], 0
+    for line, row in enumerate(reader, start=2):
+        day = parse_date(cell(row, "date"), ZOHO_DATE_FORMATS)
+        try:
+            if positions["amount"] is not None:
+                amount = parse_amount(cell(row, "amount"))
+            else:
+                amount = (parse_amount(cell(row, "credit")) or Decimal(0)) - \
+                    (parse_amount(cell(row, "debit")) or Decimal(0))
+        except ValueError:
+            amount = None
+        if day is None or amount is None:
+            skipped += 1
+            continue
+        rows.append(ZohoRow(
+            line=line,
+            day=day,
+            amount=amount,
+            reference=normalize_reference(cell(row, "reference")),
+            description=(cell(row, "description") or "").strip(),
+        ))
+    return rows, skipped
+
+
+def _chunks(values: Sequence[int], size: int) -> Iterator[List[int]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def match_zoho_export(
+    db: Session,
+    source: Union[str, IO[bytes]],
+    *,
+    dry_run: bool = False,
+    reset_unmatched: bool = False,
+    batch_size: Optional[int] = None
+) -> ZohoMatchResult:
+    """Match a Zoho Books export against Transactions(Past) and set ZohoMatch.
+
+    Ledger rows are matched on date and absolute amount. Zoho rows whose
+    normalized reference equals a ledger row's TrNo or normalized
+    description are matched to it first; the remaining ledger rows then
+    take the remaining Zoho rows of the same date and amount in order.
+    Every Zoho row matches at most once.
+
+    Args:
+        db: Database session
+        source: Path or binary file object of the CSV export
+        dry_run: Report the matches without writing ZohoMatch
+        reset_unmatched: Also set ZohoMatch 'No' on ledger rows of the range
+            this export does not match. Rows confirmed by another Zoho
+            export, Cash and personal rows are downgraded too, so only use
+            it with a complete export of the range
+        batch_size: Ledger rows per streamed batch and keys per UPDATE,
+            defaults to settings.IMPORT_BATCH_SIZE
+
+    Returns:
+        ZohoMatchResult: Matches, ZohoMatch changes and unmatched rows of both sides
+
+    Raises:
+        ZohoImportError: If the export cannot be read
+    """
+    size = batch_size or settings.IMPORT_BATCH_SIZE
+    rows, skipped = read_zoho_rows(source)
+    result = ZohoMatchResult(zoho_rows=len(rows), skipped=skipped)
+    if not rows:
+        return result
+    result.start = min(row.day for row in rows)
+    result.end = max(row.day for row in rows)
+
+    by_reference: Dict[Tuple[date, int, str], List[ZohoRow]] = defaultdict(list)
+    by_amount: Dict[Tuple[date, int], List[ZohoRow]] = defaultdict(list)
+    for row in rows:
+        by_amount[row.day, _cents(row.amount)].append(row)
+        if row.reference:
+            by_reference[row.day, _cents(row.amount), row.reference].append(row)
+    used = set()
+
+    def take(candidates: List[ZohoRow]) -> Optional[ZohoRow]:
+        while candidates:
+            row = candidates.pop(0)
+            if row.line not in used:
+                used.add(row.line)
+                return row
+        return None
+
+    yes, no = [], []
+    # Rows without a reference match wait until every reference has been
+    # claimed, so a referenced Zoho row is never taken by an amount-only match
+    pending = []
+    ledger = db.execute(
+        select(Transaction.TrNo, Transaction.Date, Transaction.Amount, Transaction.Description, Transaction.ZohoMatch)
+        .where(
+            Transaction.Date >= datetime.combine(result.start, time.min),
+            Transaction.Date < datetime.combine(result.end + timedelta(days=1), time.min),
+        )
+        .order_by(Transaction.Date, Transaction.TrNo)
+        .execution_options(yield_per=size)
+    )
+    matches: Dict[int, ZohoRow] = {}
+    for transaction in ledger:
+        result.transactions += 1
+        if transaction.Amount is None:
+            pending.append(transaction)
+            continue
+        day, cents = transaction.Date.date(), _cents(transaction.Amount)
+        match = (
+            take(by_reference.get((day, cents, str(transaction.TrNo)), []))
+            or take(by_reference.get((day, cents, normalize_reference(transaction.Description)), []))
+        )
+        if match is None:
+            pending.append(transaction)
+        else:
+            matches[transaction.TrNo] = match
+            if transaction.ZohoMatch != "Yes":
+                yes.append(transaction.TrNo)
+    for transaction in pending:
+        match = None
+        if transaction.Amount is not None:
+            match = take(by_amount.get((transaction.Date.date(), _cents(transaction.Amount)), []))
+        if match is not None:
+            matches[transaction.TrNo] = match
+            if transaction.ZohoMatch != "Yes":
+                yes.append(transaction.TrNo)
+        else:
+            result.unmatched_transactions.append(UnmatchedTransaction(
+                transaction.TrNo, transaction.Date.date(), transaction.Amount, transaction.Description
+            ))
+            if reset_unmatched and transaction.ZohoMatch != "No":
+                no.append(transaction.TrNo)
+    result.matched = sorted((match.line, tr_no) for tr_no, match in matches.items())
+    result.unmatched_zoho = [row for row in rows if row.line not in used]
+    result.marked_yes, result.marked_no = len(yes), len(no)
+    logger.info(
+        f"Zoho export {result.start}..{result.end}: {len(result.matched)} matched, "
+        f"{len(result.unmatched_transactions)} ledger and {len(result.unmatched_zoho)} Zoho rows unmatched"
+    )
+
+    if dry_run or not (yes or no):
+        return result
+    try:
+        for value, tr_nos in (("Yes", yes), ("No", no)):
+            for chunk in _chunks(tr_nos, size):
+                db.execute(update(Transaction.__table__).where(Transaction.TrNo.in_(chunk)).values(ZohoMatch=value))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    table_versions.bump(Transaction.__tablename__)
+    return result
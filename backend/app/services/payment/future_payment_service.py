@@ -5,8 +5,8 @@ Following Single Responsibility and Dependency Inversion principles.
 import logging
 from datetime import datetime, date
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.crud.crud_future import crud_future
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud.crud_future import async_future
 from app.models.models import FreedomFuture
 from app.services.notification.base import NotificationProvider, NotificationMessage
 
@@ -17,12 +17,12 @@ class FuturePaymentService:
     
     def __init__(
         self,
-        db: Session,
+        db: AsyncSession,
         notification_provider: Optional[NotificationProvider] = None
     ):
         """Initialize with database session and optional notification provider."""
         self.db = db
-        self.crud = crud_future  # Use the pre-initialized crud_future instance
+        self.crud = async_future  # Use the pre-initialized async_future instance
         self.notification_provider = notification_provider
     
     async def get_unpaid_payments(
@@ -36,7 +36,7 @@ class FuturePaymentService:
         """
         try:
             start_date = start_date or datetime.now().date()
-            payments = self.crud.get_unpaid(
+            payments = await self.crud.get_unpaid(
                 db=self.db,
                 start_date=start_date
             )
@@ -50,7 +50,7 @@ class FuturePaymentService:
     async def mark_payment_as_paid(self, tr_no: int) -> Optional[FreedomFuture]:
         """Mark a specific payment as paid."""
         try:
-            payment = self.crud.mark_as_paid(
+            payment = await self.crud.mark_as_paid(
                 db=self.db,
                 id=tr_no
             )
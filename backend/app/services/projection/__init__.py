@@ -0,0 +1,36 @@
+"""
+Projection service package
+"""
+from .amortization import (
+    SCHEDULE_COMMENT,
+    Amortization,
+    ScheduleResult,
+    amortize,
+    generate_schedules,
+)
+from .cashflow import (
+    MAX_HORIZON_MONTHS,
+    Granularity,
+    Projection,
+    ProjectionInputs,
+    load_inputs,
+    monthly_rates,
+    project,
+    project_monthly,
+)
+
+__all__ = [
+    "SCHEDULE_COMMENT",
+    "Amortization",
+    "ScheduleResult",
+    "amortize",
+    "generate_schedules",
+    "MAX_HORIZON_MONTHS",
+    "Granularity",
+    "Projection",
+    "ProjectionInputs",
+    "load_inputs",
+    "monthly_rates",
+    "project",
+    "project_monthly",
+]
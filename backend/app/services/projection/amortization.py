@@ -0,0 +1,232 @@
+"""
+Vectorized amortization schedules for EMI and hand-loan accounts.
+Every account's schedule is computed at once on an accounts x installments
+matrix; the rows then replace the previously generated Freedom(Future)
+entries in a single transaction.
+"""
+import calendar
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.crud.crud_future import crud_future
+from app.models.models import AccountsPresent, AccountType, Category, Department
+from app.services.projection.cashflow import due_day, monthly_rates
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_TYPES = (AccountType.EMI, AccountType.HL, AccountType.HLG)
+
+# Comments prefix marking generated rows, so regeneration replaces only those
+SCHEDULE_COMMENT = "Generated amortization schedule"
+
+
+@dataclass
+class Amortization:
+    """Flat schedule rows, one per account installment.
+
+    Attributes:
+        accounts: Account index of each row
+        numbers: Installment number, starting at 1
+        payments: Installment amount
+        interest: Interest part of the installment
+        principal: Principal part of the installment
+        remaining: Principal outstanding after the installment
+    """
+    accounts: np.ndarray
+    numbers: np.ndarray
+    payments: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    remaining: np.ndarray
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of a schedule generation run.
+
+    Attributes:
+        rows: Freedom(Future) rows that were (or would be) written
+        replaced: Previously generated rows deleted
+        skipped: Rows not written because a manual entry covers that month
+        accounts: Per-account installment, count and total interest
+    """
+    rows: List[dict] = field(default_factory=list)
+    replaced: int = 0
+    skipped: int = 0
+    accounts: List[dict] = field(default_factory=list)
+
+
+def amortize(
+    principals: np.ndarray,
+    rates: np.ndarray,
+    tenures: np.ndarray,
+    interest_only_months: int
+) -> Amortization:
+    """Compute equal-installment schedules for all accounts at once.
+
+    Accounts with a Tenure repay the principal with an annuity
+    ``P * r / (1 - (1 + r) ** -n)`` (``P / n`` when r is 0); the remaining
+    principal after k installments is ``P * g - A * (g - 1) / r`` with
+    ``g = (1 + r) ** k``. The last installment absorbs rounding so the
+    balance ends at exactly zero. Accounts without a Tenure pay interest
+    only for interest_only_months.
+
+    Args:
+        principals: Outstanding principal per account (positive)
+        rates: Monthly interest rate per account, as a fraction
+        tenures: Installments left per account, 0 for interest-only
+        interest_only_months: Installments generated for interest-only accounts
+
+    Returns:
+        Amortization: Rows ordered by account, then installment
+    """
+    amortizing = tenures > 0
+    counts = np.where(amortizing, tenures, interest_only_months)
+    numbers = np.arange(1, int(counts.max(initial=0)) + 1)
+    r = rates[:, None]
+    growth = (1.0 + r) ** numbers
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(
+            rates > 0,
+            principals * rates / (1.0 - (1.0 + rates) ** -counts.astype(np.float64)),
+            principals / np.maximum(counts, 1),
+        )
+        payment = np.where(amortizing, annuity, principals * rates).round(2)
+        remaining = np.where(
+            r > 0,
+            principals[:, None] * growth - payment[:, None] * (growth - 1.0) / r,
+            principals[:, None] - payment[:, None] * numbers,
+        )
+    remaining = np.where(amortizing[:, None], remaining, principals[:, None]).round(2)
+    previous = np.concatenate([principals[:, None], remaining[:, :-1]], axis=1)
+    payments = np.broadcast_to(payment[:, None], remaining.shape)
+
+    last = amortizing[:, None] & (numbers[None, :] == counts[:, None])
+    payments = np.where(last, previous + (previous * r).round(2), payments)
+    remaining = np.where(last, 0.0, remaining)
+    # Principal telescopes from the remaining balances so it sums to P exactly
+    principal = (previous - remaining).round(2)
+    interest = (payments - principal).round(2)
+
+    accounts, columns = np.nonzero(numbers[None, :] <= counts[:, None])
+    return Amortization(
+        accounts=accounts,
+        numbers=numbers[columns],
+        payments=payments[accounts, columns].round(2),
+        interest=interest[accounts, columns],
+        principal=principal[accounts, columns],
+        remaining=remaining[accounts, columns],
+    )
+
+
+def installment_date(start: date, day: int, number: int) -> date:
+    """Due date of an installment on the given day of month, clamped to short months.
+
+    The first installment falls in start's month when the day has not passed yet.
+    """
+    offset = number - 1 if day >= start.day else number
+    year, month = divmod(start.month - 1 + offset, 12)
+    year += start.year
+    month += 1
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def generate_schedules(
+    db: Session,
+    *,
+    start: date,
+    acc_ids: Optional[Sequence[str]] = None,
+    interest_only_months: int = 12,
+    dry_run: bool = False
+) -> ScheduleResult:
+    """Derive schedules from account terms and write them to Freedom(Future).
+
+    Uses Balance as the outstanding principal, IntRate, Tenure as the
+    installments left and the day in NextDueDate. Amounts are signed like the
+    balance: payments on borrowed loans are negative, receipts on loans given
+    (HLG) positive.
+
+    Args:
+        db: Database session
+        start: Day the schedules start from
+        acc_ids: Accounts to schedule, all EMI/HL/HLG accounts if None
+        interest_only_months: Months generated for accounts without a Tenure
+        dry_run: Compute the rows without writing them
+
+    Returns:
+        ScheduleResult: Generated rows and write counts
+    """
+    query = select(AccountsPresent).where(
+        AccountsPresent.Type.in_(SCHEDULE_TYPES),
+        AccountsPresent.Balance != 0,
+        or_(AccountsPresent.Tenure > 0, AccountsPresent.IntRate != 0),
+    ).order_by(AccountsPresent.AccID)
+    if acc_ids is not None:
+        query = query.where(AccountsPresent.AccID.in_(list(acc_ids)))
+    accounts = list(db.scalars(query).all())
+
+    balances = np.array([float(a.Balance) for a in accounts], dtype=np.float64)
+    schedule = amortize(
+        np.abs(balances),
+        monthly_rates(np.array([float(a.IntRate or 0) for a in accounts], dtype=np.float64)),
+        np.array([a.Tenure or 0 for a in accounts], dtype=np.int64),
+        interest_only_months,
+    )
+
+    signs = np.sign(balances).tolist()
+    rows = []
+    for i, number, payment, interest, principal, remaining in zip(
+        schedule.accounts.tolist(), schedule.numbers.tolist(), schedule.payments.tolist(),
+        schedule.interest.tolist(), schedule.principal.tolist(), schedule.remaining.tolist(),
+    ):
+        account = accounts[i]
+        due = installment_date(start, due_day(account.NextDueDate) or 1, number)
+        is_emi = account.Type == AccountType.EMI
+        count = account.Tenure or interest_only_months
+        rows.append({
+            "Date": due,
+            "Description": f"{due:%Y %B} {'EMI' if is_emi else 'Interest'} {account.AccID}",
+            "Amount": round(signs[i] * payment, 2),
+            "PaymentMode": account.Bank,
+            "AccID": account.AccID,
+            "Department": Department.Serendipity,
+            "Comments": (
+                f"{SCHEDULE_COMMENT} {number}/{count}: principal {principal:.2f}, "
+                f"interest {interest:.2f}, remaining {remaining:.2f}"
+            ),
+            "Category": Category.EMI if is_emi else Category.Hand_Loans,
+            "Paid": False,
+        })
+
+    summary: Dict[str, dict] = {}
+    for row, payment, interest in zip(rows, schedule.payments.tolist(), schedule.interest.tolist()):
+        entry = summary.setdefault(row["AccID"], {
+            "AccID": row["AccID"], "installment": payment, "installments": 0,
+            "total_interest": 0.0, "first_due": row["Date"], "last_due": row["Date"],
+        })
+        entry["installments"] += 1
+        entry["total_interest"] = round(entry["total_interest"] + interest, 2)
+        entry["last_due"] = row["Date"]
+
+    result = ScheduleResult(rows=rows, accounts=list(summary.values()))
+    if dry_run:
+        return result
+
+    scheduled_ids = [account.AccID for account in accounts]
+    result.replaced, written = crud_future.replace_generated(
+        db, acc_ids=scheduled_ids, start=start, marker=SCHEDULE_COMMENT, rows=rows
+    )
+    result.skipped = len(rows) - len(written)
+    result.rows = written
+    logger.info(
+        f"Generated {len(written)} schedule rows for {len(scheduled_ids)} accounts "
+        f"(replaced {result.replaced}, skipped {result.skipped})"
+    )
+    return result
@@ -0,0 +1,40 @@
+"""
+Reconciliation service package
+"""
+from .description_sync import (
+    SYNC_TABLES,
+    DescriptionChange,
+    DescriptionSyncResult,
+    SyncPair,
+    SyncTarget,
+    matched_pairs,
+    sync_descriptions,
+)
+from .matcher import (
+    Candidate,
+    LedgerEntry,
+    LedgerIndex,
+    ReconciliationResult,
+    StatementEntry,
+    description_similarity,
+    match_lines,
+    reconcile,
+)
+
+__all__ = [
+    "SYNC_TABLES",
+    "Candidate",
+    "DescriptionChange",
+    "DescriptionSyncResult",
+    "LedgerEntry",
+    "LedgerIndex",
+    "ReconciliationResult",
+    "StatementEntry",
+    "SyncPair",
+    "SyncTarget",
+    "description_similarity",
+    "match_lines",
+    "matched_pairs",
+    "reconcile",
+    "sync_descriptions",
+]
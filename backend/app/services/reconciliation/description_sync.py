@@ -0,0 +1,229 @@
+"""
+Bulk description sync from bank statements.
+Reconciled (statement line, TrNo) pairs carry the bank's narration over to
+Transactions(Past) or Freedom(Future). Current values are read with one IN
+query per chunk and every changed row is written by a single executemany
+UPDATE, all in one transaction, instead of a commit per row. The content
+fingerprint of a Transactions(Past) row covers its description, so it is
+rewritten in the same UPDATE.
+"""
+import enum
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import table_versions
+from app.core.config import settings
+from app.crud.fingerprint import fingerprint_owners, transaction_fingerprint
+from app.models.models import BankStatementLine, FreedomFuture, StatementMatch
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+
+class SyncTarget(str, enum.Enum):
+    """Tables whose descriptions can be synced from statements."""
+    transactions = "transactions"
+    future = "future"
+
+
+SYNC_TABLES: Dict[SyncTarget, Table] = {
+    SyncTarget.transactions: Transaction.__table__,
+    SyncTarget.future: FreedomFuture.__table__,
+}
+
+
+@dataclass(frozen=True)
+class SyncPair:
+    """A statement line reconciled with a row of the target table.
+
+    Attributes:
+        line_id: BankStatementLines row whose Description is copied
+        tr_no: Row of the target table to update
+        comments: New Comments for the row, left as is when None
+    """
+    line_id: int
+    tr_no: int
+    comments: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DescriptionChange:
+    """One column value replaced (or to be replaced, on a dry run)."""
+    tr_no: int
+    line_id: int
+    column: str
+    old: Optional[str]
+    new: Optional[str]
+
+
+@dataclass
+class DescriptionSyncResult:
+    """Outcome of a description sync.
+
+    Attributes:
+        target: Table that was synced
+        pairs: Pairs given
+        updated: Rows with at least one changed column
+        unchanged: Rows that already had the statement's values
+        changes: Every changed column, old and new value
+        errors: Pairs skipped because their line or row does not exist or repeats,
+            or because the new description would duplicate another transaction
+    """
+    target: SyncTarget
+    pairs: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    changes: List[DescriptionChange] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+def _chunks(values: Sequence[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def matched_pairs(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> List[SyncPair]:
+    """Pairs of the accepted reconciliation matches.
+
+    Args:
+        db: Database session
+        start: Only lines dated on or after this day
+        end: Only lines dated on or before this day
+
+    Returns:
+        List[SyncPair]: One pair per stored match, in line order
+    """
+    StatementMatch.__table__.create(db.get_bind(), checkfirst=True)
+    query = (
+        select(StatementMatch.LineID, StatementMatch.TrNo)
+        .join(BankStatementLine, BankStatementLine.LineID == StatementMatch.LineID)
+        .order_by(StatementMatch.LineID)
+    )
+    if start is not None:
+        query = query.where(BankStatementLine.Date >= start)
+    if end is not None:
+        query = query.where(BankStatementLine.Date <= end)
+    return [SyncPair(line_id=row.LineID, tr_no=row.TrNo) for row in db.execute(query)]
+
+
+def sync_descriptions(
+    db: Session,
+    pairs: Sequence[SyncPair],
+    *,
+    target: SyncTarget = SyncTarget.transactions,
+    dry_run: bool = False,
+    batch_size: Optional[int] = None
+) -> DescriptionSyncResult:
+    """Copy statement narrations into the Description of reconciled rows.
+
+    Args:
+        db: Database session
+        pairs: Reconciled (statement line, TrNo) pairs
+        target: Table the TrNos belong to
+        dry_run: Compute the diff without writing it
+        batch_size: Keys per lookup query, defaults to settings.IMPORT_BATCH_SIZE
+
+    Returns:
+        DescriptionSyncResult: Counts and the column-level diff
+    """
+    table = SYNC_TABLES[target]
+    size = batch_size or settings.IMPORT_BATCH_SIZE
+    result = DescriptionSyncResult(target=target, pairs=len(pairs))
+
+    narrations: Dict[int, str] = {}
+    line_ids = sorted({pair.line_id for pair in pairs})
+    for chunk in _chunks(line_ids, size):
+        for row in db.execute(
+            select(BankStatementLine.LineID, BankStatementLine.Description)
+            .where(BankStatementLine.LineID.in_(chunk))
+        ):
+            narrations[row.LineID] = row.Description
+
+    fingerprinted = target is SyncTarget.transactions
+    content = [table.c.Date, table.c.Amount, table.c.AccID, table.c.PaymentMode] if fingerprinted else []
+    current: Dict[int, Any] = {}
+    tr_nos = sorted({pair.tr_no for pair in pairs})
+    for chunk in _chunks(tr_nos, size):
+        for row in db.execute(
+            select(table.c.TrNo, table.c.Description, table.c.Comments, *content).where(table.c.TrNo.in_(chunk))
+        ):
+            current[row.TrNo] = row
+
+    # New fingerprints of the rows whose description changes, checked
+    # against the ledger with one lookup per chunk
+    fingerprints: Dict[int, str] = {}
+    if fingerprinted:
+        for pair in pairs:
+            row = current.get(pair.tr_no)
+            if row is not None and pair.line_id in narrations and narrations[pair.line_id] != row.Description:
+                fingerprints[pair.tr_no] = transaction_fingerprint(
+                    row.Date, row.Amount, row.AccID, row.PaymentMode, narrations[pair.line_id]
+                )
+    owners = fingerprint_owners(db, fingerprints.values(), size) if fingerprints else {}
+
+    # Column set -> rows, so each UPDATE shape is one executemany
+    shapes: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+    seen = set()
+    for pair in pairs:
+        if pair.tr_no in seen:
+            result.errors.append(f"TrNo {pair.tr_no} is paired with more than one statement line")
+            continue
+        seen.add(pair.tr_no)
+        if pair.line_id not in narrations:
+            result.errors.append(f"Statement line {pair.line_id} does not exist")
+            continue
+        if pair.tr_no not in current:
+            result.errors.append(f"TrNo {pair.tr_no} does not exist in {table.name}")
+            continue
+        old_description, old_comments = current[pair.tr_no].Description, current[pair.tr_no].Comments
+        values = {}
+        fingerprint = fingerprints.get(pair.tr_no)
+        if fingerprint is not None:
+            owner = owners.get(fingerprint, pair.tr_no)
+            if owner != pair.tr_no:
+                result.errors.append(f"TrNo {pair.tr_no} would duplicate transaction {owner}")
+                continue
+            owners[fingerprint] = pair.tr_no
+        if narrations[pair.line_id] != old_description:
+            values["Description"] = narrations[pair.line_id]
+            result.changes.append(DescriptionChange(
+                pair.tr_no, pair.line_id, "Description", old_description, narrations[pair.line_id]
+            ))
+        if pair.comments is not None and pair.comments != old_comments:
+            values["Comments"] = pair.comments
+            result.changes.append(DescriptionChange(
+                pair.tr_no, pair.line_id, "Comments", old_comments, pair.comments
+            ))
+        if not values:
+            result.unchanged += 1
+            continue
+        result.updated += 1
+        if fingerprint is not None:
+            values["Fingerprint"] = fingerprint
+        shapes[tuple(values)].append(
+            {"key_TrNo": pair.tr_no, **{f"new_{name}": value for name, value in values.items()}}
+        )
+
+    if dry_run or not shapes:
+        return result
+    try:
+        for columns, rows in shapes.items():
+            stmt = update(table).where(table.c.TrNo == bindparam("key_TrNo")).values({
+                name: bindparam(f"new_{name}") for name in columns
+            })
+            db.execute(stmt, rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    table_versions.bump(table.name)
+    logger.info(f"Synced {result.updated} descriptions into {table.name}")
+    return result
@@ -0,0 +1,280 @@
+"""
+Statement to ledger reconciliation.
+Ledger transactions are bucketed in a hash index by (PaymentMode, Amount in
+paise) and kept date-sorted within each bucket, so every statement line only
+scores the few transactions of its exact amount inside a bisected date
+window instead of the whole ledger. Candidates are ranked by description
+similarity, with date proximity breaking ties.
+"""
+import logging
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import table_versions
+from app.core.config import settings
+from app.models.models import BankStatementLine, PaymentMode, StatementMatch
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Share of the score given to description similarity; the rest rewards
+# transactions dated closer to the statement line
+DESCRIPTION_WEIGHT = 0.8
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    """A Transactions(Past) row as seen by the matcher."""
+    tr_no: int
+    day: date
+    description: str
+
+
+@dataclass(frozen=True)
+class StatementEntry:
+    """A BankStatementLines row as seen by the matcher."""
+    line_id: int
+    bank: str
+    day: date
+    amount: Decimal
+    description: str
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A ledger transaction a statement line could match, with its score."""
+    tr_no: int
+    score: float
+
+
+@dataclass
+class ReconciliationResult:
+    """Outcome of matching statement lines against the ledger.
+
+    Attributes:
+        matched: Line ID -> accepted candidate
+        ambiguous: Line ID -> candidates too close to call, best first
+        unmatched: Line IDs with no ledger transaction of that bank and amount in the window
+    """
+    matched: Dict[int, Candidate] = field(default_factory=dict)
+    ambiguous: Dict[int, List[Candidate]] = field(default_factory=dict)
+    unmatched: List[int] = field(default_factory=list)
+
+
+def _amount_key(amount) -> int:
+    return int(round(Decimal(str(amount)) * 100))
+
+
+def _tokens(text: Optional[str]) -> frozenset:
+    return frozenset(token for token in re.split(r"[^a-z0-9]+", (text or "").lower()) if len(token) > 1)
+
+
+def description_similarity(first: Optional[str], second: Optional[str]) -> float:
+    """Share of the shorter description's words found in the other one.
+
+    Statement narrations wrap the payee in reference numbers and channel
+    codes (``UPI/4182/IND MONEY/...``), so the overlap is measured against
+    the shorter text rather than the union.
+
+    Args:
+        first: Description
+        second: Description
+
+    Returns:
+        float: Similarity between 0 and 1
+    """
+    a, b = _tokens(first), _tokens(second)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+class LedgerIndex:
+    """Hash index of ledger transactions by (PaymentMode, amount), date-sorted per bucket."""
+
+    def __init__(self, entries: Iterable[Tuple[str, int, LedgerEntry]]) -> None:
+        buckets: Dict[Tuple[str, int], List[LedgerEntry]] = defaultdict(list)
+        for bank, amount, entry in entries:
+            buckets[bank, amount].append(entry)
+        self._buckets: Dict[Tuple[str, int], Tuple[List[int], List[LedgerEntry]]] = {}
+        for key, bucket in buckets.items():
+            bucket.sort(key=lambda entry: (entry.day, entry.tr_no))
+            self._buckets[key] = ([entry.day.toordinal() for entry in bucket], bucket)
+
+    def window(self, bank: str, amount, day: date, days: int) -> List[LedgerEntry]:
+        """Transactions of a bank and amount dated within ``days`` of a day.
+
+        Args:
+            bank: PaymentMode name
+            amount: Signed amount
+            day: Statement date
+            days: Window half-width in days
+
+        Returns:
+            List[LedgerEntry]: Candidates in date order
+        """
+        bucket = self._buckets.get((bank, _amount_key(amount)))
+        if bucket is None:
+            return []
+        ordinals, entries = bucket
+        low = bisect_left(ordinals, day.toordinal() - days)
+        high = bisect_right(ordinals, day.toordinal() + days)
+        return entries[low:high]
+
+
+def match_lines(
+    lines: Sequence[StatementEntry],
+    index: LedgerIndex,
+    *,
+    window_days: Optional[int] = None,
+    margin: Optional[float] = None
+) -> ReconciliationResult:
+    """Match statement lines to ledger transactions.
+
+    A line with one candidate is matched to it; with several, the best is
+    matched only if it leads the runner-up by ``margin``. When two lines
+    pick the same transaction the higher score keeps it and the other
+    line becomes ambiguous.
+
+    Args:
+        lines: Statement lines to reconcile
+        index: Ledger transactions that are not matched yet
+        window_days: Days a transaction may be dated from its line,
+            defaults to settings.RECONCILE_WINDOW_DAYS
+        margin: Required lead of the best candidate, defaults to settings.RECONCILE_MARGIN
+
+    Returns:
+        ReconciliationResult: Matched, ambiguous and unmatched lines
+    """
+    window_days = settings.RECONCILE_WINDOW_DAYS if window_days is None else window_days
+    margin = settings.RECONCILE_MARGIN if margin is None else margin
+    result = ReconciliationResult()
+    claims: Dict[int, List[Tuple[Candidate, int]]] = defaultdict(list)
+    ranked: Dict[int, List[Candidate]] = {}
+
+    for line in lines:
+        entries = index.window(line.bank, line.amount, line.day, window_days)
+        if not entries:
+            result.unmatched.append(line.line_id)
+            continue
+        candidates = sorted(
+            (
+                Candidate(
+                    tr_no=entry.tr_no,
+                    score=round(
+                        DESCRIPTION_WEIGHT * description_similarity(line.description, entry.description)
+                        + (1 - DESCRIPTION_WEIGHT) * (1 - abs((entry.day - line.day).days) / (window_days + 1)),
+                        4,
+                    ),
+                )
+                for entry in entries
+            ),
+            key=lambda candidate: (-candidate.score, candidate.tr_no),
+        )
+        ranked[line.line_id] = candidates
+        if len(candidates) == 1 or candidates[0].score - candidates[1].score >= margin:
+            claims[candidates[0].tr_no].append((candidates[0], line.line_id))
+        else:
+            result.ambiguous[line.line_id] = candidates
+
+    for claimants in claims.values():
+        claimants.sort(key=lambda claim: (-claim[0].score, claim[1]))
+        best, line_id = claimants[0]
+        result.matched[line_id] = best
+        for _, other in claimants[1:]:
+            result.ambiguous[other] = ranked[other]
+    return result
+
+
+def reconcile(
+    db: Session,
+    start: date,
+    end: date,
+    *,
+    bank: Optional[PaymentMode] = None,
+    window_days: Optional[int] = None,
+    margin: Optional[float] = None,
+    persist: bool = True
+) -> ReconciliationResult:
+    """Reconcile the statement lines of a date range and store the matches.
+
+    Lines and transactions that already have an accepted match are left
+    out, so running overlapping ranges only works on what is still open.
+
+    Args:
+        db: Database session
+        start: First statement date to reconcile
+        end: Last statement date to reconcile
+        bank: Only reconcile this bank account
+        window_days: Days a transaction may be dated from its line
+        margin: Required lead of the best candidate
+        persist: Store the matched pairs in StatementMatches
+
+    Returns:
+        ReconciliationResult: Matched, ambiguous and unmatched lines
+    """
+    window_days = settings.RECONCILE_WINDOW_DAYS if window_days is None else window_days
+    bind = db.get_bind()
+    BankStatementLine.__table__.create(bind, checkfirst=True)
+    StatementMatch.__table__.create(bind, checkfirst=True)
+
+    query = (
+        select(
+            BankStatementLine.LineID, BankStatementLine.Bank, BankStatementLine.Date,
+            BankStatementLine.Amount, BankStatementLine.Description,
+        )
+        .outerjoin(StatementMatch, StatementMatch.LineID == BankStatementLine.LineID)
+        .where(
+            StatementMatch.LineID.is_(None),
+            BankStatementLine.Date >= start,
+            BankStatementLine.Date <= end,
+        )
+    )
+    if bank is not None:
+        query = query.where(BankStatementLine.Bank == bank)
+    lines = [
+        StatementEntry(line_id=row.LineID, bank=row.Bank.name, day=row.Date, amount=row.Amount, description=row.Description)
+        for row in db.execute(query)
+    ]
+    if not lines:
+        return ReconciliationResult()
+
+    ledger = db.execute(
+        select(Transaction.TrNo, Transaction.Date, Transaction.Amount, Transaction.PaymentMode, Transaction.Description)
+        .where(
+            Transaction.PaymentMode.in_({line.bank for line in lines}),
+            Transaction.Date >= datetime.combine(start - timedelta(days=window_days), time.min),
+            Transaction.Date < datetime.combine(end + timedelta(days=window_days + 1), time.min),
+            Transaction.TrNo.not_in(select(StatementMatch.TrNo)),
+        )
+    )
+    index = LedgerIndex(
+        (row.PaymentMode, _amount_key(row.Amount), LedgerEntry(row.TrNo, row.Date.date(), row.Description))
+        for row in ledger if row.Amount is not None
+    )
+    result = match_lines(lines, index, window_days=window_days, margin=margin)
+    logger.info(
+        f"Reconciled {len(lines)} statement lines: {len(result.matched)} matched, "
+        f"{len(result.ambiguous)} ambiguous, {len(result.unmatched)} unmatched"
+    )
+
+    if persist and result.matched:
+        try:
+            db.execute(insert(StatementMatch), [
+                {"LineID": line_id, "TrNo": candidate.tr_no, "Score": candidate.score}
+                for line_id, candidate in result.matched.items()
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        table_versions.bump(StatementMatch.__tablename__)
+    return result
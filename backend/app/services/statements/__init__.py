@@ -0,0 +1,44 @@
+"""
+Bank statement service package
+"""
+from .formats import (
+    STATEMENT_BANKS,
+    STATEMENT_FORMATS,
+    StatementFormat,
+    StatementParseError,
+    hash_lines,
+    infer_bank,
+    line_hash,
+    parse_amount,
+    parse_date,
+    parse_statement,
+    statement_format,
+)
+from .ingest import (
+    StatementImportResult,
+    ingest_statements,
+    ingest_statements_async,
+    parse_pool,
+    shutdown_parse_pool,
+    stage_lines,
+)
+
+__all__ = [
+    "STATEMENT_BANKS",
+    "STATEMENT_FORMATS",
+    "StatementFormat",
+    "StatementImportResult",
+    "StatementParseError",
+    "hash_lines",
+    "infer_bank",
+    "ingest_statements",
+    "ingest_statements_async",
+    "line_hash",
+    "parse_amount",
+    "parse_date",
+    "parse_pool",
+    "parse_statement",
+    "shutdown_parse_pool",
+    "stage_lines",
+    "statement_format",
+]
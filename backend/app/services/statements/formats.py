@@ -0,0 +1,364 @@
+"""
+Bank statement layouts and parsing.
+Each bank exports statements with its own column names, date formats and
+debit/credit conventions; a StatementFormat maps them onto the columns of
+BankStatementLines. Parsing is a pure function of the file's bytes so it
+can run in worker processes.
+"""
+import csv
+import hashlib
+import io
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import openpyxl
+
+from app.models.models import PaymentMode
+
+# Rows scanned for the header line; statements start with account details
+HEADER_SEARCH_ROWS = 40
+
+
+class StatementParseError(Exception):
+    """Raised when a statement file cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class StatementFormat:
+    """Column names and conventions of one bank's statement exports.
+
+    Column aliases are compared after lowercasing and dropping everything
+    but letters and digits, so ``Withdrawal Amount (INR )`` matches
+    ``withdrawalamountinr``.
+
+    Attributes:
+        name: Bank family
+        date: Aliases of the transaction date column
+        value_date: Aliases of the value date column
+        description: Aliases of the narration column
+        reference: Aliases of the cheque/reference number column
+        debit: Aliases of the withdrawal column
+        credit: Aliases of the deposit column
+        amount: Aliases of a single signed or Dr/Cr-flagged amount column
+        direction: Aliases of the Dr/Cr indicator for the amount column
+        balance: Aliases of the running balance column
+        date_formats: strptime formats tried, in order, for text dates
+    """
+    name: str
+    date: Tuple[str, ...]
+    description: Tuple[str, ...]
+    value_date: Tuple[str, ...] = ()
+    reference: Tuple[str, ...] = ()
+    debit: Tuple[str, ...] = ()
+    credit: Tuple[str, ...] = ()
+    amount: Tuple[str, ...] = ()
+    direction: Tuple[str, ...] = ()
+    balance: Tuple[str, ...] = ()
+    date_formats: Tuple[str, ...] = ("%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d")
+
+
+STATEMENT_FORMATS: Dict[str, StatementFormat] = {
+    "SBI": StatementFormat(
+        name="SBI",
+        date=("txndate", "transactiondate", "date"),
+        value_date=("valuedate",),
+        description=("description", "narration", "particulars"),
+        reference=("refnochequeno", "chequeno", "refno"),
+        debit=("debit", "withdrawal", "withdrawals"),
+        credit=("credit", "deposit", "deposits"),
+        balance=("balance",),
+        date_formats=("%d %b %Y", "%d-%b-%Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d"),
+    ),
+    "ICICI": StatementFormat(
+        name="ICICI",
+        date=("transactiondate", "txndate", "date"),
+        value_date=("valuedate",),
+        description=("transactionremarks", "remarks", "transactiondetails", "particulars", "description"),
+        reference=("chequenumber", "chequeno", "referencenumber", "refno"),
+        debit=("withdrawalamountinr", "withdrawalamount", "withdrawal", "debit"),
+        credit=("depositamountinr", "depositamount", "deposit", "credit"),
+        amount=("amountinr", "amount"),
+        direction=("crdr", "drcr", "type"),
+        balance=("balanceinr", "balance"),
+        date_formats=("%d/%m/%Y", "%d-%m-%Y", "%d-%b-%Y", "%Y-%m-%d"),
+    ),
+    "DBS": StatementFormat(
+        name="DBS",
+        date=("transactiondate", "txndate", "date"),
+        value_date=("valuedate",),
+        description=("transactiondetails", "description", "particulars", "narration"),
+        reference=("reference", "chequeno", "refno"),
+        debit=("withdrawal", "debitamount", "debit"),
+        credit=("deposit", "creditamount", "credit"),
+        balance=("balance", "runningbalance"),
+        date_formats=("%d-%b-%Y", "%d %b %Y", "%d/%m/%Y", "%Y-%m-%d"),
+    ),
+}
+
+# Payment modes that are bank accounts of a known statement format
+STATEMENT_BANKS = tuple(
+    mode for mode in PaymentMode if mode.name.split("_")[0] in STATEMENT_FORMATS
+)
+
+
+def statement_format(bank: PaymentMode) -> StatementFormat:
+    """Get the statement layout of a bank account.
+
+    Args:
+        bank: Payment mode of the account, e.g. PaymentMode.ICICI_090
+
+    Returns:
+        StatementFormat: Layout of the bank family (SBI, ICICI or DBS)
+
+    Raises:
+        StatementParseError: If the payment mode is not a bank with statements
+    """
+    family = bank.name.split("_")[0]
+    if family not in STATEMENT_FORMATS:
+        raise StatementParseError(f"No statement format for {bank.name}")
+    return STATEMENT_FORMATS[family]
+
+
+def infer_bank(filename: str) -> Optional[PaymentMode]:
+    """Guess the bank account of a statement from its file name.
+
+    The longest payment mode name found in the name wins, so
+    ``ICICI_CC_9003-2024-07.csv`` maps to ICICI_CC_9003 rather than ICICI.
+
+    Args:
+        filename: Statement file name
+
+    Returns:
+        Optional[PaymentMode]: Matching bank account, None if there is none
+    """
+    stem = os.path.basename(filename).upper()
+    candidates = [mode for mode in STATEMENT_BANKS if mode.name.upper() in stem]
+    return max(candidates, key=lambda mode: len(mode.name), default=None)
+
+
+def _normalize(name: Any) -> str:
+    return re.sub(r"[^a-z0-9]", "", str(name or "").lower())
+
+
+def parse_amount(value: Any) -> Optional[Decimal]:
+    """Parse a statement amount such as ``1,234.50``, ``(12.00)`` or ``500 Cr``.
+
+    Args:
+        value: Cell value
+
+    Returns:
+        Optional[Decimal]: Amount, None for blank cells; Dr suffixes and
+        parentheses make it negative
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value))
+    text = str(value).strip().upper().replace(",", "").replace("INR", "").replace("₹", "").strip()
+    if text in ("", "-"):
+        return None
+    negative = text.startswith("(") and text.endswith(")")
+    if text.endswith("DR"):
+        negative, text = True, text[:-2]
+    elif text.endswith("CR"):
+        text = text[:-2]
+    try:
+        amount = Decimal(text.strip("() "))
+    except InvalidOperation:
+        raise ValueError(f"'{value}' is not an amount")
+    return -amount if negative else amount
+
+
+def parse_date(value: Any, formats: Sequence[str]) -> Optional[date]:
+    """Parse a statement date cell.
+
+    Args:
+        value: Cell value, a date/datetime or text
+        formats: strptime formats to try
+
+    Returns:
+        Optional[date]: Date, None if the cell is not a date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or "").strip()
+    if not text:
+        return None
+    # Some exports append a time to the date
+    text = text.split(" ")[0] if re.match(r"^\d{1,4}[-/]\d{1,2}[-/]\d{1,4} ", text) else text
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _table_rows(content: bytes, filename: str) -> Iterator[Sequence[Any]]:
+    """Yield the raw cell rows of a CSV, XLSX or XLS statement."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in (".csv", ".txt"):
+        text = content.decode("utf-8-sig", errors="replace")
+        yield from csv.reader(io.StringIO(text))
+    elif extension in (".xlsx", ".xlsm"):
+        workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    elif extension == ".xls":
+        try:
+            import xlrd
+        except ImportError:
+            raise StatementParseError("xlrd is required to read .xls statements")
+        book = xlrd.open_workbook(file_contents=content)
+        sheet = book.sheet_by_index(0)
+        for index in range(sheet.nrows):
+            row = []
+            for cell in sheet.row(index):
+                if cell.ctype == xlrd.XL_CELL_DATE:
+                    row.append(xlrd.xldate.xldate_as_datetime(cell.value, book.datemode))
+                else:
+                    row.append(cell.value)
+            yield row
+    else:
+        raise StatementParseError(f"Unsupported statement file type '{extension}'")
+
+
+def _find_column(positions: Dict[str, int], aliases: Sequence[str]) -> Optional[int]:
+    for alias in aliases:
+        if alias in positions:
+            return positions[alias]
+    return None
+
+
+def line_hash(row: Dict[str, Any], occurrence: int = 0) -> str:
+    """Hash the content of a parsed statement line.
+
+    The hash covers the bank, date, amount, narration, reference and
+    running balance, not the file name or row, so the same line staged
+    from a renamed or overlapping statement is recognised. Identical lines
+    of one statement are told apart by their occurrence number.
+
+    Args:
+        row: Row produced by parse_statement
+        occurrence: How many identical lines precede this one in the file
+
+    Returns:
+        str: 32 character hex digest
+    """
+    content = "|".join(
+        "" if row.get(key) is None else str(getattr(row[key], "name", row[key]))
+        for key in ("Bank", "Date", "Amount", "Description", "Reference", "Balance")
+    )
+    return hashlib.blake2b(f"{content}|{occurrence}".encode(), digest_size=16).hexdigest()
+
+
+def hash_lines(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Set the LineHash of the rows of one statement that do not have one yet.
+
+    Args:
+        rows: Parsed lines in file order
+
+    Returns:
+        List[Dict[str, Any]]: The same rows
+    """
+    seen: Counter = Counter()
+    for row in rows:
+        if row.get("LineHash") is None:
+            content = line_hash(row)
+            row["LineHash"] = line_hash(row, seen[content])
+            seen[content] += 1
+    return rows
+
+
+def parse_statement(content: bytes, filename: str, bank: PaymentMode) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse a statement file into BankStatementLines rows.
+
+    The header is the first row naming both a date and a description
+    column; rows after it without a parsable date (totals, footers,
+    blank lines) are skipped.
+
+    Args:
+        content: Raw file bytes
+        filename: File name, used for the format and as SourceFile
+        bank: Bank account the statement belongs to
+
+    Returns:
+        Tuple of the parsed rows, each with its LineHash, and the number
+        of skipped rows
+
+    Raises:
+        StatementParseError: If the file type, header or a cell cannot be parsed
+    """
+    layout = statement_format(bank)
+    rows = _table_rows(content, filename)
+    columns = None
+    for number, row in enumerate(rows, start=1):
+        positions: Dict[str, int] = {}
+        for index, name in enumerate(row):
+            positions.setdefault(_normalize(name), index)
+        date_column = _find_column(positions, layout.date)
+        description_column = _find_column(positions, layout.description)
+        if date_column is not None and description_column is not None:
+            columns = {
+                "Date": date_column,
+                "Description": description_column,
+                "ValueDate": _find_column(positions, layout.value_date),
+                "Reference": _find_column(positions, layout.reference),
+                "debit": _find_column(positions, layout.debit),
+                "credit": _find_column(positions, layout.credit),
+                "amount": _find_column(positions, layout.amount),
+                "direction": _find_column(positions, layout.direction),
+                "Balance": _find_column(positions, layout.balance),
+            }
+            break
+        if number >= HEADER_SEARCH_ROWS:
+            break
+    if columns is None:
+        raise StatementParseError(f"No {layout.name} statement header found in {filename}")
+    if columns["debit"] is None and columns["credit"] is None and columns["amount"] is None:
+        raise StatementParseError(f"No amount columns found in {filename}")
+
+    def cell(row: Sequence[Any], key: str) -> Any:
+        index = columns[key]
+        return row[index] if index is not None and index < len(row) else None
+
+    parsed, skipped = [], 0
+    source = os.path.basename(filename)
+    for line_no, row in enumerate(rows, start=number + 1):
+        day = parse_date(cell(row, "Date"), layout.date_formats)
+        if day is None:
+            skipped += 1
+            continue
+        try:
+            if columns["amount"] is not None and columns["debit"] is None:
+                amount = parse_amount(cell(row, "amount")) or Decimal(0)
+                if str(cell(row, "direction") or "").strip().upper().startswith("DR"):
+                    amount = -abs(amount)
+            else:
+                amount = (parse_amount(cell(row, "credit")) or Decimal(0)) - \
+                    (parse_amount(cell(row, "debit")) or Decimal(0))
+            balance = parse_amount(cell(row, "Balance"))
+        except ValueError as e:
+            raise StatementParseError(f"{source} line {line_no}: {e}")
+        reference = cell(row, "Reference")
+        parsed.append({
+            "Bank": bank,
+            "SourceFile": source,
+            "LineNo": line_no,
+            "Date": day,
+            "ValueDate": parse_date(cell(row, "ValueDate"), layout.date_formats),
+            "Description": " ".join(str(cell(row, "Description") or "").split()),
+            "Reference": str(reference).strip() if reference not in (None, "") else None,
+            "Amount": amount.quantize(Decimal("0.01")),
+            "Balance": balance.quantize(Decimal("0.01")) if balance is not None else None,
+        })
+    return hash_lines(parsed), skipped
@@ -0,0 +1,250 @@
+"""
+Bank statement ingestion.
+Statement files are parsed in a process pool, one file per task, and each
+file's lines are inserted into the BankStatementLines staging table as soon
+as it is parsed, so writing overlaps with parsing the remaining files.
+Lines are keyed by a hash of their content, so uploading a statement again,
+or one overlapping an earlier period, stages only the lines not seen before.
+
+The API parses on a long-lived pool from the event loop, so uploads do not
+block the server; the pool spawns its workers instead of forking the
+threaded server process.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import table_versions
+from app.core.config import settings
+from app.models.models import BankStatementLine, PaymentMode
+from .formats import StatementParseError, hash_lines, infer_bank, parse_statement
+
+logger = logging.getLogger(__name__)
+
+_lines = BankStatementLine.__table__
+
+ParsedFile = Tuple[int, List[Dict[str, Any]], int, Optional[str]]
+Job = Tuple[int, str, bytes, PaymentMode]
+
+_spawn = multiprocessing.get_context("spawn")
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass
+class StatementImportResult:
+    """Outcome of ingesting one statement file.
+
+    Attributes:
+        file: File name
+        bank: Bank account the lines were staged under, None if unknown
+        lines: Transaction lines parsed from the file
+        inserted: Lines newly staged
+        duplicates: Lines with the same content already staged by an earlier upload
+        skipped: Rows after the header that are not transactions
+        error: Why the file was not ingested, None on success
+    """
+    file: str
+    bank: Optional[PaymentMode] = None
+    lines: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+
+
+def _parse_file(position: int, filename: str, content: bytes, bank: PaymentMode) -> ParsedFile:
+    """Parse one file in a worker; errors are returned so other files proceed."""
+    try:
+        rows, skipped = parse_statement(content, filename, bank)
+        return position, rows, skipped, None
+    except StatementParseError as e:
+        return position, [], 0, str(e)
+    except Exception as e:
+        return position, [], 0, f"Cannot read {filename}: {e}"
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stage_lines(db: Session, rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+    """Insert parsed lines, skipping ones whose LineHash is already staged.
+
+    Args:
+        db: Database session
+        rows: Lines of one statement as produced by parse_statement; rows
+            without a LineHash are hashed first
+        batch_size: Lines per executemany, defaults to settings.IMPORT_BATCH_SIZE
+
+    Returns:
+        int: Number of lines inserted
+    """
+    hash_lines(rows)
+    statement = sqlite_insert(_lines).on_conflict_do_nothing(
+        index_elements=["LineHash"]
+    )
+    inserted = 0
+    for chunk in _chunks(rows, batch_size or settings.IMPORT_BATCH_SIZE):
+        inserted += db.execute(statement, chunk).rowcount
+    return inserted
+
+
+def parse_pool() -> ProcessPoolExecutor:
+    """Process pool the API parses uploads on, created on first use.
+
+    Returns:
+        ProcessPoolExecutor: Pool of settings.STATEMENT_PARSE_WORKERS processes
+        (0 for one per CPU)
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.STATEMENT_PARSE_WORKERS or None, mp_context=_spawn
+        )
+    return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parse pool's workers; the next upload starts a new pool."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def _plan(
+    files: Sequence[Tuple[str, bytes]], bank: Optional[PaymentMode]
+) -> Tuple[List[StatementImportResult], List[Job]]:
+    """Create the per-file results and the parse jobs of files with a known bank."""
+    results = [StatementImportResult(file=name) for name, _ in files]
+    jobs = []
+    for position, (name, content) in enumerate(files):
+        account = bank or infer_bank(name)
+        if account is None:
+            results[position].error = f"Cannot tell the bank of {name}; pass the bank explicitly"
+            continue
+        results[position].bank = account
+        jobs.append((position, name, content, account))
+    return results, jobs
+
+
+def _create_table(db: Session) -> None:
+    _lines.create(db.get_bind(), checkfirst=True)
+
+
+def _stage(
+    db: Session,
+    results: List[StatementImportResult],
+    parsed: ParsedFile,
+    batch_size: Optional[int] = None
+) -> None:
+    """Record one parsed file in its result and commit its new lines."""
+    position, rows, skipped, error = parsed
+    result = results[position]
+    name = result.file
+    result.lines, result.skipped, result.error = len(rows), skipped, error
+    if error:
+        logger.warning(f"Statement {name} not ingested: {error}")
+        return
+    try:
+        result.inserted = stage_lines(db, rows, batch_size)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    result.duplicates = result.lines - result.inserted
+    if result.inserted:
+        table_versions.bump(BankStatementLine.__tablename__)
+    logger.info(
+        f"Statement {name}: {result.inserted} lines staged, {result.duplicates} already staged"
+    )
+
+
+def ingest_statements(
+    db: Session,
+    files: Sequence[Tuple[str, bytes]],
+    *,
+    bank: Optional[PaymentMode] = None,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> List[StatementImportResult]:
+    """Parse statement files and stage their lines.
+
+    Files are parsed in parallel when there is more than one; each file is
+    committed on its own as soon as it is parsed, so a bad file does not
+    hold back or roll back the others.
+
+    Args:
+        db: Database session
+        files: (file name, content) pairs; the extension selects CSV, XLSX or XLS.
+            Names may repeat, e.g. the same ``SBI.csv`` for two months
+        bank: Bank account of every file, inferred per file name if omitted
+        workers: Parser processes, defaults to settings.STATEMENT_PARSE_WORKERS
+            (0 for one per CPU); 1 parses in this process
+        batch_size: Lines per insert batch
+
+    Returns:
+        List[StatementImportResult]: One result per file, in the given order
+    """
+    results, jobs = _plan(files, bank)
+    if not jobs:
+        return results
+
+    _create_table(db)
+    workers = settings.STATEMENT_PARSE_WORKERS if workers is None else workers
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            _stage(db, results, _parse_file(*job), batch_size)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_spawn) as pool:
+            futures = [pool.submit(_parse_file, *job) for job in jobs]
+            for future in as_completed(futures):
+                _stage(db, results, future.result(), batch_size)
+    return results
+
+
+async def ingest_statements_async(
+    db: AsyncSession,
+    files: Sequence[Tuple[str, bytes]],
+    *,
+    bank: Optional[PaymentMode] = None,
+    batch_size: Optional[int] = None
+) -> List[StatementImportResult]:
+    """Parse statement files on the parse pool and stage their lines.
+
+    AsyncSession counterpart of ingest_statements used by the API: parsing
+    is awaited on parse_pool() so the event loop keeps serving requests,
+    and only the staging of each parsed file runs on the session.
+
+    Args:
+        db: Database session
+        files: (file name, content) pairs, as for ingest_statements
+        bank: Bank account of every file, inferred per file name if omitted
+        batch_size: Lines per insert batch
+
+    Returns:
+        List[StatementImportResult]: One result per file, in the given order
+    """
+    results, jobs = _plan(files, bank)
+    if not jobs:
+        return results
+
+    await db.run_sync(_create_table)
+    loop = asyncio.get_running_loop()
+    pool = parse_pool()
+    parses = [loop.run_in_executor(pool, _parse_file, *job) for job in jobs]
+    for parse in asyncio.as_completed(parses):
+        await db.run_sync(_stage, results, await parse, batch_size)
+    return results
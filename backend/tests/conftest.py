@@ -2,25 +2,44 @@
 Test configuration and fixtures using actual kaas.db database.
 """
 import os
+from decimal import Decimal
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.main import app
 from app.api.deps import get_db
+from app.api.response_cache import response_cache
+from app.crud.crud import async_calendar
+from app.crud.crud_checkpoint import ensure_checkpoints
+from app.crud.crud_rollup import ensure_rollups
+from app.crud.fingerprint import ensure_fingerprints
+from app.db.session import create_async_db_engine, create_db_engine
+from app.models.models import AccountsPresent, Base
 from app.services.notification.telegram import TelegramNotificationProvider
 
 # Use actual kaas.db database
 DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'kaas.db'))
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient is used without its context manager, so replicate the startup backfills
+ensure_checkpoints(engine)
+ensure_rollups(engine)
+ensure_fingerprints(engine)
+
+# TestClient may run each request on a fresh event loop, so async connections
+# are not pooled across requests
+async_engine = create_async_db_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 @pytest.fixture
 def db_session():
     """Create database session for testing using actual kaas.db."""
@@ -30,16 +49,40 @@ def db_session():
     finally:
         db.close()
 
+def make_account(acc_id: str, **columns) -> AccountsPresent:
+    """Account row for seeding a scratch database; columns override the defaults."""
+    values = dict(
+        AccountName=acc_id, Type="EMI", AccID=acc_id, Balance=Decimal("0"),
+        IntRate=Decimal("0"), NextDueDate="5th of Each Month", Bank="SBI",
+    )
+    values.update(columns)
+    return AccountsPresent(**values)
+
+@pytest.fixture
+def scratch_engine(tmp_path):
+    """Engine on a fresh file database with all tables created."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'scratch.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def scratch_session(scratch_engine):
+    """Session on the scratch database; each test module adds its own seed rows."""
+    with Session(scratch_engine) as db:
+        yield db
+
 @pytest.fixture
-def client(db_session):
-    """Create FastAPI test client with actual database session."""
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+def client():
+    """Create FastAPI test client with async sessions on the actual database."""
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
     
     app.dependency_overrides[get_db] = override_get_db
+    # Fixtures and cleanups write through plain sessions, which do not bump table versions
+    response_cache.clear()
+    async_calendar.cache.clear()
     return TestClient(app)
 
 @pytest.fixture
@@ -0,0 +1,74 @@
+"""
+Test cases for loading account relationships with include=.
+"""
+from fastapi import status
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+
+from app.models.models import AccountsPresent, FreedomFuture
+from app.models.transaction import Transaction
+
+
+def _count_by_account(db_session, model):
+    return dict(db_session.execute(select(model.AccID, func.count()).group_by(model.AccID)).all())
+
+
+def test_include_loads_relationships_in_one_query_each(client, db_session):
+    """A page with both relationships costs three queries, not one per account."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            "/api/v1/accounts/",
+            params={"include": "past_transactions,future_transactions", "limit": 20},
+        )
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 3
+
+    past = _count_by_account(db_session, Transaction)
+    future = _count_by_account(db_session, FreedomFuture)
+    accounts = response.json()
+    assert len(accounts) == 20
+    for account in accounts:
+        assert len(account["past_transactions"]) == past.get(account["AccID"], 0)
+        assert len(account["future_transactions"]) == future.get(account["AccID"], 0)
+    assert any(account["past_transactions"] for account in accounts)
+
+
+def test_relationships_are_opt_in(client):
+    """Without include= the lists stay empty, and unknown names are rejected."""
+    account = client.get("/api/v1/accounts/", params={"limit": 1}).json()[0]
+    assert account["past_transactions"] == [] and account["future_transactions"] == []
+
+    detail = client.get(f"/api/v1/accounts/{account['SLNo']}", params={"include": "future_transactions"})
+    assert detail.status_code == status.HTTP_200_OK
+    assert detail.json()["past_transactions"] == []
+
+    response = client.get("/api/v1/accounts/", params={"include": "owner"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_account_with_transactions_cannot_be_deleted(client, db_session):
+    """delete_account checks for transactions without loading them."""
+    sl_no = db_session.scalars(
+        select(AccountsPresent.SLNo).join(FreedomFuture, FreedomFuture.AccID == AccountsPresent.AccID).limit(1)
+    ).one()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        response = client.delete(f"/api/v1/accounts/{sl_no}")
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    # One read of the account and one EXISTS check
+    assert len(statements) == 2
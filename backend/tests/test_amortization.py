@@ -0,0 +1,105 @@
+"""
+Test cases for the vectorized amortization schedule generator.
+"""
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from fastapi import status
+from sqlalchemy import func, select
+
+from app.models.models import AccountsPresent, FreedomFuture
+from app.services.projection import SCHEDULE_COMMENT, amortize, generate_schedules
+from tests.conftest import TestingSessionLocal, make_account
+
+
+def _loop_schedule(principal, rate, tenure):
+    """Textbook per-installment schedule."""
+    payment = round(principal * rate / (1 - (1 + rate) ** -tenure), 2) if rate else round(principal / tenure, 2)
+    remaining, rows = principal, []
+    for number in range(1, tenure + 1):
+        interest = round(remaining * rate, 2)
+        amount = remaining + interest if number == tenure else payment
+        remaining = 0.0 if number == tenure else round(remaining + interest - payment, 2)
+        rows.append((amount, interest, remaining))
+    return rows
+
+
+def test_amortize_matches_per_installment_loop():
+    """Vectorized schedules match a loop and pay the principal off exactly."""
+    principals = np.array([140470.0, 98435.0, 50000.0, 400000.0, 1091204.56])
+    rates = np.array([0.0125, 0.0, 0.0225, 0.03375, 0.01])
+    tenures = np.array([30, 24, 6, 15, 0])
+    schedule = amortize(principals, rates, tenures, interest_only_months=12)
+
+    for i in range(4):
+        rows = schedule.accounts == i
+        expected = np.array(_loop_schedule(principals[i], rates[i], tenures[i]))
+        np.testing.assert_allclose(schedule.payments[rows], expected[:, 0], atol=0.02)
+        np.testing.assert_allclose(schedule.interest[rows], expected[:, 1], atol=0.02)
+        assert schedule.remaining[rows][-1] == 0
+        assert schedule.principal[rows].sum() == pytest.approx(principals[i], abs=0.01)
+
+    interest_only = schedule.accounts == 4
+    assert interest_only.sum() == 12
+    assert set(schedule.payments[interest_only]) == {10912.05}
+    assert set(schedule.remaining[interest_only]) == {1091204.56}
+
+
+@pytest.fixture
+def session(scratch_session):
+    scratch_session.add_all([
+        make_account("EMI - 001", AccountName="Loan", Balance=Decimal("-120000"),
+                     IntRate=Decimal("-0.15"), Tenure=12),
+        make_account("HLG - 001", AccountName="Given", Type="HL", Balance=Decimal("50000"),
+                     IntRate=Decimal("0.12"), NextDueDate="Not Applicable", Bank="ICICI_090", Tenure=0),
+        make_account("CC - 001", AccountName="Card", Type="CC", Balance=Decimal("-5000"),
+                     NextDueDate="3rd of Each Month", Tenure=0),
+    ])
+    # A hand-typed unpaid EMI for November must not be duplicated
+    scratch_session.add(FreedomFuture(Date=date(2024, 11, 5), Description="Nov EMI", Amount=Decimal("-11000"),
+                                      PaymentMode="SBI", AccID="EMI - 001", Department="Serendipity",
+                                      Category="EMI", Paid=False))
+    scratch_session.commit()
+    return scratch_session
+
+
+def _generated(db):
+    return db.scalar(select(func.count()).select_from(FreedomFuture).where(
+        FreedomFuture.Comments.like(f"{SCHEDULE_COMMENT}%")
+    ))
+
+
+def test_generate_and_regenerate_schedules(session):
+    """Rows are written once per account month and replaced on regeneration."""
+    result = generate_schedules(session, start=date(2024, 10, 15), interest_only_months=6)
+    assert {a["AccID"] for a in result.accounts} == {"EMI - 001", "HLG - 001"}
+    assert result.skipped == 1 and _generated(session) == 12 - 1 + 6
+
+    emi = [row for row in result.rows if row["AccID"] == "EMI - 001"]
+    assert emi[0]["Date"] == date(2024, 12, 5) and all(row["Amount"] < 0 for row in emi)
+    assert all(row["Amount"] == 500.0 for row in result.rows if row["AccID"] == "HLG - 001")
+
+    session.execute(AccountsPresent.__table__.update().where(AccountsPresent.AccID == "EMI - 001")
+                    .values(IntRate=Decimal("-0.18")))
+    regenerated = generate_schedules(session, start=date(2024, 10, 15), interest_only_months=6)
+    assert regenerated.replaced == 17 and _generated(session) == 17
+    assert regenerated.rows[0]["Amount"] < emi[0]["Amount"]
+
+
+def test_schedule_endpoint_dry_run(client):
+    """A dry run reports schedules without touching Freedom(Future)."""
+    with TestingSessionLocal() as db:
+        before = db.scalar(select(func.count()).select_from(FreedomFuture))
+
+    response = client.post("/api/v1/future/schedules", params={
+        "start": "2024-10-15", "dry_run": True, "acc_id": ["EMI - 001", "HL - 001"],
+    })
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["dry_run"] and {a["AccID"] for a in body["accounts"]} == {"EMI - 001", "HL - 001"}
+    assert body["generated"] == sum(a["installments"] for a in body["accounts"])
+
+    with TestingSessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(FreedomFuture)) == before
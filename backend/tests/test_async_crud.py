@@ -0,0 +1,69 @@
+"""
+Test cases for the AsyncSession CRUD variants.
+"""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.crud.crud import async_account, async_future
+from app.db.session import create_async_db_engine
+from app.models.models import Base
+from app.schemas.schemas import AccountCreate, FutureCreate
+
+
+@pytest_asyncio.fixture
+async def async_db(tmp_path):
+    """Async session on a fresh database with all tables created."""
+    engine = create_async_db_engine(f"sqlite:///{tmp_path / 'async.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_account_roundtrip(async_db):
+    """Accounts can be created, looked up and have their balance adjusted."""
+    created = await async_account.create(async_db, obj_in=AccountCreate(
+        AccountName="Axios Loan EMI", Type="EMI", AccID="EMI - 001",
+        Balance=Decimal("-1000.00"), IntRate=Decimal("9.5"), NextDueDate="5th of Each Month",
+        Bank="SBI", Tenure=12, EMIAmt=Decimal("100"),
+    ))
+
+    assert (await async_account.get_by_sl_no(async_db, created.SLNo)).AccID == "EMI - 001"
+    assert (await async_account.get_by_cc_id(async_db, "EMI - 001")).SLNo == created.SLNo
+    assert await async_account.get_by_cc_id(async_db, "missing") is None
+
+    updated = await async_account.update_balance(async_db, cc_id="EMI - 001", amount=250.5)
+    assert updated.Balance == Decimal("-749.50")
+    unchanged = await async_account.update_balance(async_db, cc_id="EMI - 001", amount=0)
+    assert unchanged.Balance == Decimal("-749.50")
+    assert await async_account.update_balance(async_db, cc_id="missing", amount=0) is None
+
+
+@pytest.mark.asyncio
+async def test_future_date_range_and_mark_paid(async_db):
+    """Futures are filtered by date range and can be marked as paid."""
+    for day in (1, 15, 28):
+        await async_future.create(async_db, obj_in=FutureCreate(
+            Date=date(2024, 10, day), Description=f"Rent {day}", Amount=Decimal("-10"),
+            PaymentMode="SBI", AccID="MAT - 001", Department="Serendipity",
+            Category="Maintenance",
+        ))
+
+    in_range = await async_future.get_by_date_range(
+        async_db, start_date=date(2024, 10, 10), end_date=date(2024, 10, 31)
+    )
+    assert [f.Date.day for f in in_range] == [15, 28]
+
+    paid = await async_future.mark_as_paid(async_db, id=in_range[0].TrNo)
+    assert paid.Paid is True
+    unpaid = await async_future.get_unpaid(async_db)
+    assert [f.Date.day for f in unpaid] == [1, 28]
+
+    assert await async_future.remove(async_db, id=9999) is None
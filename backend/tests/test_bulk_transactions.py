@@ -0,0 +1,100 @@
+"""
+Test cases for bulk transaction ingest.
+"""
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from sqlalchemy import delete, event, select
+
+import app.models.transaction  # noqa: F401 - registers the Transaction mapping
+from app.crud.crud import transaction
+from app.models.models import AccountsPresent
+from app.models.transaction import Transaction
+from tests.conftest import make_account
+
+
+def _row(acc_id="EMI - 001", amount=-100.0, **overrides):
+    row = {
+        "Date": "2024-08-05", "Description": "EMI", "Amount": amount, "PaymentMode": "SBI",
+        "AccID": acc_id, "Department": "Serendipity", "Category": "EMI", "ZohoMatch": "No",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def session(scratch_session):
+    scratch_session.add_all([
+        make_account(acc_id, Balance=Decimal("1000.00")) for acc_id in ("EMI - 001", "EMI - 002")
+    ])
+    scratch_session.commit()
+    return scratch_session
+
+
+def test_create_many_single_commit(session):
+    """Valid rows insert together, balances move once by their net amount."""
+    commits = []
+    event.listen(session, "after_commit", lambda s: commits.append(1))
+
+    result = transaction.create_many(session, rows=[
+        _row(amount=-100.0),
+        _row(amount=-50.5),
+        _row(acc_id="EMI - 002", amount=25.0),
+        _row(acc_id="missing"),
+        _row(Amount="not a number"),
+    ])
+
+    assert len(commits) == 1
+    assert (result.created, result.failed) == (3, 2)
+    assert [r.status for r in result.results] == ["created"] * 3 + ["error"] * 2
+    assert "missing" in result.results[3].error
+    assert "Amount" in result.results[4].error
+    assert result.balance_changes == {"EMI - 001": -150.5, "EMI - 002": 25.0}
+
+    balances = dict(session.execute(select(AccountsPresent.AccID, AccountsPresent.Balance)).all())
+    assert balances == {"EMI - 001": Decimal("849.50"), "EMI - 002": Decimal("1025.00")}
+
+    tr_nos = [r.TrNo for r in result.results[:3]]
+    stored = session.scalars(select(Transaction).where(Transaction.TrNo.in_(tr_nos))).all()
+    assert sorted(t.Amount for t in stored) == [-100.0, -50.5, 25.0]
+
+
+def test_bulk_endpoint(client, db_session):
+    """POST /transactions/bulk reports per-row results and adjusts balances."""
+    acc_id = db_session.scalars(select(AccountsPresent.AccID).limit(1)).one()
+    before = db_session.scalars(
+        select(AccountsPresent.Balance).where(AccountsPresent.AccID == acc_id)
+    ).one()
+
+    response = client.post("/api/v1/transactions/bulk", json=[
+        _row(acc_id=acc_id, amount=-10.0, Category="Hand Loans"),
+        _row(acc_id=acc_id, amount=-15.0),
+        _row(acc_id="no such account"),
+    ])
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    created = [r["TrNo"] for r in body["results"] if r["status"] == "created"]
+    try:
+        assert (body["created"], body["failed"]) == (2, 1)
+        assert body["balance_changes"] == {acc_id: -25.0}
+        db_session.expire_all()
+        after = db_session.scalars(
+            select(AccountsPresent.Balance).where(AccountsPresent.AccID == acc_id)
+        ).one()
+        assert after == before - Decimal("25")
+        assert db_session.get(Transaction, created[0]).Category == "Hand_Loans"
+    finally:
+        db_session.execute(delete(Transaction).where(Transaction.TrNo.in_(created)))
+        db_session.execute(
+            AccountsPresent.__table__.update()
+            .where(AccountsPresent.AccID == acc_id)
+            .values(Balance=before)
+        )
+        db_session.commit()
+
+
+def test_bulk_endpoint_rejects_empty_batch(client):
+    """An empty batch is a validation error."""
+    response = client.post("/api/v1/transactions/bulk", json=[])
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
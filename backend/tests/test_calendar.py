@@ -0,0 +1,83 @@
+"""
+Test cases for the month calendar endpoint.
+"""
+from collections import defaultdict
+from datetime import date, datetime
+
+import pytest
+from fastapi import status
+from sqlalchemy import select
+
+from app.crud.crud import async_calendar, async_future
+from app.models.models import FreedomFuture
+from app.models.transaction import Transaction
+from tests.conftest import TestingAsyncSessionLocal
+
+MONTH = "2024-10"
+
+
+def _calendar(client, month=MONTH):
+    response = client.get("/api/v1/calendar/", params={"month": month})
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_calendar_matches_client_side_buckets(client, db_session):
+    """Per-day buckets equal what the calendar page computed in the browser."""
+    transactions = defaultdict(lambda: [0, 0.0])
+    for day, amount in db_session.execute(
+        select(Transaction.Date, Transaction.Amount).where(
+            Transaction.Date >= datetime(2024, 10, 1), Transaction.Date < datetime(2024, 11, 1)
+        )
+    ):
+        transactions[day.date().isoformat()][0] += 1
+        transactions[day.date().isoformat()][1] += amount
+    futures = defaultdict(lambda: {True: [], False: []})
+    for tr_no, day, paid in db_session.execute(
+        select(FreedomFuture.TrNo, FreedomFuture.Date, FreedomFuture.Paid).where(
+            FreedomFuture.Date >= date(2024, 10, 1), FreedomFuture.Date < date(2024, 11, 1)
+        )
+    ):
+        futures[day.isoformat()][paid].append(tr_no)
+
+    body = _calendar(client)
+    assert body["month"] == MONTH
+    days = {day["date"]: day for day in body["days"]}
+    assert list(days) == sorted(set(transactions) | set(futures))
+    for key, (count, total) in transactions.items():
+        assert days[key]["transaction_count"] == count
+        assert days[key]["transaction_total"] == pytest.approx(total)
+    for key, entries in futures.items():
+        assert [e["TrNo"] for e in days[key]["due"]] == sorted(entries[False])
+        assert [e["TrNo"] for e in days[key]["paid"]] == sorted(entries[True])
+        assert days[key]["due_total"] == pytest.approx(sum(e["Amount"] for e in days[key]["due"]))
+
+
+@pytest.mark.asyncio
+async def test_calendar_is_cached_until_a_write():
+    """A month is served from memory until a future prediction changes."""
+    async with TestingAsyncSessionLocal() as db:
+        first = await async_calendar.get_month(db, 2024, 10)
+        assert await async_calendar.get_month(db, 2024, 10) is first
+
+        future = (await db.scalars(
+            select(FreedomFuture).where(
+                FreedomFuture.Date >= date(2024, 10, 1), FreedomFuture.Date < date(2024, 11, 1)
+            ).limit(1)
+        )).one()
+        paid = future.Paid
+        try:
+            await async_future.mark_as_paid(db, id=future.TrNo, paid=not paid)
+            second = await async_calendar.get_month(db, 2024, 10)
+            assert second is not first
+            moved = [e.TrNo for day in second.days for e in (day.due if paid else day.paid)]
+            assert future.TrNo in moved
+        finally:
+            await async_future.mark_as_paid(db, id=future.TrNo, paid=paid)
+
+
+def test_calendar_rejects_bad_month(client):
+    """Months must be YYYY-MM."""
+    for month in ("2024-13", "2024-1", "October"):
+        response = client.get("/api/v1/calendar/", params={"month": month})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,126 @@
+"""
+Test cases for daily balance checkpoints and as-of balances.
+"""
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from sqlalchemy import func, select
+
+from app.core.cache import table_versions
+from app.crud.crud import account, balance_checkpoint, transaction
+from app.crud.ledger import BalanceLedger
+from app.models.models import AccountsPresent, BalanceCheckpoint
+from app.models.transaction import Transaction
+from tests.conftest import TestingSessionLocal, make_account
+
+AMOUNTS = [
+    ("A", date(2024, 7, 1), "-100.00"),
+    ("A", date(2024, 7, 1), "20.50"),
+    ("B", date(2024, 7, 2), "300.00"),
+    ("A", date(2024, 7, 5), "-40.25"),
+    ("B", date(2024, 7, 9), "-12.00"),
+]
+
+
+@pytest.fixture
+def session(scratch_session):
+    scratch_session.add_all([make_account(acc_id, Balance=Decimal("1000.00")) for acc_id in ("A", "B")])
+    scratch_session.commit()
+    transaction.create_many(scratch_session, rows=[
+        {"Date": on.isoformat(), "Description": "t", "Amount": float(amount), "PaymentMode": "SBI",
+         "AccID": acc_id, "Department": "Serendipity", "Category": "EMI"}
+        for acc_id, on, amount in AMOUNTS
+    ])
+    return scratch_session
+
+
+def _replayed(db, acc_id, as_of):
+    """Brute force: current balance minus every transaction dated after as_of."""
+    balance = db.scalars(select(AccountsPresent.Balance).where(AccountsPresent.AccID == acc_id)).one()
+    later = db.scalar(select(func.coalesce(func.sum(Transaction.Amount), 0)).where(
+        Transaction.AccID == acc_id,
+        Transaction.Date >= datetime.combine(as_of + timedelta(days=1), datetime.min.time()),
+    ))
+    return (balance - Decimal(str(later))).quantize(Decimal("0.01"))
+
+
+def test_as_of_matches_replay(session):
+    """Checkpoint lookups agree with replaying the history for every day."""
+    for offset in range(-1, 12):
+        as_of = date(2024, 6, 30) + timedelta(days=offset)
+        balances = balance_checkpoint.balances_as_of(session, as_of)
+        assert balances == {acc_id: _replayed(session, acc_id, as_of) for acc_id in ("A", "B")}
+
+    assert balance_checkpoint.balances_as_of(session, date(2024, 7, 3), ["A"]) == {"A": Decimal("920.50")}
+
+
+def test_backdated_write_shifts_later_days(session):
+    """A change dated in the past moves that day and every later running total."""
+    ledger = BalanceLedger()
+    ledger.add("A", Decimal("-7.00"), on=date(2024, 7, 3))
+    ledger.apply(session)
+    session.commit()
+
+    totals = dict(session.execute(
+        select(BalanceCheckpoint.Day, BalanceCheckpoint.RunningTotal).where(BalanceCheckpoint.AccID == "A")
+    ).all())
+    assert totals == {
+        date(2024, 7, 1): Decimal("-79.50"),
+        date(2024, 7, 3): Decimal("-86.50"),
+        date(2024, 7, 5): Decimal("-126.75"),
+    }
+    assert balance_checkpoint.balances_as_of(session, date(2024, 7, 2)) == {
+        "A": Decimal("920.50"), "B": Decimal("1300.00"),
+    }
+    assert balance_checkpoint.balances_as_of(session, date(2024, 7, 4))["A"] == Decimal("913.50")
+
+
+def test_rebuild_matches_incremental(session):
+    """Rebuilding from Transactions(Past) reproduces the maintained checkpoints."""
+    query = select(BalanceCheckpoint.AccID, BalanceCheckpoint.Day,
+                   BalanceCheckpoint.NetChange, BalanceCheckpoint.RunningTotal).order_by(
+        BalanceCheckpoint.AccID, BalanceCheckpoint.Day)
+    incremental = session.execute(query).all()
+    version = table_versions.get(BalanceCheckpoint.__tablename__)
+    assert balance_checkpoint.rebuild(session) == len(incremental)
+    assert session.execute(query).all() == incremental
+    # Cached as-of responses are invalidated by the rebuild
+    assert table_versions.get(BalanceCheckpoint.__tablename__) != version
+
+
+def test_adjustment_keeps_past_balances(session):
+    """A manual adjustment lands on today and survives a rebuild."""
+    past = balance_checkpoint.balances_as_of(session, date(2024, 7, 3))
+    account.update_balance(session, cc_id="A", amount=Decimal("50.00"))
+
+    assert balance_checkpoint.balances_as_of(session, date(2024, 7, 3)) == past
+    assert balance_checkpoint.balances_as_of(session, date.today())["A"] == Decimal("930.25")
+    assert session.get(BalanceCheckpoint, ("A", date.today())).NetChange == Decimal("50.00")
+
+    balance_checkpoint.rebuild(session)
+    assert balance_checkpoint.balances_as_of(session, date(2024, 7, 3)) == past
+    assert balance_checkpoint.balances_as_of(session, date.today())["A"] == Decimal("930.25")
+
+    # Unknown accounts leave no checkpoint behind
+    assert account.update_balance(session, cc_id="missing", amount=Decimal("5.00")) is None
+    assert session.get(BalanceCheckpoint, ("missing", date.today())) is None
+
+
+def test_balance_endpoints(client):
+    """The single and bulk as-of endpoints report the same balances."""
+    with TestingSessionLocal() as db:
+        acc_id = db.scalars(select(Transaction.AccID).where(Transaction.AccID.isnot(None)).limit(1)).one()
+        expected = balance_checkpoint.balances_as_of(db, date(2024, 7, 31), [acc_id])[acc_id]
+
+    response = client.get(f"/api/v1/accounts/{acc_id}/balance", params={"as_of": "2024-07-31"})
+    assert response.status_code == status.HTTP_200_OK
+    assert Decimal(response.json()["Balance"]) == expected
+
+    response = client.get("/api/v1/accounts/balances", params={"as_of": "2024-07-31", "acc_id": [acc_id]})
+    assert response.status_code == status.HTTP_200_OK
+    assert [(row["AccID"], Decimal(row["Balance"])) for row in response.json()] == [(acc_id, expected)]
+
+    response = client.get("/api/v1/accounts/no-such-account/balance")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,61 @@
+"""
+Test cases for ETag / If-None-Match conditional GETs.
+"""
+from fastapi import status
+from sqlalchemy import event, select
+
+from app.api.response_cache import etag_matches
+from app.models.models import AccountsPresent
+from app.models.transaction import Transaction
+from tests.conftest import async_engine
+
+
+def test_etag_matching():
+    """If-None-Match accepts lists, * and weak tags."""
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+def test_versioned_list_is_not_modified_until_a_write(client, db_session):
+    """A matching tag gets 304 without touching the database."""
+    acc_id = db_session.scalars(select(AccountsPresent.AccID).limit(1)).one()
+    first = client.get("/api/v1/accounts/")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    statements = []
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/api/v1/accounts/", headers={"If-None-Match": etag})
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert statements == []
+
+    client.patch(f"/api/v1/accounts/{acc_id}/balance", params={"amount": "1"})
+    try:
+        response = client.get("/api/v1/accounts/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+    finally:
+        client.patch(f"/api/v1/accounts/{acc_id}/balance", params={"amount": "-1"})
+
+
+def test_detail_route_etag_hashes_the_row(client, db_session):
+    """Detail routes are tagged by their content."""
+    tr_no = db_session.scalars(select(Transaction.TrNo).limit(1)).one()
+    first = client.get(f"/api/v1/transactions/{tr_no}")
+    etag = first.headers["ETag"]
+    assert client.get(f"/api/v1/transactions/{tr_no}").headers["ETag"] == etag
+
+    response = client.get(f"/api/v1/transactions/{tr_no}", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    other = db_session.scalars(select(Transaction.TrNo).where(Transaction.TrNo != tr_no).limit(1)).one()
+    assert client.get(f"/api/v1/transactions/{other}").headers["ETag"] != etag
@@ -0,0 +1,105 @@
+"""
+Test cases for streaming table exports.
+"""
+import csv
+import io
+import json
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi import status
+from sqlalchemy import func, select
+
+from app.services.export import EXPORT_TABLES, ExportTable, export_columns, iter_arrow, iter_ndjson
+from tests.conftest import TestingAsyncSessionLocal, TestingSessionLocal
+
+
+def _row_count(table: ExportTable) -> int:
+    with TestingSessionLocal() as db:
+        return db.execute(select(func.count()).select_from(EXPORT_TABLES[table])).scalar_one()
+
+
+@pytest.mark.parametrize("table", list(ExportTable))
+def test_export_ndjson(client, table):
+    """NDJSON export emits one JSON object per row."""
+    response = client.get(f"/api/v1/export/{table.value}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == _row_count(table)
+    assert set(rows[0]) == set(export_columns(table))
+    assert "Fingerprint" not in rows[0]
+
+
+def test_export_csv(client):
+    """CSV export starts with a header and has one line per row."""
+    response = client.get("/api/v1/export/future", params={"format": "csv"})
+    assert response.status_code == status.HTTP_200_OK
+    assert "attachment" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == _row_count(ExportTable.future)
+    assert rows[0]["Paid"] in ("True", "False")
+
+
+def test_unknown_table_is_rejected(client):
+    """Only the known tables can be exported."""
+    response = client.get("/api/v1/export/users")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_export_is_emitted_per_batch():
+    """Each server-side cursor batch becomes its own chunk."""
+    async with TestingAsyncSessionLocal() as db:
+        chunks = [chunk async for chunk in iter_ndjson(db, ExportTable.transactions, batch_size=100)]
+
+    total = _row_count(ExportTable.transactions)
+    assert len(chunks) == -(-total // 100)
+    assert all(chunk.count(b"\n") <= 100 for chunk in chunks)
+
+
+def test_export_arrow_and_parquet_are_typed(client):
+    """Columnar exports keep decimals, dates, booleans and enums typed."""
+    response = client.get("/api/v1/export/future", params={"format": "arrow"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    arrow = pa.ipc.open_stream(response.content).read_all()
+
+    response = client.get("/api/v1/export/future.parquet")
+    assert response.status_code == status.HTTP_200_OK
+    assert 'filename="future.parquet"' in response.headers["content-disposition"]
+    parquet = pq.read_table(io.BytesIO(response.content))
+
+    assert arrow.num_rows == parquet.num_rows == _row_count(ExportTable.future)
+    assert arrow.column_names == export_columns(ExportTable.future)
+    assert arrow.schema.field("Amount").type == pa.decimal128(10, 2)
+    assert arrow.schema.field("Date").type == pa.date32()
+    assert arrow.schema.field("Paid").type == pa.bool_()
+    assert pa.types.is_dictionary(arrow.schema.field("Category").type)
+    assert isinstance(parquet.column("Amount")[0].as_py(), Decimal)
+    assert arrow.to_pylist() == parquet.to_pylist()
+
+
+def test_transactions_export_uses_declared_types(client):
+    """Excel-loaded float amounts come out as two-place decimals."""
+    response = client.get("/api/v1/export/transactions.parquet")
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.schema.field("Amount").type == pa.decimal128(10, 2)
+    assert "Fingerprint" not in table.column_names
+    assert len(response.content) < len(client.get("/api/v1/export/transactions").content) / 3
+
+
+@pytest.mark.asyncio
+async def test_arrow_export_is_emitted_per_batch():
+    """The Arrow stream is written one record batch per cursor batch."""
+    async with TestingAsyncSessionLocal() as db:
+        chunks = [chunk async for chunk in iter_arrow(db, ExportTable.transactions, batch_size=100)]
+
+    reader = pa.ipc.open_stream(b"".join(chunks))
+    batches = list(reader)
+    assert len(batches) == -(-_row_count(ExportTable.transactions) // 100)
+    assert all(batch.num_rows <= 100 for batch in batches)
@@ -0,0 +1,42 @@
+"""
+Test cases for the orjson fast serialization path.
+"""
+from decimal import Decimal
+from typing import List
+
+import orjson
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import literal, select
+
+from app.api.fast_json import encode_rows, list_adapter
+from app.crud.crud import async_transaction
+from app.models.transaction import Transaction as TransactionModel
+from app.schemas.transaction import Transaction
+
+
+def test_fast_path_matches_response_model_output(client, db_session):
+    """The transaction list encodes exactly what response_model produced."""
+    records = db_session.scalars(
+        select(TransactionModel).order_by(TransactionModel.Date, TransactionModel.TrNo).limit(1000)
+    ).all()
+    legacy = jsonable_encoder(
+        TypeAdapter(List[Transaction]).validate_python(records, from_attributes=True)
+    )
+
+    response = client.get("/api/v1/transactions/", params={"limit": 1000})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == legacy
+
+
+def test_validated_and_trusted_rows_encode_alike(db_session):
+    """Validation through the cached TypeAdapter does not change the output."""
+    rows = db_session.execute(select(*async_transaction.row_columns()).limit(200)).all()
+
+    assert list_adapter(Transaction) is list_adapter(Transaction)
+    assert orjson.loads(encode_rows(rows, Transaction, validate=True)) == \
+        orjson.loads(encode_rows(rows, validate=False))
+    amount = db_session.execute(select(literal(Decimal("1.50")).label("Amount"))).one()
+    assert encode_rows([amount], validate=False) == b'[{"Amount":1.5}]'
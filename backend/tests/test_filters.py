@@ -0,0 +1,125 @@
+"""
+Test cases for SQL-pushed list filtering and sorting.
+"""
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from sqlalchemy import select
+
+from app.crud.crud import async_transaction
+from app.crud.filters import InvalidFilterError, QueryFilter, parse_query_params
+from app.crud.pagination import NEXT_CURSOR_HEADER
+from app.models.models import FreedomFuture
+
+
+def test_parse_query_params():
+    """Equality, IN, range and sort parameters are recognised."""
+    query_filter = parse_query_params(
+        [("Category", "EMI"), ("Category", "Salaries"), ("AccID__in", "A, B"),
+         ("Date__gte", "2024-08-01"), ("limit", "10")],
+        sort="-Amount,Date",
+        reserved=["limit"],
+    )
+    assert query_filter.equals == {"Category": ["EMI", "Salaries"], "AccID": ["A", "B"]}
+    assert query_filter.ranges == [("Date", "gte", "2024-08-01")]
+    assert query_filter.sort == [("Amount", True), ("Date", False)]
+
+    with pytest.raises(InvalidFilterError):
+        parse_query_params([("Amount__between", "1")])
+
+
+def test_compile_rejects_unlisted_fields():
+    """Only whitelisted fields compile."""
+    with pytest.raises(InvalidFilterError):
+        async_transaction.compile_filter(QueryFilter(equals={"Description": ["x"]}))
+    with pytest.raises(InvalidFilterError):
+        async_transaction.compile_filter(QueryFilter(ranges=[("Category", "gte", "A")]))
+    with pytest.raises(InvalidFilterError):
+        async_transaction.compile_filter(QueryFilter(sort=[("Comments", False)]))
+
+
+def test_filters_return_full_pages(client):
+    """Filters run in SQL, so a filtered page is filled up to limit."""
+    response = client.get(
+        "/api/v1/transactions/",
+        params={"category": "Salaries", "Date__gte": "2024-08-01", "Date__lte": "2024-09-30", "limit": 20},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == 20
+    assert all(row["Category"] == "Salaries" for row in data)
+    assert all("2024-08-01" <= row["Date"][:10] <= "2024-09-30" for row in data)
+
+
+def test_in_filter_and_hand_loans_alias(client):
+    """IN lists accept the display name of Hand Loans."""
+    response = client.get(
+        "/api/v1/transactions/",
+        params={"Category__in": "Hand Loans,EMI", "limit": 1000},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    categories = {row["Category"].replace("_", " ") for row in response.json()}
+    assert categories == {"Hand Loans", "EMI"}
+
+
+def test_sort_pages_follow_requested_order(client):
+    """Descending amount sort stays ordered across cursor pages."""
+    rows, cursor = [], None
+    while True:
+        params = {"sort": "-Amount", "Department": "Serendipity", "limit": 40}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/transactions/", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        rows.extend(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+
+    amounts = [row["Amount"] for row in rows]
+    assert amounts == sorted(amounts, reverse=True)
+    assert len({row["TrNo"] for row in rows}) == len(rows)
+
+
+def test_future_and_account_filters(client):
+    """Futures and accounts expose the same filter layer."""
+    response = client.get(
+        "/api/v1/future/predictions", params={"AccID": "MAT - 001", "sort": "-Date"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data and all(row["AccID"] == "MAT - 001" for row in data)
+    assert [row["Date"] for row in data] == sorted((row["Date"] for row in data), reverse=True)
+
+    response = client.get("/api/v1/accounts/", params={"Balance__lt": "0", "sort": "Balance"})
+    assert response.status_code == status.HTTP_200_OK
+    balances = [Decimal(str(row["Balance"])) for row in response.json()]
+    assert balances and all(balance < 0 for balance in balances)
+    assert balances == sorted(balances)
+
+
+def test_future_paid_filter(client, db_session):
+    """Paid, a 'true'/'false' string column, filters on boolean values."""
+    future = db_session.scalars(select(FreedomFuture).order_by(FreedomFuture.TrNo).limit(1)).one()
+    future.Paid = True
+    db_session.commit()
+    try:
+        paid = client.get("/api/v1/future/predictions", params={"Paid": "true", "limit": 1000})
+        unpaid = client.get("/api/v1/future/predictions", params={"Paid": "false", "limit": 1000})
+    finally:
+        future.Paid = False
+        db_session.commit()
+    assert paid.status_code == unpaid.status_code == status.HTTP_200_OK
+    assert [row["TrNo"] for row in paid.json()] == [future.TrNo]
+    assert unpaid.json() and all(row["Paid"] is False for row in unpaid.json())
+    assert future.TrNo not in {row["TrNo"] for row in unpaid.json()}
+
+    response = client.get("/api/v1/future/predictions", params={"Paid": "maybe"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_unknown_filter_is_rejected(client):
+    """Filtering on a field outside the whitelist is a client error."""
+    response = client.get("/api/v1/transactions/", params={"Description": "rent"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
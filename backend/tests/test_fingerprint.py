@@ -0,0 +1,174 @@
+"""
+Test cases for duplicate detection by transaction fingerprint.
+"""
+from datetime import datetime
+
+import openpyxl
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+
+from app.crud import crud
+from app.crud.crud import transaction
+from app.crud.fingerprint import ensure_fingerprints, has_fingerprint_column, transaction_fingerprint
+from app.models.models import AccountsPresent
+from app.models.transaction import Transaction
+from app.services.importer import import_workbook
+from tests.conftest import make_account
+
+
+def test_fingerprint_normalizes_content():
+    first = transaction_fingerprint(datetime(2024, 7, 2, 9, 30), -10840, "EMI - 003", "SBI", "Ind  Money Loan ")
+    assert first == transaction_fingerprint("2024-07-02 00:00:00", -10840.000001, "emi - 003", "SBI", "ind money loan")
+    assert first != transaction_fingerprint(datetime(2024, 7, 2), -10840, "EMI - 003", "ICICI_090", "Ind Money Loan")
+
+
+def _legacy_engine(path):
+    """A ledger loaded from Excel before the Fingerprint column existed."""
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            'CREATE TABLE "Transactions(Past)" (TrNo INTEGER PRIMARY KEY, Date DATETIME, Description VARCHAR, '
+            'Amount FLOAT, PaymentMode VARCHAR, AccID VARCHAR, Department VARCHAR, Comments VARCHAR, '
+            'Category VARCHAR, ZohoMatch VARCHAR)'
+        )
+        conn.exec_driver_sql(
+            'INSERT INTO "Transactions(Past)" (TrNo, Date, Description, Amount, PaymentMode, AccID) VALUES '
+            "(1, '2024-07-02 00:00:00', 'Rent', -100, 'SBI', 'A'), (2, '2024-07-02 00:00:00', 'Rent ', -100, 'SBI', 'A'), "
+            "(3, '2024-07-03 00:00:00', 'Rent', -100, 'SBI', 'A')"
+        )
+    return engine
+
+
+def test_backfill_leaves_existing_duplicates_unfingerprinted(tmp_path):
+    engine = _legacy_engine(tmp_path / "legacy.db")
+
+    assert ensure_fingerprints(engine) == [2]
+    assert "ux_transactions_past_fingerprint" in {index["name"] for index in inspect(engine).get_indexes("Transactions(Past)")}
+    with engine.connect() as conn:
+        stored = conn.execute(text('SELECT TrNo, Fingerprint IS NULL FROM "Transactions(Past)" ORDER BY TrNo')).all()
+    assert stored == [(1, 0), (2, 1), (3, 0)]
+    engine.dispose()
+
+
+def test_dry_run_import_leaves_an_older_database_unchanged(tmp_path):
+    """A dry run reports duplicates from in-memory fingerprints without adding the column."""
+    engine = _legacy_engine(tmp_path / "legacy.db")
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = Transaction.__tablename__
+    sheet.append(("TrNo", "Date", "Description", "Amount", "PaymentMode", "AccID"))
+    sheet.append((1, datetime(2024, 7, 2), "Rent", -100, "SBI", "A"))
+    sheet.append((7, datetime(2024, 7, 3), "RENT", -100, "SBI", "A"))
+    sheet.append((8, datetime(2024, 7, 4), "Rent", -100, "SBI", "A"))
+    book.save(tmp_path / "ledger.xlsx")
+
+    with Session(engine) as db:
+        result, = import_workbook(db, str(tmp_path / "ledger.xlsx"), sheets=[Transaction.__tablename__], dry_run=True)
+
+    assert (result.inserted, result.unchanged) == (1, 1)
+    assert [(error.row, error.error) for error in result.errors] == [(3, "duplicate of TrNo 3")]
+    assert not has_fingerprint_column(engine)
+    assert not inspect(engine).get_indexes("Transactions(Past)")
+    engine.dispose()
+
+
+@pytest.fixture
+def session(scratch_session):
+    scratch_session.add(make_account("EMI - 001", AccountName="Rent"))
+    scratch_session.commit()
+    return scratch_session
+
+
+def _row(**overrides):
+    row = {
+        "Date": "2024-08-05", "Description": "Rent", "Amount": -100.0, "PaymentMode": "SBI",
+        "AccID": "EMI - 001", "Department": "Serendipity", "Category": "EMI", "ZohoMatch": "No",
+    }
+    row.update(overrides)
+    return row
+
+
+def test_create_many_flags_duplicates(session):
+    first = transaction.create_many(session, rows=[_row()])
+    result = transaction.create_many(session, rows=[
+        _row(Description=" rent"),
+        _row(Amount=-200.0),
+        _row(Amount=-200.0),
+    ])
+
+    assert [r.status for r in result.results] == ["duplicate", "created", "duplicate"]
+    assert result.results[0].TrNo == first.results[0].TrNo
+    assert result.results[2].error == "Duplicate of row 1"
+    assert (result.created, result.duplicates, result.failed) == (1, 2, 0)
+    assert result.balance_changes == {"EMI - 001": -200.0}
+
+
+def test_overlapping_sheet_reimport_skips_duplicates(tmp_path, session):
+    """Rows already in the ledger under another TrNo are rejected, not inserted."""
+    header = ("TrNo", "Date", "Description", "Amount", "PaymentMode", "AccID", "Department", "Category")
+
+    def workbook(name, rows):
+        book = openpyxl.Workbook()
+        sheet = book.active
+        sheet.title = Transaction.__tablename__
+        sheet.append(header)
+        for tr_no, day, amount in rows:
+            sheet.append((tr_no, datetime(2024, 7, day), f"Payment {day}", amount, "SBI", "EMI - 001", "Serendipity", "EMI"))
+        book.save(tmp_path / name)
+        return str(tmp_path / name)
+
+    sheets = [Transaction.__tablename__]
+    import_workbook(session, workbook("june.xlsx", [(1, 1, -10), (2, 2, -20)]), sheets=sheets)
+    # The next export renumbered the overlapping rows
+    result, = import_workbook(session, workbook("july.xlsx", [(11, 2, -20), (12, 3, -30), (13, 3, -30)]), sheets=sheets)
+
+    assert result.inserted == 1
+    assert [(error.row, error.error) for error in result.errors] == [
+        (2, "duplicate of TrNo 2"), (4, "duplicate of TrNo 12"),
+    ]
+    assert sorted(session.scalars(select(Transaction.TrNo))) == [1, 2, 12]
+
+
+def test_create_endpoint_rejects_duplicate(client, db_session):
+    existing = db_session.scalars(
+        select(Transaction).join(AccountsPresent, AccountsPresent.AccID == Transaction.AccID)
+        .where(Transaction.Fingerprint.is_not(None)).limit(1)
+    ).one()
+    response = client.post("/api/v1/transactions/", json={
+        "Date": existing.Date.isoformat(), "Description": existing.Description, "Amount": existing.Amount,
+        "PaymentMode": existing.PaymentMode, "AccID": existing.AccID, "Department": existing.Department,
+        "Category": existing.Category, "ZohoMatch": existing.ZohoMatch,
+    })
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json()["detail"] == f"Duplicate of transaction {existing.TrNo}"
+
+
+def test_concurrent_duplicate_is_a_conflict(client, db_session, monkeypatch):
+    """A copy that slips past the lookup is stopped by the unique index with the same 409."""
+    existing = db_session.scalars(
+        select(Transaction).join(AccountsPresent, AccountsPresent.AccID == Transaction.AccID)
+        .where(Transaction.Fingerprint.is_not(None)).limit(1)
+    ).one()
+    balance = db_session.scalar(select(AccountsPresent.Balance).where(AccountsPresent.AccID == existing.AccID))
+    lookup = crud.async_transaction.get_by_fingerprint
+    calls = []
+
+    async def racing_lookup(db, fingerprint):
+        # The first lookup runs before the other request has committed
+        calls.append(fingerprint)
+        return None if len(calls) == 1 else await lookup(db, fingerprint)
+
+    monkeypatch.setattr(crud.async_transaction, "get_by_fingerprint", racing_lookup)
+    response = client.post("/api/v1/transactions/", json={
+        "Date": existing.Date.isoformat(), "Description": existing.Description, "Amount": existing.Amount,
+        "PaymentMode": existing.PaymentMode, "AccID": existing.AccID, "Department": existing.Department,
+        "Category": existing.Category, "ZohoMatch": existing.ZohoMatch,
+    })
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json()["detail"] == f"Duplicate of transaction {existing.TrNo}"
+    db_session.expire_all()
+    # The balance change was rolled back with the insert
+    assert db_session.scalar(select(AccountsPresent.Balance).where(AccountsPresent.AccID == existing.AccID)) == balance
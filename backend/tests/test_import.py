@@ -0,0 +1,121 @@
+"""
+Test cases for the incremental workbook importer.
+"""
+import io
+from datetime import datetime
+
+import openpyxl
+from fastapi import status
+from sqlalchemy import select
+
+from app.crud.crud_checkpoint import balance_checkpoint
+from app.models.models import BalanceCheckpoint, FreedomFuture
+from app.models.transaction import Transaction
+from app.services.importer import import_workbook
+
+TRANSACTION_HEADER = (
+    "TrNo", "Date", "Description", "Amount", "PaymentMode", "AccID",
+    "Department", "Comments", "Category", "ZohoMatch",
+)
+
+
+def _transaction(tr_no, amount, day=1, category="Salaries"):
+    return (
+        tr_no, datetime(2024, 7, day), f"Row {tr_no}", amount, "ICICI_090", "SPY - 001",
+        "Serendipity", None, category, "No",
+    )
+
+
+def _workbook(path, transactions):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = Transaction.__tablename__
+    sheet.append(TRANSACTION_HEADER)
+    for row in transactions:
+        sheet.append(row)
+    sheet.append((None,) * len(TRANSACTION_HEADER))
+    workbook.save(path)
+    return path
+
+
+def _checkpoints(db):
+    # Days whose transactions moved away keep a zero NetChange row, as with CRUD writes
+    return db.execute(
+        select(BalanceCheckpoint.__table__).where(BalanceCheckpoint.NetChange != 0).order_by("AccID", "Day")
+    ).all()
+
+
+def test_reimport_writes_only_changes(tmp_path, scratch_session):
+    """A second import of the same rows is a no-op; edits touch only their rows."""
+    rows = [_transaction(tr_no, -100 * tr_no, day=tr_no) for tr_no in range(1, 8)]
+    path = _workbook(tmp_path / "ledger.xlsx", rows)
+    sheets = [Transaction.__tablename__]
+
+    first, = import_workbook(scratch_session, str(path), sheets=sheets, batch_size=3)
+    assert (first.rows, first.inserted, first.updated) == (7, 7, 0)
+    again, = import_workbook(scratch_session, str(path), sheets=sheets, batch_size=3)
+    assert (again.inserted, again.updated, again.unchanged) == (0, 0, 7)
+
+    rows[1] = _transaction(2, -250, day=20, category="Hand Loans")
+    del rows[4]
+    rows.append(_transaction(9, 75.5, day=9))
+    path = _workbook(tmp_path / "ledger.xlsx", rows)
+    changed, = import_workbook(scratch_session, str(path), sheets=sheets, delete_missing=True, batch_size=3)
+    assert (changed.inserted, changed.updated, changed.unchanged, changed.deleted) == (1, 1, 5, 1)
+
+    stored = scratch_session.get(Transaction, 2)
+    assert (stored.Amount, stored.Date, stored.Category) == (-250.0, datetime(2024, 7, 20), "Hand_Loans")
+    assert scratch_session.get(Transaction, 5) is None
+
+    # Incrementally folded checkpoints equal a full rebuild
+    incremental = _checkpoints(scratch_session)
+    balance_checkpoint.rebuild(scratch_session)
+    assert _checkpoints(scratch_session) == incremental
+
+
+def test_bad_rows_are_reported_and_skipped(tmp_path, scratch_session):
+    """Cells that do not fit the column types reject their row only."""
+    rows = [
+        _transaction(1, -10),
+        _transaction(2, "ten"),
+        _transaction(3, -30, category="Travel"),
+        _transaction(1, -10),
+    ]
+    path = _workbook(tmp_path / "ledger.xlsx", rows)
+    result, = import_workbook(scratch_session, str(path), sheets=[Transaction.__tablename__])
+
+    assert result.inserted == 1
+    assert [error.row for error in result.errors] == [3, 4, 5]
+    assert "Amount" in result.errors[0].error
+    assert "Travel" in result.errors[1].error
+    assert "duplicate" in result.errors[2].error
+
+
+def test_import_endpoint_dry_run(client, db_session):
+    """The API reports the diff of an uploaded sheet without writing it."""
+    futures = db_session.scalars(select(FreedomFuture).order_by(FreedomFuture.TrNo).limit(3)).all()
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = FreedomFuture.__tablename__
+    columns = [column.name for column in FreedomFuture.__table__.columns]
+    sheet.append(columns)
+    for future in futures:
+        values = [getattr(future, name) for name in columns]
+        sheet.append([value.name if hasattr(value, "name") else value for value in values])
+    sheet.cell(row=2, column=columns.index("Amount") + 1, value=float(futures[0].Amount) - 1)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    response = client.post(
+        "/api/v1/import/",
+        params={"sheet": FreedomFuture.__tablename__, "dry_run": True},
+        files={"file": ("future.xlsx", buffer.getvalue())},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    summary = response.json()["sheets"][0]
+    assert (summary["updated"], summary["unchanged"], summary["errors"]) == (1, 2, [])
+    db_session.expire_all()
+    assert db_session.get(FreedomFuture, futures[0].TrNo).Amount == futures[0].Amount
+
+    response = client.post("/api/v1/import/", files={"file": ("future.xlsx", buffer.getvalue())})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,43 @@
+"""
+Test cases for managed index creation on pre-existing SQLite files.
+"""
+from sqlalchemy import create_engine, inspect
+
+from app.db.indexes import MANAGED_TABLES, check_indexes, ensure_indexes
+
+
+def _legacy_engine(tmp_path):
+    """Create tables the way the Excel loader does: no secondary indexes."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for table in MANAGED_TABLES:
+            columns = ", ".join(f'"{column.name}"' for column in table.columns)
+            conn.exec_driver_sql(f'CREATE TABLE "{table.name}" ({columns})')
+    return engine
+
+
+def test_ensure_indexes_creates_missing(tmp_path):
+    """Missing indexes are created once and reported by name."""
+    engine = _legacy_engine(tmp_path)
+
+    created = ensure_indexes(engine)
+    expected = {index.name for table in MANAGED_TABLES for index in table.indexes}
+    assert set(created) == expected
+
+    inspector = inspect(engine)
+    for table in MANAGED_TABLES:
+        names = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert {index.name for index in table.indexes} <= names
+
+    # Second run is a no-op
+    assert ensure_indexes(engine) == []
+
+
+def test_hot_queries_are_covered(tmp_path):
+    """Every registered hot query uses an index after the check."""
+    engine = _legacy_engine(tmp_path)
+
+    plans = check_indexes(engine)
+    assert plans
+    for plan in plans:
+        assert plan.covered, f"{plan.name}: {plan.details}"
@@ -0,0 +1,109 @@
+"""
+Test cases for the coalesced account balance ledger.
+"""
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.crud.crud import account
+from app.crud.ledger import BalanceLedger
+from app.models.models import AccountsPresent, Base
+from app.models.transaction import Transaction
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ledger.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        for acc_id in ("A", "B", "C"):
+            db.add(AccountsPresent(
+                AccountName=acc_id, Type="EMI", AccID=acc_id, Balance=Decimal("100.00"),
+                IntRate=Decimal("0"), NextDueDate="5th", Bank="SBI",
+            ))
+        db.commit()
+    return factory
+
+
+def _balances(db):
+    return dict(db.execute(select(AccountsPresent.AccID, AccountsPresent.Balance)).all())
+
+
+def test_deltas_coalesce_into_one_statement(session_factory):
+    """Many deltas over several accounts become a single UPDATE."""
+    ledger = BalanceLedger()
+    for acc_id, amount in [("A", -10), ("B", 5.25), ("A", -2.5), ("B", -5.25), ("C", "1.10")]:
+        ledger.add(acc_id, amount)
+    assert ledger.deltas == {"A": Decimal("-12.5"), "C": Decimal("1.10")}
+
+    with session_factory() as db:
+        statements = []
+        event.listen(db.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, sql, *args: statements.append(sql))
+        assert ledger.apply(db) == 2
+        db.commit()
+        assert len([sql for sql in statements if sql.startswith("UPDATE")]) == 1
+        assert _balances(db) == {"A": Decimal("87.50"), "B": Decimal("100.00"), "C": Decimal("101.10")}
+        assert ledger.deltas == {}
+
+
+def test_interleaved_writers_do_not_lose_updates(session_factory):
+    """Adjustments from sessions holding stale balances all land."""
+    first, second = session_factory(), session_factory()
+    # Both sessions read the balance before either writes
+    assert first.get(AccountsPresent, 1).Balance == second.get(AccountsPresent, 1).Balance
+
+    account.update_balance(first, cc_id="A", amount=Decimal("-30"))
+    updated = account.update_balance(second, cc_id="A", amount=Decimal("-20"))
+    assert updated.Balance == Decimal("50.00")
+    assert account.update_balance(second, cc_id="missing", amount=1) is None
+    first.close()
+    second.close()
+
+
+def test_zero_adjustment_returns_account(client, db_session):
+    """A zero amount is a no-op, not a missing account."""
+    acc_id, balance = db_session.execute(select(AccountsPresent.AccID, AccountsPresent.Balance).limit(1)).one()
+    response = client.patch(f"/api/v1/accounts/{acc_id}/balance", params={"amount": "0"})
+    assert response.status_code == status.HTTP_200_OK
+    assert Decimal(str(response.json()["Balance"])) == balance
+
+
+def test_update_moves_balance_between_accounts(client, db_session):
+    """Changing a transaction's account reverses it on the old one."""
+    old_acc, new_acc = db_session.scalars(select(AccountsPresent.AccID).limit(2)).all()
+    balances = {
+        acc_id: db_session.scalars(
+            select(AccountsPresent.Balance).where(AccountsPresent.AccID == acc_id)
+        ).one()
+        for acc_id in (old_acc, new_acc)
+    }
+
+    created = client.post("/api/v1/transactions/", json={
+        "Date": "2024-08-05", "Description": "move", "Amount": -40.0, "PaymentMode": "SBI",
+        "AccID": old_acc, "Department": "Serendipity", "Category": "EMI",
+    }).json()
+    try:
+        response = client.put(f"/api/v1/transactions/{created['TrNo']}", json={
+            "Date": "2024-08-05", "AccID": new_acc,
+        })
+        assert response.status_code == status.HTTP_200_OK
+
+        db_session.expire_all()
+        for acc_id, expected in ((old_acc, balances[old_acc]), (new_acc, balances[new_acc] - 40)):
+            assert db_session.scalars(
+                select(AccountsPresent.Balance).where(AccountsPresent.AccID == acc_id)
+            ).one() == expected
+    finally:
+        db_session.execute(delete(Transaction).where(Transaction.TrNo == created["TrNo"]))
+        for acc_id, balance in balances.items():
+            db_session.execute(
+                AccountsPresent.__table__.update()
+                .where(AccountsPresent.AccID == acc_id)
+                .values(Balance=balance)
+            )
+        db_session.commit()
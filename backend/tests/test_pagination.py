@@ -0,0 +1,121 @@
+"""
+Test cases for keyset (cursor) pagination.
+"""
+from datetime import date, datetime
+
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.crud.pagination import (
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    build_page,
+    decode_cursor,
+    encode_cursor,
+    keyset_query,
+)
+from app.models.models import FreedomFuture
+from app.models.transaction import Transaction
+
+
+def _walk(client, url, limit, **filters):
+    """Follow X-Next-Cursor until the last page, returning all rows."""
+    rows, cursor = [], None
+    while True:
+        params = {"limit": limit, **filters}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page) <= limit
+        rows.extend(page)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return rows
+
+
+def test_cursor_roundtrip():
+    """Cursors decode back to typed key values."""
+    keys = [Transaction.Date, Transaction.TrNo]
+    cursor = encode_cursor([datetime(2024, 7, 2), 42])
+    assert decode_cursor(cursor, keys) == [datetime(2024, 7, 2), 42]
+
+    keys = [FreedomFuture.Date, FreedomFuture.TrNo]
+    assert decode_cursor(encode_cursor([date(2024, 7, 2), 7]), keys) == [date(2024, 7, 2), 7]
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", keys)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor([1]), keys)
+
+
+@pytest.mark.parametrize("descending", [[False, False], [True, True], [True, False], [False, True]])
+def test_pages_walk_past_null_keys(tmp_path, descending):
+    """Rows with a NULL sort key are neither skipped nor end the walk early."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'nulls.db'}")
+    Transaction.__table__.create(engine)
+    keys = [Transaction.Department, Transaction.TrNo]
+    with Session(engine) as db:
+        db.execute(insert(Transaction), [
+            {"TrNo": tr_no, "Date": datetime(2024, 7, 1), "AccID": "A", "Department": department}
+            for tr_no, department in enumerate([None, "Trademan", None, "Serendipity", None, "Trademan"], start=1)
+        ])
+        db.commit()
+        everything = db.scalars(keyset_query(select(Transaction.TrNo), keys, None, 100, descending)).all()
+
+        walked, cursor = [], None
+        while True:
+            stmt = keyset_query(select(Transaction.Department, Transaction.TrNo), keys, cursor, 2, descending)
+            page = build_page(db.execute(stmt).all(), keys, 2)
+            walked.extend(row.TrNo for row in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+    engine.dispose()
+
+    assert sorted(walked) == list(range(1, 7))
+    assert walked == everything
+    # NULLs sort before every value ascending and after every value descending
+    null_positions = sorted(walked.index(tr_no) for tr_no in (1, 3, 5))
+    assert null_positions == ([3, 4, 5] if descending[0] else [0, 1, 2])
+
+
+def test_transactions_pages_are_ordered_and_complete(client):
+    """Walking transaction pages visits every row once in (Date, TrNo) order."""
+    rows = _walk(client, "/api/v1/transactions/", limit=50)
+    keys = [(row["Date"], row["TrNo"]) for row in rows]
+    assert keys == sorted(keys)
+    assert len({row["TrNo"] for row in rows}) == len(rows)
+
+
+def test_future_predictions_pages(client):
+    """Paged predictions match the unpaged result."""
+    everything = client.get("/api/v1/future/predictions").json()
+    rows = _walk(client, "/api/v1/future/predictions", limit=25)
+    assert [row["TrNo"] for row in rows] == [row["TrNo"] for row in everything]
+
+
+def test_accounts_pages(client):
+    """Accounts are paged by SLNo once a cursor is in use."""
+    rows = _walk(client, "/api/v1/accounts/", limit=2, account_type="EMI")
+    assert len(rows) > 2
+    assert [row["SLNo"] for row in rows] == sorted(row["SLNo"] for row in rows)
+    assert all(row["Type"] == "EMI" for row in rows)
+
+
+def test_unfiltered_accounts_are_paged(client):
+    """The plain account list honours limit and returns a cursor."""
+    response = client.get("/api/v1/accounts/", params={"limit": 5})
+    assert len(response.json()) == 5
+    assert response.headers.get(NEXT_CURSOR_HEADER)
+    rows = _walk(client, "/api/v1/accounts/", limit=20)
+    assert len({row["SLNo"] for row in rows}) == len(rows)
+
+
+def test_invalid_cursor_is_rejected(client):
+    """A malformed cursor is a client error."""
+    response = client.get("/api/v1/transactions/", params={"cursor": "garbage"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,92 @@
+"""
+Test cases for the vectorized cash-flow projection.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+from fastapi import status
+
+from app.services.projection import Granularity, ProjectionInputs, monthly_rates, project, project_monthly
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(7)
+    accounts, futures = 40, 120
+    installments = np.where(rng.random(accounts) < 0.4, -rng.integers(1000, 20000, accounts), 0).astype(float)
+    return ProjectionInputs(
+        start=date(2024, 10, 15),
+        acc_ids=np.array([f"ACC - {i:03d}" for i in range(accounts)], dtype=object),
+        types=np.array(["HL"] * accounts, dtype=object),
+        balances=rng.normal(-100000, 50000, accounts).round(2),
+        monthly_rates=monthly_rates(rng.choice([0, -0.12, -0.16, -1.4166, 0.405], accounts)),
+        installments=installments,
+        tenures=rng.integers(0, 36, accounts),
+        due_days=rng.choice([0, 2, 5, 20, 30], accounts),
+        future_accounts=rng.integers(0, accounts, futures),
+        future_months=rng.integers(0, 6, futures),
+        future_amounts=rng.normal(-5000, 2000, futures).round(2),
+    )
+
+
+def _replayed(inputs, months):
+    """Row-by-row reference implementation of the projection rules."""
+    balances = np.zeros((len(inputs.acc_ids), months))
+    for a in range(len(inputs.acc_ids)):
+        rows = [(m, amt) for acc, m, amt in zip(inputs.future_accounts, inputs.future_months, inputs.future_amounts) if acc == a]
+        last = max((m for m, _ in rows), default=-1)
+        first = 0 if last < 0 and inputs.due_days[a] > inputs.start.day else max(last + 1, 1)
+        balance = inputs.balances[a]
+        for m in range(months):
+            flow = sum(amt for month, amt in rows if month == m)
+            if m >= first:
+                if inputs.installments[a]:
+                    flow += inputs.installments[a] if m < inputs.tenures[a] else 0
+                else:
+                    flow += balance * inputs.monthly_rates[a]
+            balance += flow
+            balances[a, m] = balance
+    return balances
+
+
+def test_vectorized_projection_matches_row_by_row(inputs):
+    """The closed-form array computation equals a per-row month loop."""
+    balances, flows = project_monthly(inputs, 24)
+    np.testing.assert_allclose(balances, _replayed(inputs, 24), rtol=1e-9)
+    np.testing.assert_allclose(inputs.balances + flows.sum(axis=1), balances[:, -1], rtol=1e-9)
+
+
+def test_monthly_rate_conventions():
+    """Monthly percentages and annual fractions both become monthly fractions."""
+    np.testing.assert_allclose(monthly_rates(np.array([-1.4166, -0.12, 0.405, 0])), [0.014166, 0.01, 0.03375, 0])
+
+
+def test_calendar_period_rollup(inputs):
+    """Quarters and years follow the calendar, with partial first periods."""
+    balances, flows = project_monthly(inputs, 15)
+    quarterly = project(inputs, 15, Granularity.quarter)
+    assert quarterly.periods == ["2024-Q4", "2025-Q1", "2025-Q2", "2025-Q3", "2025-Q4"]
+    np.testing.assert_allclose(quarterly.flows[:, 0], flows[:, :3].sum(axis=1))
+    np.testing.assert_allclose(quarterly.balances[:, 1], balances[:, 5])
+
+    yearly = project(inputs, 15, Granularity.year)
+    assert yearly.periods == ["2024", "2025"]
+    np.testing.assert_allclose(yearly.balances[:, -1], balances[:, -1])
+
+
+def test_cashflow_endpoint(client):
+    """The endpoint returns one value per period and totals over accounts."""
+    response = client.get("/api/v1/projections/cashflow", params={
+        "as_of": "2024-10-15", "horizon": 24, "granularity": "quarter",
+    })
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["periods"][0] == "2024-Q4" and len(body["periods"]) == 8
+    assert all(len(a["balances"]) == len(body["periods"]) for a in body["accounts"])
+    assert body["total_balances"] == pytest.approx(
+        np.sum([a["balances"] for a in body["accounts"]], axis=0), abs=1
+    )
+
+    response = client.get("/api/v1/projections/cashflow", params={"horizon": 61})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
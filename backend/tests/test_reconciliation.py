@@ -0,0 +1,226 @@
+"""
+Test cases for statement reconciliation.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi import status
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.engine import Engine
+
+from app.crud.fingerprint import fingerprint_owners, transaction_fingerprint
+from app.models.models import BankStatementLine, FreedomFuture, PaymentMode, StatementMatch
+from app.models.transaction import Transaction
+from app.services.reconciliation import (
+    LedgerEntry,
+    LedgerIndex,
+    StatementEntry,
+    SyncPair,
+    match_lines,
+    matched_pairs,
+    reconcile,
+    sync_descriptions,
+)
+from app.services.statements import stage_lines
+
+
+def _line(line_id, amount, day, description, bank="ICICI_090"):
+    return StatementEntry(line_id, bank, date(2024, 7, day), Decimal(amount), description)
+
+
+def _index(*entries):
+    return LedgerIndex(
+        (bank, int(amount * 100), LedgerEntry(tr_no, date(2024, 7, day), description))
+        for tr_no, bank, amount, day, description in entries
+    )
+
+
+def test_match_lines_sorts_into_matched_ambiguous_unmatched():
+    index = _index(
+        (1, "ICICI_090", -1060, 4, "Max Life Insurance"),
+        (2, "ICICI_090", -500, 5, "Swiggy"),
+        (3, "ICICI_090", -500, 5, "Zomato"),
+        (4, "ICICI_090", -200, 10, "Tea"),
+        (5, "ICICI_090", -200, 10, "Tea"),
+        (6, "SBI", -75, 4, "Parking"),
+    )
+    lines = [
+        _line(10, "-1060.00", 5, "ACH/MAX LIFE INSURANCE/0042"),
+        _line(11, "-500.00", 5, "UPI/ZOMATO LTD/1234"),
+        _line(12, "-200.00", 10, "UPI/TEA STALL"),
+        _line(13, "-75.00", 4, "PARKING"),
+        _line(14, "-1060.00", 20, "ACH/MAX LIFE INSURANCE/0043"),
+    ]
+    result = match_lines(lines, index, window_days=3, margin=0.1)
+
+    assert {line_id: c.tr_no for line_id, c in result.matched.items()} == {10: 1, 11: 3}
+    assert [c.tr_no for c in result.ambiguous[12]] == [4, 5]
+    # Other banks' and out-of-window transactions are never candidates
+    assert result.unmatched == [13, 14]
+
+
+def test_match_lines_gives_a_transaction_to_one_line():
+    index = _index((1, "DBS", -300, 3, "Rent July"))
+    lines = [_line(1, "-300", 3, "RENT JULY", bank="DBS"), _line(2, "-300", 4, "TRANSFER", bank="DBS")]
+    result = match_lines(lines, index, window_days=3, margin=0.1)
+
+    assert list(result.matched) == [1]
+    assert list(result.ambiguous) == [2]
+
+
+def test_reconcile_persists_and_skips_matched(scratch_session):
+    scratch_session.execute(insert(Transaction), [
+        {"TrNo": 1, "Date": datetime(2024, 7, 2), "Description": "Ind Money Loan", "Amount": -10840.0, "PaymentMode": "SBI"},
+        {"TrNo": 2, "Date": datetime(2024, 7, 2), "Description": "Cred Loan", "Amount": -10540.0, "PaymentMode": "SBI"},
+    ])
+    stage_lines(scratch_session, [
+        {"Bank": PaymentMode.SBI, "SourceFile": "sbi.csv", "LineNo": n, "Date": date(2024, 7, 3),
+         "Description": description, "Amount": Decimal(amount)}
+        for n, (description, amount) in enumerate([("NACH IND MONEY", "-10840"), ("NACH CRED", "-10540")])
+    ])
+    scratch_session.commit()
+
+    dry = reconcile(scratch_session, date(2024, 7, 1), date(2024, 7, 31), persist=False)
+    assert len(dry.matched) == 2
+    assert scratch_session.scalars(select(StatementMatch)).all() == []
+
+    result = reconcile(scratch_session, date(2024, 7, 1), date(2024, 7, 31))
+    assert sorted(c.tr_no for c in result.matched.values()) == [1, 2]
+    assert sorted(scratch_session.scalars(select(StatementMatch.TrNo))) == [1, 2]
+
+    again = reconcile(scratch_session, date(2024, 7, 1), date(2024, 7, 31))
+    assert (again.matched, again.ambiguous, again.unmatched) == ({}, {}, [])
+
+
+def test_sync_descriptions_is_one_bulk_update(scratch_session):
+    """Matched narrations are diffed first and written by a single UPDATE."""
+    scratch_session.execute(insert(Transaction), [
+        {"TrNo": n, "Date": datetime(2024, 7, n), "Description": f"Row {n}", "Amount": -n, "PaymentMode": "DBS"}
+        for n in range(1, 6)
+    ])
+    stage_lines(scratch_session, [
+        {"Bank": PaymentMode.DBS, "SourceFile": "dbs.csv", "LineNo": n, "Date": date(2024, 7, n),
+         "Description": "Row 1" if n == 1 else f"UPI/PAYEE {n}", "Amount": Decimal(-n)}
+        for n in range(1, 6)
+    ])
+    scratch_session.commit()
+    reconcile(scratch_session, date(2024, 7, 1), date(2024, 7, 31), window_days=0)
+    pairs = matched_pairs(scratch_session)
+    assert len(pairs) == 5
+
+    dry = sync_descriptions(scratch_session, pairs + [SyncPair(line_id=99, tr_no=9)], dry_run=True)
+    assert (dry.updated, dry.unchanged) == (4, 1)
+    assert dry.errors == ["Statement line 99 does not exist"]
+    assert scratch_session.get(Transaction, 2).Description == "Row 2"
+
+    updates = []
+    listener = lambda conn, cursor, statement, *args: updates.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        result = sync_descriptions(scratch_session, pairs + [SyncPair(line_id=pairs[0].line_id, tr_no=5, comments="Paid")])
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+    assert [statement for statement in updates if statement.startswith("UPDATE")] == [
+        'UPDATE "Transactions(Past)" SET "Description"=?, "Fingerprint"=? WHERE "Transactions(Past)"."TrNo" = ?'
+    ]
+    assert result.updated == 4 and len(result.errors) == 1
+    scratch_session.expire_all()
+    assert [tr.Description for tr in scratch_session.scalars(select(Transaction).order_by(Transaction.TrNo))] == [
+        "Row 1", "UPI/PAYEE 2", "UPI/PAYEE 3", "UPI/PAYEE 4", "UPI/PAYEE 5",
+    ]
+
+
+def test_sync_descriptions_rewrites_fingerprints(scratch_session):
+    """Synced rows get the fingerprint of their new description; clashes are refused."""
+    ledger = [(1, "Rent", -100.0), (2, "UPI/RENT JULY", -100.0), (3, "Tea", -40.0)]
+    scratch_session.execute(insert(Transaction), [
+        {"TrNo": tr_no, "Date": datetime(2024, 7, 2), "Description": description, "Amount": amount,
+         "PaymentMode": "DBS", "AccID": "A",
+         "Fingerprint": transaction_fingerprint(datetime(2024, 7, 2), amount, "A", "DBS", description)}
+        for tr_no, description, amount in ledger
+    ])
+    stage_lines(scratch_session, [
+        {"Bank": PaymentMode.DBS, "SourceFile": "dbs.csv", "LineNo": n, "Date": date(2024, 7, 2),
+         "Description": description, "Amount": Decimal(amount)}
+        for n, (description, amount) in enumerate([("UPI/RENT JULY", "-100"), ("UPI/TEA", "-40")])
+    ])
+    scratch_session.commit()
+    rent_line, tea_line = scratch_session.scalars(select(BankStatementLine.LineID).order_by(BankStatementLine.LineNo)).all()
+
+    result = sync_descriptions(scratch_session, [SyncPair(rent_line, 1), SyncPair(tea_line, 3)])
+
+    assert result.errors == ["TrNo 1 would duplicate transaction 2"]
+    assert result.updated == 1
+    scratch_session.expire_all()
+    tea = scratch_session.get(Transaction, 3)
+    assert (tea.Description, tea.Fingerprint) == (
+        "UPI/TEA", transaction_fingerprint(datetime(2024, 7, 2), -40.0, "A", "DBS", "UPI/TEA"),
+    )
+    assert scratch_session.get(Transaction, 1).Description == "Rent"
+    # The original content is free again, so re-entering it is not a duplicate
+    assert fingerprint_owners(scratch_session, [transaction_fingerprint(datetime(2024, 7, 2), -40.0, "A", "DBS", "Tea")]) == {}
+
+
+def test_description_sync_endpoint_dry_run(client, db_session):
+    """Explicit pairs can target Freedom(Future); a dry run writes nothing."""
+    future = db_session.scalars(select(FreedomFuture).order_by(FreedomFuture.TrNo).limit(1)).one()
+    BankStatementLine.__table__.create(db_session.get_bind(), checkfirst=True)
+    stage_lines(db_session, [{
+        "Bank": PaymentMode.DBS, "SourceFile": "sync-test.csv", "LineNo": 1,
+        "Date": future.Date, "Description": "NEFT/STATEMENT NARRATION", "Amount": Decimal(-1),
+    }])
+    db_session.commit()
+    line_id = db_session.scalars(
+        select(BankStatementLine.LineID).where(BankStatementLine.SourceFile == "sync-test.csv")
+    ).one()
+    try:
+        response = client.post(
+            "/api/v1/reconciliation/descriptions",
+            params={"target": "future", "dry_run": True},
+            json={"pairs": [{"LineID": line_id, "TrNo": future.TrNo, "Comments": "From statement"}]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        summary = response.json()
+        assert summary["updated"] == 1
+        assert [change["column"] for change in summary["changes"]] == ["Description", "Comments"]
+        db_session.expire_all()
+        assert db_session.get(FreedomFuture, future.TrNo).Description == future.Description
+
+        response = client.post("/api/v1/reconciliation/descriptions", params={"target": "future"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    finally:
+        db_session.execute(delete(BankStatementLine).where(BankStatementLine.LineID == line_id))
+        db_session.commit()
+
+
+def test_reconciliation_endpoint(client, db_session):
+    """Staged copies of ledger rows are matched back to them."""
+    ledger = db_session.scalars(
+        select(Transaction).where(Transaction.PaymentMode == "ICICI_090").order_by(Transaction.TrNo).limit(3)
+    ).all()
+    BankStatementLine.__table__.create(db_session.get_bind(), checkfirst=True)
+    stage_lines(db_session, [
+        {"Bank": PaymentMode.ICICI_090, "SourceFile": "reconcile-test.csv", "LineNo": n,
+         "Date": tr.Date.date(), "Description": tr.Description, "Amount": Decimal(str(tr.Amount))}
+        for n, tr in enumerate(ledger)
+    ])
+    db_session.commit()
+    line_ids = db_session.scalars(
+        select(BankStatementLine.LineID).where(BankStatementLine.SourceFile == "reconcile-test.csv")
+    ).all()
+    try:
+        day = min(tr.Date for tr in ledger).date()
+        response = client.post(
+            "/api/v1/reconciliation/",
+            params={"start": str(day), "end": str(max(tr.Date for tr in ledger).date()), "bank": "ICICI_090"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        matched = {match["TrNo"] for match in response.json()["matched"]}
+        assert matched == {tr.TrNo for tr in ledger}
+
+        response = client.post("/api/v1/reconciliation/", params={"start": "2024-08-01", "end": "2024-07-01"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    finally:
+        db_session.execute(delete(StatementMatch).where(StatementMatch.LineID.in_(line_ids)))
+        db_session.execute(delete(BankStatementLine).where(BankStatementLine.LineID.in_(line_ids)))
+        db_session.commit()
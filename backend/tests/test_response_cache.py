@@ -0,0 +1,76 @@
+"""
+Test cases for the write-invalidated response cache.
+"""
+from fastapi import status
+from sqlalchemy import select
+
+from app.core.cache import TableVersions, VersionedCache
+from app.models.models import AccountsPresent
+
+
+def test_versioned_cache_lru_ttl_and_invalidation(monkeypatch):
+    """Entries are evicted by size, expire by TTL and drop on table writes."""
+    now = [0.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    versions = TableVersions()
+    cache = VersionedCache(maxsize=2, ttl=10, versions=versions)
+
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper(), cache.versions(["T"]), ["T"])
+    assert cache.get("a") is None
+    assert cache.get("c") == "C"
+
+    versions.bump("Other")
+    assert cache.get("b") == "B"
+    versions.bump("T")
+    assert cache.get("b") is None
+
+    cache.put("d", "D", cache.versions(["T"]), ["T"])
+    now[0] = 11
+    assert cache.get("d") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 3)
+    assert (stats.evictions, stats.invalidations, stats.expirations) == (1, 1, 1)
+    assert stats.size == 1
+
+
+def test_list_is_served_from_cache_until_a_write(client, db_session):
+    """Repeated reads hit the cache; a balance change invalidates them."""
+    acc_id = db_session.scalars(select(AccountsPresent.AccID).limit(1)).one()
+    params = {"Type": "EMI", "sort": "-Balance"}
+
+    first = client.get("/api/v1/accounts/", params=params)
+    assert first.headers["X-Cache"] == "MISS"
+    # Same parameters in another order share the entry
+    second = client.get("/api/v1/accounts/?sort=-Balance&Type=EMI")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+    unfiltered = client.get("/api/v1/accounts/")
+    assert unfiltered.headers["X-Cache"] == "MISS"
+
+    response = client.patch(f"/api/v1/accounts/{acc_id}/balance", params={"amount": "12.34"})
+    assert response.status_code == status.HTTP_200_OK
+    try:
+        after = client.get("/api/v1/accounts/")
+        assert after.headers["X-Cache"] == "MISS"
+        balances = {row["AccID"]: row["Balance"] for row in after.json()}
+        before = {row["AccID"]: row["Balance"] for row in unfiltered.json()}
+        assert float(balances[acc_id]) == round(float(before[acc_id]) + 12.34, 2)
+    finally:
+        client.patch(f"/api/v1/accounts/{acc_id}/balance", params={"amount": "-12.34"})
+
+    stats = client.get("/api/v1/cache/stats").json()
+    assert stats["responses"]["hits"] >= 1
+    assert stats["responses"]["invalidations"] >= 1
+    assert set(stats) == {"responses", "calendar"}
+
+
+def test_errors_are_not_cached(client):
+    """Only successful responses are stored."""
+    for _ in range(2):
+        response = client.get("/api/v1/transactions/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "X-Cache" not in response.headers
+    assert client.get("/api/v1/cache/stats").json()["responses"]["size"] == 0
@@ -0,0 +1,113 @@
+"""
+Test cases for the trigger-maintained monthly rollups.
+"""
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from sqlalchemy import delete, func, select, text, update
+
+from app.core.cache import table_versions
+from app.crud.crud import monthly_rollup, transaction
+from app.crud.crud_rollup import ensure_rollups
+from app.models.models import MonthlyRollup
+from app.models.transaction import Transaction
+from tests.conftest import make_account
+
+ROLLUP_COLUMNS = (
+    MonthlyRollup.YearMonth, MonthlyRollup.AccID, MonthlyRollup.Category, MonthlyRollup.Department,
+    MonthlyRollup.PaymentMode, MonthlyRollup.Total, MonthlyRollup.Count,
+    MonthlyRollup.MinAmount, MonthlyRollup.MaxAmount,
+)
+
+
+def _row(on, amount, category="EMI", department="Serendipity"):
+    return {
+        "Date": on, "Description": "t", "Amount": amount, "PaymentMode": "SBI",
+        "AccID": "A", "Department": department, "Category": category,
+    }
+
+
+@pytest.fixture
+def session(scratch_engine, scratch_session):
+    ensure_rollups(scratch_engine)
+    scratch_session.add(make_account("A", Balance=Decimal("1000.00")))
+    scratch_session.commit()
+    return scratch_session
+
+
+def _rollups(db):
+    return db.execute(select(*ROLLUP_COLUMNS).order_by(*ROLLUP_COLUMNS[:5])).all()
+
+
+def _rescanned(db):
+    """Brute force: the rollups recomputed from the ledger."""
+    rows = db.execute(text("""
+        SELECT substr(Date, 1, 7), AccID, Category, Department, PaymentMode,
+               round(sum(Amount), 2), count(*), min(Amount), max(Amount)
+        FROM "Transactions(Past)" GROUP BY 1, 2, 3, 4, 5 ORDER BY 1, 2, 3, 4, 5
+    """)).all()
+    return [
+        (*row[:5], Decimal(str(row[5])).quantize(Decimal("0.01")), row[6],
+         Decimal(str(row[7])).quantize(Decimal("0.01")), Decimal(str(row[8])).quantize(Decimal("0.01")))
+        for row in rows
+    ]
+
+
+def test_triggers_track_inserts_updates_and_deletes(session):
+    """Every write path leaves the rollups equal to a full rescan."""
+    transaction.create_many(session, rows=[
+        _row("2024-07-01", -100.0), _row("2024-07-15", -40.5), _row("2024-07-20", 250.0),
+        _row("2024-08-02", -10.0, category="Salaries"), _row("2024-08-03", -30.0, department="Trademan"),
+    ])
+    assert _rollups(session) == _rescanned(session)
+    assert len(_rollups(session)) == 3
+
+    smallest = session.scalars(select(Transaction.TrNo).where(Transaction.Amount == -100.0)).one()
+    session.execute(update(Transaction).where(Transaction.TrNo == smallest).values(Amount=-5.0))
+    session.execute(update(Transaction).where(Transaction.Amount == -10.0).values(Category="EMI"))
+    session.commit()
+    assert _rollups(session) == _rescanned(session)
+
+    session.execute(delete(Transaction).where(Transaction.Amount == -30.0))
+    session.commit()
+    assert _rollups(session) == _rescanned(session)
+
+
+def test_rebuild_matches_triggers_and_bumps_version(session):
+    """A full rebuild reproduces the trigger-maintained rollups and invalidates cached responses."""
+    transaction.create_many(session, rows=[_row("2024-07-01", -100.0), _row("2024-08-02", 20.0, category="Salaries")])
+    maintained = _rollups(session)
+    version = table_versions.get(MonthlyRollup.__tablename__)
+
+    assert monthly_rollup.rebuild(session) == len(maintained)
+    assert _rollups(session) == maintained
+    assert table_versions.get(MonthlyRollup.__tablename__) != version
+    assert ("2024-08", "A", "EMI", "Trademan") not in [row[:4] for row in _rollups(session)]
+
+
+def test_rollups_endpoint_matches_ledger(client, db_session):
+    """Month/Department totals from /rollups equal a GROUP BY over the ledger."""
+    month = func.substr(Transaction.Date, 1, 7)
+    rows = db_session.execute(
+        select(month, func.sum(Transaction.Amount), func.count())
+        .where(Transaction.Department == "Serendipity").group_by(month)
+    ).all()
+
+    response = client.get("/api/v1/rollups/", params={"group_by": "Department", "Department": "Serendipity"})
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert {r["YearMonth"]: r["Total"] for r in body} == pytest.approx({ym: total for ym, total, _ in rows})
+    assert {r["YearMonth"]: r["Count"] for r in body} == {ym: count for ym, _, count in rows}
+    assert all("Category" not in r for r in body)
+
+    response = client.get("/api/v1/rollups/", params={"group_by": "", "YearMonth__gte": "2024-09", "sort": "-YearMonth"})
+    months = [r["YearMonth"] for r in response.json()]
+    assert months == sorted(months, reverse=True) and min(months) >= "2024-09"
+
+
+@pytest.mark.parametrize("params", [{"group_by": "Description"}, {"Amount": "1"}])
+def test_rollups_endpoint_rejects_unknown_fields(client, params):
+    """Only the rollup dimensions can be grouped or filtered on."""
+    response = client.get("/api/v1/rollups/", params=params)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,31 @@
+"""
+Test cases for the tuned SQLite engine factory.
+"""
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import create_db_engine
+
+
+def test_pragmas_applied_on_every_connection(tmp_path):
+    """Each pooled connection gets WAL, NORMAL sync and the configured limits."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+
+    with engine.connect() as first, engine.connect() as second:
+        for conn in (first, second):
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # NORMAL == 1, MEMORY == 2
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == settings.SQLITE_CACHE_SIZE
+
+    assert engine.pool.size() == settings.DB_POOL_SIZE
+    assert engine.echo is settings.DB_ECHO
+
+
+def test_memory_database_skips_pool_sizing():
+    """In-memory URLs use SQLite's single-connection pool without sizing arguments."""
+    engine = create_db_engine("sqlite://")
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
@@ -0,0 +1,182 @@
+"""
+Test cases for bank statement ingestion.
+"""
+import asyncio
+import io
+from datetime import date, datetime
+from decimal import Decimal
+
+import openpyxl
+import pytest
+from fastapi import status
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.session import create_async_db_engine
+from app.models.models import BankStatementLine, PaymentMode
+from app.services.statements import (
+    infer_bank,
+    ingest_statements,
+    ingest_statements_async,
+    parse_statement,
+    shutdown_parse_pool,
+)
+
+SBI_CSV = """Account Name :,SERENDIPITY
+Account Number :,00000012345
+,
+Txn Date,Value Date,Description,Ref No./Cheque No.,Debit,Credit,Balance
+1 Jul 2024,1 Jul 2024,NEFT  SALARY JULY,N123,,"1,20,000.00","1,50,000.00"
+3 Jul 2024,3 Jul 2024,ATM WDL,,"5,000.00",,"1,45,000.00"
+,,,,,,
+Computer generated statement,,,,,,
+"""
+
+DBS_CSV = """Transaction Date,Value Date,Transaction Details,Reference,Withdrawal,Deposit,Balance
+02-Jul-2024,02-Jul-2024,UPI/RENT,R1,25000,,75000
+04-Jul-2024,04-Jul-2024,INTEREST,,,12.5,75012.5
+"""
+
+
+def _icici_xlsx():
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(("Detailed Statement",))
+    sheet.append(())
+    sheet.append((
+        "S No.", "Value Date", "Transaction Date", "Cheque Number", "Transaction Remarks",
+        "Withdrawal Amount (INR )", "Deposit Amount (INR )", "Balance (INR )",
+    ))
+    sheet.append((1, "05/07/2024", datetime(2024, 7, 5), "-", "BIL/ONL/ELECTRICITY", 1800.4, 0, 9199.6))
+    sheet.append((2, "06/07/2024", "06/07/2024", None, "IMPS/REFUND", 0, 199.6, 9399.2))
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_parse_signs_and_skips_footer_rows():
+    """Credits are positive, debits negative; preamble and footer rows are skipped."""
+    rows, skipped = parse_statement(SBI_CSV.encode(), "SBI-july.csv", PaymentMode.SBI)
+
+    assert [(row["Date"], row["Amount"], row["Balance"]) for row in rows] == [
+        (date(2024, 7, 1), Decimal("120000.00"), Decimal("150000.00")),
+        (date(2024, 7, 3), Decimal("-5000.00"), Decimal("145000.00")),
+    ]
+    assert rows[0]["Description"] == "NEFT SALARY JULY"
+    assert rows[0]["LineNo"] == 5
+    assert skipped == 2
+
+
+def test_infer_bank_prefers_longest_name():
+    assert infer_bank("statements/ICICI_CC_9003_2024-07.xlsx") is PaymentMode.ICICI_CC_9003
+    assert infer_bank("icici_090-july.csv") is PaymentMode.ICICI_090
+    assert infer_bank("export.csv") is None
+
+
+def test_ingest_is_parallel_and_idempotent(scratch_session):
+    """Files are parsed in worker processes and re-ingesting stages nothing new."""
+    files = [
+        ("SBI_3479-july.csv", SBI_CSV.encode()),
+        ("ICICI_090-july.xlsx", _icici_xlsx()),
+        ("DBS-july.csv", DBS_CSV.encode()),
+        ("statement.csv", DBS_CSV.encode()),
+    ]
+    results = ingest_statements(scratch_session, files, workers=2, batch_size=1)
+
+    assert [(result.bank, result.inserted, result.duplicates) for result in results[:3]] == [
+        (PaymentMode.SBI_3479, 2, 0),
+        (PaymentMode.ICICI_090, 2, 0),
+        (PaymentMode.DBS, 2, 0),
+    ]
+    assert results[3].bank is None and "bank" in results[3].error
+    icici = scratch_session.scalars(
+        select(BankStatementLine.Amount).where(BankStatementLine.Bank == PaymentMode.ICICI_090)
+        .order_by(BankStatementLine.Date)
+    ).all()
+    assert icici == [Decimal("-1800.40"), Decimal("199.60")]
+
+    again = ingest_statements(scratch_session, files[:3], workers=2)
+    assert [(result.inserted, result.duplicates) for result in again] == [(0, 2)] * 3
+
+
+def test_lines_are_deduplicated_by_content_not_file_name(scratch_session):
+    """Next month's statement under the same name is staged; a renamed re-upload is not."""
+    august = DBS_CSV.replace("-Jul-", "-Aug-")
+    results = ingest_statements(
+        scratch_session,
+        [("DBS.csv", DBS_CSV.encode()), ("DBS.csv", august.encode()), ("DBS-copy.csv", DBS_CSV.encode())],
+        workers=1,
+    )
+
+    assert [(result.file, result.inserted, result.duplicates) for result in results] == [
+        ("DBS.csv", 2, 0), ("DBS.csv", 2, 0), ("DBS-copy.csv", 0, 2),
+    ]
+    assert scratch_session.scalar(select(func.count()).select_from(BankStatementLine)) == 4
+
+
+def test_repeated_lines_of_one_statement_are_kept():
+    """Identical lines within a file get distinct hashes, stable across uploads."""
+    csv = "Transaction Date,Transaction Details,Withdrawal\n02-Jul-2024,TEA,40\n02-Jul-2024,TEA,40\n"
+    first, _ = parse_statement(csv.encode(), "DBS-a.csv", PaymentMode.DBS)
+    second, _ = parse_statement(csv.encode(), "DBS-b.csv", PaymentMode.DBS)
+
+    assert first[0]["LineHash"] != first[1]["LineHash"]
+    assert [row["LineHash"] for row in first] == [row["LineHash"] for row in second]
+
+
+def test_unreadable_file_does_not_stop_others(scratch_session):
+    results = ingest_statements(
+        scratch_session,
+        [("DBS-1.csv", DBS_CSV.encode()), ("DBS-2.csv", b"nothing,here\n1,2\n")],
+        workers=1,
+    )
+    assert results[0].inserted == 2
+    assert "header" in results[1].error
+
+
+@pytest.mark.asyncio
+async def test_async_ingest_keeps_the_event_loop_free(tmp_path):
+    """Files are parsed off the event loop, which keeps running meanwhile."""
+    engine = create_async_db_engine(f"sqlite:///{tmp_path / 'statements.db'}")
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker = asyncio.create_task(tick())
+    try:
+        async with async_sessionmaker(engine)() as db:
+            results = await ingest_statements_async(db, [
+                ("SBI-july.csv", SBI_CSV.encode()),
+                ("ICICI_090-july.xlsx", _icici_xlsx()),
+                ("notes.txt", b"nothing"),
+            ])
+    finally:
+        ticker.cancel()
+        shutdown_parse_pool()
+        await engine.dispose()
+
+    assert [(result.inserted, result.error is None) for result in results] == [
+        (2, True), (2, True), (0, False),
+    ]
+    # Spawning the workers alone takes far longer than one tick
+    assert ticks > 1
+
+
+def test_statement_upload_endpoint(client, db_session):
+    """Uploaded statements are staged once under the given bank."""
+    upload = [("files", ("upload-july.csv", DBS_CSV.encode(), "text/csv"))]
+    try:
+        response = client.post("/api/v1/statements/", params={"bank": "DBS"}, files=upload)
+        assert response.status_code == status.HTTP_200_OK
+        summary, = response.json()["files"]
+        assert (summary["bank"], summary["lines"], summary["error"]) == ("DBS", 2, None)
+
+        response = client.post("/api/v1/statements/", params={"bank": "Cash"}, files=upload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    finally:
+        db_session.execute(delete(BankStatementLine).where(BankStatementLine.SourceFile == "upload-july.csv"))
+        db_session.commit()
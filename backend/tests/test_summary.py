@@ -0,0 +1,88 @@
+"""
+Test cases for the role dashboard summaries.
+"""
+from collections import defaultdict
+from datetime import date
+
+import pytest
+from fastapi import status
+from sqlalchemy import select
+
+from app.models.models import AccountsPresent, FreedomFuture
+from app.models.transaction import Transaction
+
+AS_OF = date(2024, 10, 15)
+
+
+@pytest.fixture
+def rows(db_session):
+    """Raw rows the dashboards used to reduce in the browser."""
+    return {
+        "accounts": db_session.execute(select(AccountsPresent.Type, AccountsPresent.Balance)).all(),
+        "transactions": db_session.execute(
+            select(Transaction.Date, Transaction.Amount, Transaction.Department)
+        ).all(),
+        "unpaid": db_session.execute(
+            select(FreedomFuture.Date, FreedomFuture.Amount).where(FreedomFuture.Paid == False)  # noqa: E712
+        ).all(),
+    }
+
+
+def _summary(client, role):
+    response = client.get(f"/api/v1/summary/{role}", params={"as_of": AS_OF.isoformat()})
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_owner_summary_matches_client_side_totals(client, rows):
+    """Owner figures equal the reductions the dashboard used to run."""
+    body = _summary(client, "owner")
+
+    assert body["total_balance"] == pytest.approx(sum(float(b) for _, b in rows["accounts"]))
+    assert body["account_count"] == len(rows["accounts"])
+    by_type = defaultdict(float)
+    for type_, balance in rows["accounts"]:
+        by_type[type_.value] += float(balance)
+    assert {t["Type"]: t["balance"] for t in body["accounts_by_type"]} == pytest.approx(by_type)
+
+    month = [a for d, a, _ in rows["transactions"] if (d.year, d.month) == (AS_OF.year, AS_OF.month)]
+    assert body["monthly_expenses"] == pytest.approx(sum(-a for a in month if a < 0))
+
+    net = defaultdict(float)
+    for _, amount, department in rows["transactions"]:
+        net[department] += amount
+    assert {g["name"]: g["amount"] for g in body["net_by_department"]} == pytest.approx(net)
+
+    upcoming = [abs(float(a)) for d, a in rows["unpaid"] if d >= AS_OF]
+    assert body["outstanding"]["count"] == len(upcoming)
+    assert body["outstanding"]["total"] == pytest.approx(sum(upcoming))
+    assert "expenses_by_category" not in body
+
+
+def test_budget_analyst_expense_breakdowns(client, rows):
+    """Department and Category expense breakdowns cover the same debits."""
+    body = _summary(client, "budget-analyst")
+
+    expenses = defaultdict(float)
+    for _, amount, department in rows["transactions"]:
+        if amount < 0:
+            expenses[department] += -amount
+    assert {g["name"]: g["amount"] for g in body["expenses_by_department"]} == pytest.approx(expenses)
+    assert sum(g["amount"] for g in body["expenses_by_category"]) == pytest.approx(sum(expenses.values()))
+    assert "net_by_department" not in body
+
+
+def test_ca_summary_is_small(client):
+    """The CA dashboard only gets account figures and fits in a few kilobytes."""
+    response = client.get("/api/v1/summary/ca")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.content) < 4096
+    assert set(response.json()) == {
+        "role", "as_of", "total_balance", "account_count", "monthly_expenses", "accounts_by_type",
+    }
+
+
+def test_unknown_role_is_rejected(client):
+    """Only the three dashboard roles are served."""
+    response = client.get("/api/v1/summary/auditor")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,88 @@
+"""
+Test cases for matching Zoho Books exports against Transactions(Past).
+"""
+import io
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.models.transaction import Transaction
+from app.services.importer import ZohoImportError, match_zoho_export, read_zoho_rows
+
+ZOHO_CSV = """Date,Account,Transaction Details,Reference#,Debit,Credit,Amount
+2024-07-02,ICICI 090,Ind Money Loan EMI,IND MONEY LOAN,,,"10,840.00"
+2024-07-02,ICICI 090,Cred EMI,,,,"10,540.00"
+2024-07-02,ICICI 090,Cred EMI again,,,,10540.00
+2024-07-05,ICICI 090,Office rent,Rent deposit,,,25000
+2024-07-06,ICICI 090,Unknown payee,,,,999
+,,Total,,,,"47,919.00"
+"""
+
+
+def _rows():
+    return [
+        (1, datetime(2024, 7, 2), "Ind Money Loan", -10840.0, "No"),
+        (2, datetime(2024, 7, 2), "Cred Loan", -10540.0, None),
+        (3, datetime(2024, 7, 5), "Rent", -25000.0, "No"),
+        (4, datetime(2024, 7, 5), "Rent deposit", -25000.0, "Yes"),
+        (5, datetime(2024, 7, 6), "Tea", -40.0, "Yes"),
+        (6, datetime(2024, 8, 1), "Outside the export", -40.0, "Yes"),
+    ]
+
+
+@pytest.fixture
+def scratch_db(scratch_session):
+    scratch_session.execute(insert(Transaction), [
+        {"TrNo": tr_no, "Date": day, "Description": description, "Amount": amount,
+         "PaymentMode": "ICICI_090", "ZohoMatch": zoho}
+        for tr_no, day, description, amount, zoho in _rows()
+    ])
+    scratch_session.commit()
+    return scratch_session
+
+
+def test_read_zoho_rows_skips_totals():
+    rows, skipped = read_zoho_rows(io.BytesIO(ZOHO_CSV.encode()))
+    assert [row.line for row in rows] == [2, 3, 4, 5, 6]
+    assert rows[0].reference == "indmoneyloan"
+    assert skipped == 1
+
+    with pytest.raises(ZohoImportError):
+        read_zoho_rows(io.BytesIO(b"Account,Amount\nICICI,10\n"))
+
+
+def test_match_sets_zoho_match_and_reports_both_sides(tmp_path, scratch_db):
+    path = tmp_path / "zoho.csv"
+    path.write_text(ZOHO_CSV)
+
+    dry = match_zoho_export(scratch_db, str(path), dry_run=True)
+    assert (dry.marked_yes, dry.marked_no) == (2, 0)
+    assert scratch_db.get(Transaction, 1).ZohoMatch == "No"
+
+    result = match_zoho_export(scratch_db, str(path), batch_size=2)
+    assert (result.start, result.end, result.transactions) == (date(2024, 7, 2), date(2024, 7, 6), 5)
+    # The reference names TrNo 4, so the earlier rent of the same amount stays open
+    assert sorted(result.matched) == [(2, 1), (3, 2), (5, 4)]
+    assert [row.tr_no for row in result.unmatched_transactions] == [3, 5]
+    assert [row.line for row in result.unmatched_zoho] == [4, 6]
+
+    scratch_db.expire_all()
+    stored = dict(scratch_db.execute(select(Transaction.TrNo, Transaction.ZohoMatch)).tuples().all())
+    # TrNo 5 was confirmed by another export and keeps its 'Yes'
+    assert stored == {1: "Yes", 2: "Yes", 3: "No", 4: "Yes", 5: "Yes", 6: "Yes"}
+
+    again = match_zoho_export(scratch_db, str(path))
+    assert (again.marked_yes, again.marked_no) == (0, 0)
+
+
+def test_reset_unmatched_downgrades_the_rest_of_the_range(tmp_path, scratch_db):
+    path = tmp_path / "zoho.csv"
+    path.write_text(ZOHO_CSV)
+
+    result = match_zoho_export(scratch_db, str(path), reset_unmatched=True)
+    assert (result.marked_yes, result.marked_no) == (2, 1)
+
+    scratch_db.expire_all()
+    stored = dict(scratch_db.execute(select(Transaction.TrNo, Transaction.ZohoMatch)).tuples().all())
+    assert stored == {1: "Yes", 2: "Yes", 3: "No", 4: "Yes", 5: "No", 6: "Yes"}
@@ -1,13 +1,13 @@
 "use client";
 
-import { useState, useEffect } from "react";
+import { useState, useCallback } from "react";
 import FullCalendar from "@fullcalendar/react";
 import dayGridPlugin from "@fullcalendar/daygrid";
 import timeGridPlugin from "@fullcalendar/timegrid";
 import interactionPlugin from "@fullcalendar/interaction";
-import { EventClickArg } from '@fullcalendar/core';
-import { TransactionsAPI, FutureAPI } from "@/utils/api";
-import { Transaction, FuturePrediction } from "@/types/models";
+import { DatesSetArg, EventClickArg } from '@fullcalendar/core';
+import { CalendarAPI } from "@/utils/api";
+import { CalendarDay, CalendarFutureEntry } from "@/types/models";
 
 interface CalendarEvent {
   id: string;
@@ -20,92 +20,86 @@ interface CalendarEvent {
   borderColor: string;
   textColor: string;
   extendedProps: {
-    department?: string;
+    count?: number;
     description?: string;
+    paid?: boolean;
     amount: number;
     type: 'transaction' | 'prediction';
   };
 }
 
+// YYYY-MM of the month the visible range starts in
+const monthOf = (date: Date) =>
+  `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
+
+const predictionEvent = (day: CalendarDay, entry: CalendarFutureEntry): CalendarEvent => ({
+  id: `prediction-${entry.TrNo}`,
+  title: `${entry.Paid ? 'Paid' : 'Due'}: ₹${entry.Amount}`,
+  start: day.date,
+  end: day.date,
+  amount: entry.Amount,
+  type: 'prediction',
+  backgroundColor: entry.Paid ? '#e0f2fe' : '#fef9c3',
+  borderColor: entry.Paid ? '#0ea5e9' : '#eab308',
+  textColor: entry.Paid ? '#075985' : '#854d0e',
+  extendedProps: {
+    description: entry.Description,
+    paid: entry.Paid,
+    amount: entry.Amount,
+    type: 'prediction'
+  }
+});
+
+// One summary event per day for past transactions, one event per prediction
+const dayEvents = (day: CalendarDay): CalendarEvent[] => {
+  const events: CalendarEvent[] = [];
+  if (day.transaction_count > 0) {
+    const total = day.transaction_total;
+    events.push({
+      id: `transactions-${day.date}`,
+      title: `${day.transaction_count} txn: ₹${total}`,
+      start: day.date,
+      end: day.date,
+      amount: total,
+      type: 'transaction',
+      backgroundColor: total >= 0 ? '#dcfce7' : '#fee2e2',
+      borderColor: total >= 0 ? '#22c55e' : '#ef4444',
+      textColor: total >= 0 ? '#166534' : '#991b1b',
+      extendedProps: {
+        count: day.transaction_count,
+        amount: total,
+        type: 'transaction'
+      }
+    });
+  }
+  [...day.due, ...day.paid].forEach((entry) => events.push(predictionEvent(day, entry)));
+  return events;
+};
+
 export default function CalendarPage() {
   const [events, setEvents] = useState<CalendarEvent[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [selectedEvent, setSelectedEvent] = useState<CalendarEvent | null>(null);
 
-  useEffect(() => {
-    fetchData();
-  }, []);
-
-  const fetchData = async () => {
+  // Fetch only the month being viewed; the server buckets it per day
+  const fetchMonth = useCallback(async (month: string) => {
     setLoading(true);
     setError(null);
 
     try {
-      const [transactionsResult, futureResult] = await Promise.allSettled([
-        TransactionsAPI.getAll(),
-        FutureAPI.getAll(),
-      ]);
-
-      const calendarEvents: CalendarEvent[] = [];
-
-      if (transactionsResult.status === 'fulfilled') {
-        const transactions = transactionsResult.value as Transaction[];
-        transactions.forEach((transaction) => {
-          const date = new Date(transaction.Date);
-          calendarEvents.push({
-            id: `transaction-${date.getTime()}`,
-            title: `${transaction.Department}: ₹${transaction.Amount}`,
-            start: date.toISOString(),
-            end: date.toISOString(),
-            amount: transaction.Amount,
-            type: 'transaction',
-            backgroundColor: transaction.Amount >= 0 ? '#dcfce7' : '#fee2e2',
-            borderColor: transaction.Amount >= 0 ? '#22c55e' : '#ef4444',
-            textColor: transaction.Amount >= 0 ? '#166534' : '#991b1b',
-            extendedProps: {
-              department: transaction.Department,
-              amount: transaction.Amount,
-              type: 'transaction'
-            }
-          });
-        });
-      } else {
-        console.error('Error fetching transactions:', transactionsResult.reason);
-      }
-
-      if (futureResult.status === 'fulfilled') {
-        const predictions = futureResult.value as FuturePrediction[];
-        predictions.forEach((prediction) => {
-          const date = new Date(prediction.Date);
-          calendarEvents.push({
-            id: `prediction-${date.getTime()}`,
-            title: `Predicted: ₹${prediction.Amount}`,
-            start: date.toISOString(),
-            end: date.toISOString(),
-            amount: prediction.Amount,
-            type: 'prediction',
-            backgroundColor: '#fef9c3',
-            borderColor: '#eab308',
-            textColor: '#854d0e',
-            extendedProps: {
-              description: prediction.Description,
-              amount: prediction.Amount,
-              type: 'prediction'
-            }
-          });
-        });
-      } else {
-        console.error('Error fetching future predictions:', futureResult.reason);
-      }
-
-      setEvents(calendarEvents);
+      const calendar = await CalendarAPI.getMonth(month);
+      setEvents(calendar.days.flatMap(dayEvents));
     } catch (err) {
-      console.error('Error fetching data:', err);
+      console.error('Error fetching calendar:', err);
       setError(err instanceof Error ? err.message : "An error occurred while fetching data");
     } finally {
       setLoading(false);
     }
+  }, []);
+
+  const handleDatesSet = (arg: DatesSetArg) => {
+    fetchMonth(monthOf(arg.view.currentStart));
   };
 
   const handleEventClick = (clickInfo: EventClickArg) => {
@@ -145,59 +139,62 @@ export default function CalendarPage() {
         <p className="text-gray-600 mt-2">View transactions and future predictions in calendar format</p>
       </div>
 
-      {loading ? (
-        <div className="flex justify-center items-center h-64">
-          <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
+      <div className="space-y-4">
+        <div className="relative bg-white p-6 rounded-lg shadow">
+          {loading && (
+            <div className="absolute inset-0 flex justify-center items-center bg-white bg-opacity-60 z-10">
+              <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
+            </div>
+          )}
+          <FullCalendar
+            plugins={[dayGridPlugin, timeGridPlugin, interactionPlugin]}
+            initialView="dayGridMonth"
+            headerToolbar={{
+              left: 'prev,next today',
+              center: 'title',
+              right: 'dayGridMonth,timeGridWeek,timeGridDay'
+            }}
+            events={events}
+            eventClick={handleEventClick}
+            datesSet={handleDatesSet}
+            height="600px"
+            nowIndicator={true}
+            editable={true}
+            droppable={true}
+            selectable={true}
+            selectMirror={true}
+            dayMaxEvents={true}
+          />
         </div>
-      ) : (
-        <div className="space-y-4">
-          <div className="bg-white p-6 rounded-lg shadow">
-            <FullCalendar
-              plugins={[dayGridPlugin, timeGridPlugin, interactionPlugin]}
-              initialView="dayGridMonth"
-              headerToolbar={{
-                left: 'prev,next today',
-                center: 'title',
-                right: 'dayGridMonth,timeGridWeek,timeGridDay'
-              }}
-              events={events}
-              eventClick={handleEventClick}
-              height="600px"
-              nowIndicator={true}
-              editable={true}
-              droppable={true}
-              selectable={true}
-              selectMirror={true}
-              dayMaxEvents={true}
-            />
-          </div>
 
-          {selectedEvent && (
-            <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
-              <div className="bg-white p-6 rounded-lg shadow-lg max-w-md w-full mx-4">
-                <h3 className="text-lg font-semibold mb-4">Event Details</h3>
-                <div className="space-y-2">
-                  <p><strong>Type:</strong> {selectedEvent.type}</p>
-                  <p><strong>Amount:</strong> ₹{selectedEvent.amount}</p>
-                  <p><strong>Date:</strong> {new Date(selectedEvent.start).toLocaleDateString()}</p>
-                  {selectedEvent.extendedProps.department && (
-                    <p><strong>Department:</strong> {selectedEvent.extendedProps.department}</p>
-                  )}
-                  {selectedEvent.extendedProps.description && (
-                    <p><strong>Description:</strong> {selectedEvent.extendedProps.description}</p>
-                  )}
-                </div>
-                <button
-                  onClick={() => setSelectedEvent(null)}
-                  className="mt-4 w-full bg-blue-600 text-white py-2 px-4 rounded-md hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2"
-                >
-                  Close
-                </button>
+        {selectedEvent && (
+          <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
+            <div className="bg-white p-6 rounded-lg shadow-lg max-w-md w-full mx-4">
+              <h3 className="text-lg font-semibold mb-4">Event Details</h3>
+              <div className="space-y-2">
+                <p><strong>Type:</strong> {selectedEvent.type}</p>
+                <p><strong>Amount:</strong> ₹{selectedEvent.amount}</p>
+                <p><strong>Date:</strong> {new Date(selectedEvent.start).toLocaleDateString()}</p>
+                {selectedEvent.extendedProps.count !== undefined && (
+                  <p><strong>Transactions:</strong> {selectedEvent.extendedProps.count}</p>
+                )}
+                {selectedEvent.extendedProps.paid !== undefined && (
+                  <p><strong>Status:</strong> {selectedEvent.extendedProps.paid ? 'Paid' : 'Due'}</p>
+                )}
+                {selectedEvent.extendedProps.description && (
+                  <p><strong>Description:</strong> {selectedEvent.extendedProps.description}</p>
+                )}
               </div>
+              <button
+                onClick={() => setSelectedEvent(null)}
+                className="mt-4 w-full bg-blue-600 text-white py-2 px-4 rounded-md hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2"
+              >
+                Close
+              </button>
             </div>
-          )}
-        </div>
-      )}
+          </div>
+        )}
+      </div>
     </div>
   );
 }
@@ -1,54 +1,34 @@
 "use client";
 
 import { useState, useEffect } from "react";
-import { TransactionsAPI, AccountsAPI, FutureAPI } from "@/utils/api";
-import { Transaction, Account, FuturePrediction } from "@/types/models";
+import { SummaryAPI } from "@/utils/api";
+import { DashboardSummary, SummaryRole } from "@/types/models";
 
 type Role = "CA" | "Budget Analyst" | "Owner";
 
+const ROLE_PATHS: Record<Role, SummaryRole> = {
+  "CA": "ca",
+  "Budget Analyst": "budget-analyst",
+  "Owner": "owner",
+};
+
 export default function ViewPage() {
   const [selectedRole, setSelectedRole] = useState<Role>("Owner");
-  const [transactions, setTransactions] = useState<Transaction[]>([]);
-  const [accounts, setAccounts] = useState<Account[]>([]);
-  const [futurePredictions, setFuturePredictions] = useState<FuturePrediction[]>([]);
+  const [summary, setSummary] = useState<DashboardSummary | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    fetchData();
-  }, []);
+    fetchData(selectedRole);
+  }, [selectedRole]);
 
-  const fetchData = async () => {
+  // Totals are aggregated server-side; only the role's figures are downloaded
+  const fetchData = async (role: Role) => {
     setLoading(true);
     setError(null);
 
     try {
-      const results = await Promise.allSettled([
-        TransactionsAPI.getAll(),
-        AccountsAPI.getAll(),
-        FutureAPI.getAll(),
-      ]);
-
-      results.forEach((result, index) => {
-        if (result.status === 'fulfilled') {
-          switch(index) {
-            case 0:
-              setTransactions(result.value as Transaction[]);
-              break;
-            case 1:
-              console.log('Accounts data:', result.value);
-              setAccounts(result.value as Account[]);
-              break;
-            case 2:
-              setFuturePredictions(result.value as FuturePrediction[]);
-              break;
-          }
-        } else {
-          console.error(`Error fetching data for index ${index}:`, result.reason);
-          setError(result.reason?.message || "Failed to fetch some data");
-        }
-      });
-
+      setSummary(await SummaryAPI.getByRole(ROLE_PATHS[role]));
     } catch (err) {
       console.error('Error fetching data:', err);
       setError(err instanceof Error ? err.message : "An error occurred while fetching data");
@@ -57,51 +37,17 @@ export default function ViewPage() {
     }
   };
 
-  const parseBalance = (balance: number | string): number => {
-    if (typeof balance === 'number') return balance;
-    const cleanValue = balance.replace(/,/g, '');
-    const parsedValue = parseFloat(cleanValue);
-    return isNaN(parsedValue) ? 0 : parsedValue;
-  };
-
   const formatCurrency = (amount: number): string => {
     return `₹${amount.toFixed(2)}`;
   };
 
-  const calculateTotalBalance = (): number => {
-    if (!accounts || accounts.length === 0) return 0;
-    const total = accounts.reduce((total, account) => {
-      const balance = parseBalance(account.Balance);
-      console.log(`Account ${account.AccountName}: ${balance}`);
-      return total + balance;
-    }, 0);
-    console.log('Total balance:', total);
-    return total;
-  };
+  const calculateTotalBalance = (): number => summary?.total_balance ?? 0;
 
-  const calculateMonthlyExpenses = (): number => {
-    if (!transactions || transactions.length === 0) return 0;
-    const currentMonth = new Date().getMonth();
-    const currentYear = new Date().getFullYear();
-    return transactions
-      .filter((t) => {
-        const transactionDate = new Date(t.Date);
-        return (
-          transactionDate.getMonth() === currentMonth &&
-          transactionDate.getFullYear() === currentYear &&
-          t.Amount < 0
-        );
-      })
-      .reduce((total, t) => total + Math.abs(parseBalance(t.Amount)), 0);
-  };
+  const calculateMonthlyExpenses = (): number => summary?.monthly_expenses ?? 0;
 
-  const calculateUpcomingPayments = (): number => {
-    if (!futurePredictions || futurePredictions.length === 0) return 0;
-    const today = new Date();
-    return futurePredictions
-      .filter((f) => !f.Paid && new Date(f.Date) >= today)
-      .reduce((total, f) => total + Math.abs(parseBalance(f.Amount)), 0);
-  };
+  const calculateUpcomingPayments = (): number => summary?.outstanding?.total ?? 0;
+
+  const accountCount = (): number => summary?.account_count ?? 0;
 
   const renderCAView = () => (
     <div className="space-y-6">
@@ -118,7 +64,7 @@ export default function ViewPage() {
           </div>
           <div className="bg-gray-50 p-4 rounded-md">
             <h3 className="text-sm font-medium text-gray-500">Account Types</h3>
-            <p className="text-2xl font-bold text-blue-600">{accounts.length}</p>
+            <p className="text-2xl font-bold text-blue-600">{accountCount()}</p>
           </div>
         </div>
       </div>
@@ -126,12 +72,7 @@ export default function ViewPage() {
       <div className="bg-white p-6 rounded-lg shadow">
         <h2 className="text-xl font-semibold mb-4">Account Categories</h2>
         <div className="space-y-4">
-          {Object.entries(
-            accounts.reduce((acc, account) => {
-              acc[account.Type] = (acc[account.Type] || 0) + 1;
-              return acc;
-            }, {} as Record<string, number>)
-          ).map(([type, count]) => (
+          {(summary?.accounts_by_type ?? []).map(({ Type: type, count }) => (
             <div key={type} className="flex justify-between items-center">
               <span className="text-gray-600">{type}</span>
               <span className="text-gray-900 font-medium">{count}</span>
@@ -157,7 +98,7 @@ export default function ViewPage() {
           </div>
           <div className="bg-gray-50 p-4 rounded-md">
             <h3 className="text-sm font-medium text-gray-500">Active Accounts</h3>
-            <p className="text-2xl font-bold text-blue-600">{accounts.length}</p>
+            <p className="text-2xl font-bold text-blue-600">{accountCount()}</p>
           </div>
         </div>
       </div>
@@ -165,14 +106,7 @@ export default function ViewPage() {
       <div className="bg-white p-6 rounded-lg shadow">
         <h2 className="text-xl font-semibold mb-4">Department Expenses</h2>
         <div className="space-y-4">
-          {Object.entries(
-            transactions.reduce((acc, transaction) => {
-              if (parseBalance(transaction.Amount) < 0) {
-                acc[transaction.Department] = (acc[transaction.Department] || 0) + Math.abs(parseBalance(transaction.Amount));
-              }
-              return acc;
-            }, {} as Record<string, number>)
-          ).map(([department, amount]) => (
+          {(summary?.expenses_by_department ?? []).map(({ name: department, amount }) => (
             <div key={department} className="flex justify-between items-center">
               <span className="text-gray-600">{department}</span>
               <span className="text-gray-900 font-medium">{formatCurrency(amount)}</span>
@@ -207,13 +141,7 @@ export default function ViewPage() {
         <div className="bg-white p-6 rounded-lg shadow">
           <h2 className="text-xl font-semibold mb-4">Department Summary</h2>
           <div className="space-y-4">
-            {Object.entries(
-              transactions.reduce((acc, transaction) => {
-                const amount = parseBalance(transaction.Amount);
-                acc[transaction.Department] = (acc[transaction.Department] || 0) + amount;
-                return acc;
-              }, {} as Record<string, number>)
-            ).map(([department, balance]) => (
+            {(summary?.net_by_department ?? []).map(({ name: department, amount: balance }) => (
               <div key={department} className="flex justify-between items-center">
                 <span className="text-gray-600">{department}</span>
                 <span className={`font-medium ${balance >= 0 ? 'text-green-600' : 'text-red-600'}`}>
@@ -227,13 +155,7 @@ export default function ViewPage() {
         <div className="bg-white p-6 rounded-lg shadow">
           <h2 className="text-xl font-semibold mb-4">Account Types Overview</h2>
           <div className="space-y-4">
-            {Object.entries(
-              accounts.reduce((acc, account) => {
-                const balance = parseBalance(account.Balance);
-                acc[account.Type] = (acc[account.Type] || 0) + balance;
-                return acc;
-              }, {} as Record<string, number>)
-            ).map(([type, balance]) => (
+            {(summary?.accounts_by_type ?? []).map(({ Type: type, balance }) => (
               <div key={type} className="flex justify-between items-center">
                 <span className="text-gray-600">{type}</span>
                 <span className={`font-medium ${balance >= 0 ? 'text-green-600' : 'text-red-600'}`}>
@@ -137,3 +137,66 @@ export type FuturePredictionCreate = Omit<FuturePrediction, 'TrNo'>;
 
 // Type for updating an existing future prediction
 export type FuturePredictionUpdate = Partial<FuturePredictionCreate>;
+
+// Dashboard audiences served by /summary/{role}
+export type SummaryRole = "ca" | "budget-analyst" | "owner";
+
+export interface TypeTotal {
+  Type: AccountType;
+  count: number;
+  balance: number;
+}
+
+export interface GroupTotal {
+  name: string;
+  count: number;
+  amount: number;
+}
+
+export interface OutstandingFutures {
+  count: number;
+  total: number;
+  overdue_count: number;
+  overdue_total: number;
+}
+
+// Server-side aggregates for a role dashboard; sections the role does not show are omitted
+export interface DashboardSummary {
+  role: SummaryRole;
+  as_of: string;
+  total_balance?: number;
+  account_count?: number;
+  monthly_expenses?: number;
+  accounts_by_type?: TypeTotal[];
+  expenses_by_department?: GroupTotal[];
+  expenses_by_category?: GroupTotal[];
+  net_by_department?: GroupTotal[];
+  outstanding?: OutstandingFutures;
+}
+
+// A future prediction on a calendar day
+export interface CalendarFutureEntry {
+  TrNo: number;
+  Description: string;
+  Amount: number;
+  AccID: string;
+  Category?: Category;
+  Paid: boolean;
+}
+
+// Past transaction totals and future predictions for one day
+export interface CalendarDay {
+  date: string;
+  transaction_count: number;
+  transaction_total: number;
+  due: CalendarFutureEntry[];
+  paid: CalendarFutureEntry[];
+  due_total: number;
+  paid_total: number;
+}
+
+// Days of a month (YYYY-MM) with activity, served by /calendar
+export interface CalendarMonth {
+  month: string;
+  days: CalendarDay[];
+}
@@ -12,6 +12,9 @@ import {
   AccountUpdate,
   FuturePredictionCreate,
   FuturePredictionUpdate,
+  DashboardSummary,
+  SummaryRole,
+  CalendarMonth,
 } from '../types/models';
 
 // Default to environment variable, fallback to localhost:8000
@@ -250,6 +253,22 @@ export const FutureAPI = {
     APIClient.get<FuturePrediction[]>(`/future/date-range/?start_date=${startDate}&end_date=${endDate}`),
 };
 
+/**
+ * Role dashboard summary endpoints
+ */
+export const SummaryAPI = {
+  getByRole: (role: SummaryRole) => 
+    APIClient.get<DashboardSummary>(`/summary/${role}`),
+};
+
+/**
+ * Month calendar endpoints
+ */
+export const CalendarAPI = {
+  getMonth: (month: string) => 
+    APIClient.get<CalendarMonth>('/calendar/', { month }),
+};
+
 /**
  * Notifications API endpoints
  */